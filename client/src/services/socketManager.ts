@@ -35,6 +35,8 @@ class SocketManager {
         reconnectionAttempts: 5,
         withCredentials: false,
         autoConnect: true,
+        // Ask the server to combine the events of one action into a single "updates" frame
+        query: { batch: '1' },
       })
 
       console.log('[Socket] Socket.IO client created')
@@ -179,6 +181,13 @@ class SocketManager {
         useGameStore.getState().setAvailableRooms(data.rooms)
       })
 
+      // Batched events: [[event, data], ...] in the order the server sent them
+      this.socket.on('updates', (updates: [string, any][]) => {
+        for (const [event, data] of updates) {
+          this.socket?.listeners(event).forEach((listener) => listener(data))
+        }
+      })
+
       // Game events
       this.socket.on('game_state', (data: GameState | { message: string }) => {
         console.log('[Socket] Game state received:', data)
@@ -11,9 +11,17 @@ class Settings(BaseSettings):
     host: str = "0.0.0.0"
     port: int = 8000
     debug: bool = True
+    # Turn messages are tiny; compressing them only adds latency
+    ws_compression: bool = False
+    # Engine.IO heartbeat (seconds); dead peers are dropped after interval + timeout
+    ping_interval: int = 10
+    ping_timeout: int = 5
 
     # Logging
     log_level: str = "INFO"
+    metrics_flush_seconds: float = 1.0  # Interval for aggregated action metrics
+    log_connect_details: bool = False  # Log request details of every connection (LOG_CONNECT_DETAILS)
+    sio_debug: bool = False  # Per-packet Socket.IO/Engine.IO logging (SIO_DEBUG)
 
     # CORS
     cors_origins: str = "*"  # Comma-separated list or "*"
@@ -1,6 +1,7 @@
 """Check if announcements were achieved using trick history."""
 
 from typing import List, Dict
+from models.card import HONOUR_MASK, KING_MASK, hand_mask
 from models.player import Player
 from models.announcement import Announcement, AnnouncementType
 
@@ -15,14 +16,7 @@ def check_trull(player: Player) -> bool:
     Returns:
         True if player has all 3 honours in tricks_won
     """
-    honours = [c for c in player.tricks_won if c.is_honour()]
-
-    # Must have exactly 3 honours, and they must be the specific ones
-    if len(honours) != 3:
-        return False
-
-    honour_ranks = {c.rank.lower() for c in honours}
-    return {'skiz', 'xxi', 'i'} == honour_ranks
+    return hand_mask(player.tricks_won) & HONOUR_MASK == HONOUR_MASK
 
 
 def check_four_kings(player: Player) -> bool:
@@ -35,8 +29,7 @@ def check_four_kings(player: Player) -> bool:
     Returns:
         True if player has all 4 kings in tricks_won
     """
-    kings = [c for c in player.tricks_won if c.is_king()]
-    return len(kings) == 4
+    return hand_mask(player.tricks_won) & KING_MASK == KING_MASK
 
 
 def check_double_game(team_points: int) -> bool:
@@ -10,7 +10,7 @@ from fastapi.middleware.cors import CORSMiddleware
 import socketio
 import time
 
-from networking.server import sio, init_persistence, shutdown_persistence
+from networking.server import sio, init_persistence, shutdown_persistence, report_metrics
 from config import settings
 
 # Configure structured logging
@@ -44,12 +44,15 @@ async def lifespan(app: FastAPI):
     else:
         logger.warning("persistence_system_initialization_failed_continuing_without_persistence")
 
+    metrics_task = asyncio.create_task(report_metrics(settings.metrics_flush_seconds))
+
     logger.info("server_lifecycle_started", timestamp=datetime.now().isoformat())
 
     yield
 
     # Shutdown
     logger.info("server_lifecycle_shutting_down", timestamp=datetime.now().isoformat())
+    metrics_task.cancel()
     await shutdown_persistence()
     logger.info("server_lifecycle_shutdown_complete", timestamp=datetime.now().isoformat())
 
@@ -136,7 +139,8 @@ def main():
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
-        log_level="debug"  # Force debug level for more output
+        log_level="debug",  # Force debug level for more output
+        ws_per_message_deflate=settings.ws_compression
     )
 
 
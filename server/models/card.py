@@ -3,7 +3,7 @@
 from enum import Enum
 from typing import Optional
 from uuid import uuid4
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class Suit(str, Enum):
@@ -58,6 +58,34 @@ class CardType(str, Enum):
     SUIT = "suit"
 
 
+# Bit position of each distinct card: tarokks take bits 0-21, suit cards the rest
+_CARD_BIT_INDEX = {
+    (suit, rank.value): i
+    for i, (suit, rank) in enumerate(
+        [(Suit.TAROKK, r) for r in TarokkRank]
+        + [(s, r) for s in (Suit.HEARTS, Suit.DIAMONDS, Suit.SPADES, Suit.CLUBS) for r in SuitRank]
+    )
+}
+
+# Mask of all tarokk bits; e.g. (mask & TAROKK_MASK).bit_count() counts tarokks
+TAROKK_MASK = (1 << len(TarokkRank)) - 1
+
+# Single-card bits used by the rules
+SKIZ_BIT = 1 << _CARD_BIT_INDEX[(Suit.TAROKK, TarokkRank.SKIZ.value)]
+XXI_BIT = 1 << _CARD_BIT_INDEX[(Suit.TAROKK, TarokkRank.XXI.value)]
+PAGAT_BIT = 1 << _CARD_BIT_INDEX[(Suit.TAROKK, TarokkRank.PAGAT.value)]
+
+# Honours (skíz, XXI, pagát); holding all of them is a trull
+HONOUR_MASK = SKIZ_BIT | XXI_BIT | PAGAT_BIT
+KING_MASK = sum(1 << i for (suit, rank), i in _CARD_BIT_INDEX.items() if rank == SuitRank.KING.value)
+
+# Mask of every card of each suit, tarokk included
+SUIT_MASKS = {
+    suit: sum(1 << i for (card_suit, _), i in _CARD_BIT_INDEX.items() if card_suit == suit)
+    for suit in Suit
+}
+
+
 class Card(BaseModel):
     """
     Represents a single card in Hungarian Tarokk.
@@ -65,22 +93,46 @@ class Card(BaseModel):
     A card can be either:
     - A tarokk (trump) card with a TarokkRank
     - A suit card with a Suit and SuitRank
+
+    Cards are immutable once created, so their serialized form is built once.
     """
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(default_factory=lambda: str(uuid4()))
     suit: Suit
     rank: str  # Either TarokkRank or SuitRank value
     points: int
     card_type: CardType
 
+    # Hot readers index __pydantic_private__ directly: a plain self._x read
+    # falls back to BaseModel.__getattr__ and costs several microseconds
+    _dict: dict = PrivateAttr()
+    _bit: int = PrivateAttr()
+
+    def model_post_init(self, __context) -> None:
+        """Precompute the dictionary form used by to_dict()."""
+        self._dict = {
+            "id": self.id,
+            "suit": self.suit.value,
+            "rank": self.rank,
+            "points": self.points,
+            "card_type": self.card_type.value,
+        }
+        index = _CARD_BIT_INDEX.get((self.suit, self.rank))
+        self._bit = 1 << index if index is not None else 0
+
+    @property
+    def bit(self) -> int:
+        """Single-bit mask identifying this card's suit and rank (0 if not a standard card)."""
+        return self.__pydantic_private__['_bit']
+
     def is_tarokk(self) -> bool:
         """Check if this is a tarokk (trump) card."""
         return self.suit == Suit.TAROKK
 
     def is_honour(self) -> bool:
         """Check if this is an honour (skíz, XXI, or pagát)."""
-        if not self.is_tarokk():
-            return False
-        return self.rank in [TarokkRank.SKIZ.value, TarokkRank.XXI.value, TarokkRank.PAGAT.value]
+        return bool(self.__pydantic_private__['_bit'] & HONOUR_MASK)
 
     def is_king(self) -> bool:
         """Check if this is a King."""
@@ -143,6 +195,18 @@ class Card(BaseModel):
         }
         return suit_order.get(self.rank, 0)
 
+    def __eq__(self, other) -> bool:
+        """Cards are equal when they are the same physical card (same ID)."""
+        if self is other:
+            return True
+        if isinstance(other, Card):
+            return self.id == other.id
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash by ID, consistent with __eq__."""
+        return hash(self.id)
+
     def __str__(self) -> str:
         """String representation of the card."""
         if self.is_tarokk():
@@ -154,16 +218,22 @@ class Card(BaseModel):
         return f"Card({self.suit.value}, {self.rank}, {self.points}pts)"
 
     def to_dict(self) -> dict:
-        """Convert card to dictionary for JSON serialization."""
-        return {
-            "id": self.id,
-            "suit": self.suit.value,
-            "rank": self.rank,
-            "points": self.points,
-            "card_type": self.card_type.value,
-        }
+        """
+        Convert card to dictionary for JSON serialization.
+
+        The returned dictionary is cached and shared; treat it as read-only.
+        """
+        return self.__pydantic_private__['_dict']
 
     @classmethod
     def from_dict(cls, data: dict) -> "Card":
         """Create card from dictionary."""
         return cls(**data)
+
+
+def hand_mask(cards) -> int:
+    """Combine the bits of the given cards into one bitmask."""
+    mask = 0
+    for card in cards:
+        mask |= card.bit
+    return mask
@@ -2,7 +2,7 @@
 
 from enum import Enum
 from typing import List, Optional, Tuple, Dict
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from uuid import uuid4
 
 from models.card import Card, TarokkRank
@@ -10,6 +10,7 @@ from models.deck import Deck
 from models.player import Player
 from models.bid import Bid, BidType
 from models.announcement import Announcement
+from validation.rules import get_legal_cards
 
 
 class GamePhase(str, Enum):
@@ -66,6 +67,13 @@ class GameState(BaseModel):
     announcements: List[Announcement] = Field(default_factory=list)
     announcement_history: List[Optional[Announcement]] = Field(default_factory=list)  # Track all actions (announcement or None for pass)
 
+    # Legal cards per position, valid until the next card is played or the
+    # trick is cleared. Read through __pydantic_private__ (see Card).
+    _legal_cards_cache: Dict[int, Tuple[Card, ...]] = PrivateAttr(default_factory=dict)
+    # Players by ID, rebuilt whenever the players list is replaced or resized
+    _players_by_id: Dict[str, Player] = PrivateAttr(default_factory=dict)
+    _players_by_id_source: Optional[Tuple[List[Player], int]] = PrivateAttr(default=None)
+
     def add_player(self, player: Player) -> None:
         """Add a player to the game."""
         if len(self.players) >= 4:
@@ -81,7 +89,12 @@ class GameState(BaseModel):
 
     def get_player_by_id(self, player_id: str) -> Optional[Player]:
         """Get player by ID."""
-        return next((p for p in self.players if p.id == player_id), None)
+        players = self.players
+        source = self._players_by_id_source
+        if source is None or source[0] is not players or source[1] != len(players):
+            self._players_by_id = {p.id: p for p in players}
+            self._players_by_id_source = (players, len(players))
+        return self._players_by_id.get(player_id)
 
     def all_players_ready(self) -> bool:
         """Check if all 4 players are ready."""
@@ -89,11 +102,11 @@ class GameState(BaseModel):
 
     def dealer_right_position(self) -> int:
         """Get position to the dealer's right (counter-clockwise)."""
-        return (self.dealer_position + 1) % 4
+        return (self.dealer_position + 1) & 3
 
     def next_position(self, current: int) -> int:
         """Get next position counter-clockwise."""
-        return (current + 1) % 4
+        return (current + 1) & 3
 
     def start_dealing(self) -> None:
         """Initialize dealing phase."""
@@ -352,6 +365,50 @@ class GameState(BaseModel):
         self.trick_leader = self.dealer_right_position()
         self.current_turn = self.trick_leader
         self.current_trick.clear()
+        self._legal_cards_cache.clear()
+
+    def legal_cards(self, player_position: int) -> Tuple[Card, ...]:
+        """
+        Get the cards a player may legally play to the current trick.
+
+        The result is an immutable tuple cached until the next card is
+        played, so the your_turn prompt and the validation of the following
+        play share one computation and callers never need to copy it.
+
+        Args:
+            player_position: Position of the player
+
+        Returns:
+            Tuple of legal cards from the player's hand
+        """
+        cache = self.__pydantic_private__['_legal_cards_cache']
+        legal = cache.get(player_position)
+        if legal is None:
+            player = self.players[player_position]
+            if not self.current_trick:
+                # Leading: the whole hand, no rules to apply
+                legal = tuple(player.hand)
+            else:
+                lead_suit = self.current_trick[0][1].suit
+                legal = tuple(get_legal_cards(player.hand, lead_suit, False, player.hand_mask))
+            cache[player_position] = legal
+        return legal
+
+    def is_legal_card(self, player_position: int, card: Card) -> bool:
+        """
+        Check whether a card taken from the player's hand may be played now.
+
+        legal_cards holds the hand's own Card objects, so an identity scan
+        suffices and skips Card.__eq__.
+
+        Args:
+            player_position: Position of the player
+            card: Card object from the player's hand
+
+        Returns:
+            True if the card is legal to play
+        """
+        return any(legal is card for legal in self.legal_cards(player_position))
 
     def play_card_to_trick(self, player_position: int, card_id: str) -> Card:
         """
@@ -372,6 +429,7 @@ class GameState(BaseModel):
             raise ValueError("Player not found")
 
         card = player.play_card(card_id)
+        self._legal_cards_cache.clear()
 
         # Check if this is the called card being played
         if card.is_tarokk() and card.rank == self.called_card_rank and not self.partner_revealed:
@@ -428,6 +486,7 @@ class GameState(BaseModel):
         # Setup for next trick
         self.previous_trick_winner = winner_pos
         self.current_trick.clear()
+        self._legal_cards_cache.clear()
         self.trick_number += 1
 
         if self.trick_number <= 9:
@@ -534,8 +593,8 @@ class GameState(BaseModel):
             "current_trick": [{"player_position": pos, "card": card.to_dict()} for pos, card in self.current_trick],
             "talon": [card.to_dict() for card in self.talon],
             "announcements": [a.to_dict() for a in self.announcements],
-            "trick_history": self.trick_history,  # Full history of completed tricks
-            "players_who_discarded": self.players_who_discarded,
+            "trick_history": list(self.trick_history),  # Full history of completed tricks
+            "players_who_discarded": list(self.players_who_discarded),
             "announcement_history": [a.to_dict() if a else None for a in self.announcement_history],
         }
 
@@ -546,3 +605,57 @@ class GameState(BaseModel):
             result["winning_bid"] = None
 
         return result
+
+    def to_public_dict(self) -> dict:
+        """
+        Convert the player-independent part of the game state to a dictionary.
+
+        All hands are hidden. Combine with to_private_overlay() to get the
+        same view as to_dict(player_id=...) without rebuilding the shared
+        parts for every player.
+
+        Returns:
+            Dictionary representation with every player's hand hidden
+        """
+        return {
+            "game_id": self.game_id,
+            "phase": self.phase.value,
+            "players": [p.to_dict(hide_hand=True) for p in self.players],
+            "dealer_position": self.dealer_position,
+            "current_turn": self.current_turn,
+            "bid_history": [b.to_dict() for b in self.bid_history],
+            "declarer_position": self.declarer_position,
+            "partner_position": self.partner_position if self.partner_revealed else None,
+            "partner_revealed": self.partner_revealed,
+            "called_card_rank": self.called_card_rank,
+            "trick_number": self.trick_number,
+            "trick_leader": self.trick_leader,
+            "previous_trick_winner": self.previous_trick_winner,
+            "current_trick": [{"player_position": pos, "card": card.to_dict()} for pos, card in self.current_trick],
+            "talon": [card.to_dict() for card in self.talon],
+            "announcements": [a.to_dict() for a in self.announcements],
+            # Copied so a kept payload doesn't change along with the game
+            "trick_history": list(self.trick_history),
+            "players_who_discarded": list(self.players_who_discarded),
+            "announcement_history": [a.to_dict() if a else None for a in self.announcement_history],
+            "winning_bid": self.winning_bid.to_dict() if self.winning_bid else None,
+        }
+
+    def to_private_overlay(self, player_id: str, public: dict) -> dict:
+        """
+        Build the per-player part of the game state.
+
+        Args:
+            player_id: Player whose own hand is revealed
+            public: Result of to_public_dict() for the same state
+
+        Returns:
+            Keys to merge over the public dictionary
+        """
+        players = public["players"]
+        for i, p in enumerate(self.players):
+            if p.id == player_id:
+                players = list(players)
+                players[i] = p.to_dict()
+                break
+        return {"players": players}
@@ -1,10 +1,10 @@
 """Player model for Hungarian Tarokk."""
 
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field, PrivateAttr
 from uuid import uuid4
 
-from models.card import Card
+from models.card import Card, HONOUR_MASK, SUIT_MASKS, TAROKK_MASK, hand_mask
 
 
 class Player(BaseModel):
@@ -35,9 +35,30 @@ class Player(BaseModel):
     is_partner: bool = False
     partner_revealed: bool = False  # Whether partner identity has been revealed
 
+    # Index and bitmask of hand, kept in sync by the hand-changing methods below
+    _hand_by_id: Dict[str, Card] = PrivateAttr(default_factory=dict)
+    _hand_mask: int = PrivateAttr(default=0)
+
+    def model_post_init(self, __context) -> None:
+        """Build the hand index for a player created with cards in hand."""
+        self._hand_by_id = {c.id: c for c in self.hand}
+        self._hand_mask = hand_mask(self.hand)
+
+    @property
+    def hand_mask(self) -> int:
+        """Bitmask of the cards in hand (see Card.bit)."""
+        return self._hand_mask
+
     def add_cards_to_hand(self, cards: List[Card]) -> None:
         """Add cards to player's hand."""
         self.hand.extend(cards)
+        for card in cards:
+            self._hand_by_id[card.id] = card
+        self._hand_mask |= hand_mask(cards)
+
+    def get_card(self, card_id: str) -> Optional[Card]:
+        """Get a card from hand by its ID, or None if not held."""
+        return self._hand_by_id.get(card_id)
 
     def remove_cards_from_hand(self, card_ids: List[str]) -> List[Card]:
         """
@@ -54,10 +75,11 @@ class Player(BaseModel):
         """
         removed_cards = []
         for card_id in card_ids:
-            card = next((c for c in self.hand if c.id == card_id), None)
+            card = self._hand_by_id.pop(card_id, None)
             if card is None:
                 raise ValueError(f"Card {card_id} not found in hand")
             self.hand.remove(card)
+            self._hand_mask &= ~card.bit
             removed_cards.append(card)
         return removed_cards
 
@@ -74,10 +96,11 @@ class Player(BaseModel):
         Raises:
             ValueError: If card not found in hand
         """
-        card = next((c for c in self.hand if c.id == card_id), None)
+        card = self._hand_by_id.pop(card_id, None)
         if card is None:
             raise ValueError(f"Card {card_id} not found in hand")
         self.hand.remove(card)
+        self._hand_mask &= ~card.bit
         return card
 
     def add_to_tricks(self, cards: List[Card]) -> None:
@@ -99,7 +122,7 @@ class Player(BaseModel):
         """
         cards_to_discard = []
         for card_id in card_ids:
-            card = next((c for c in self.hand if c.id == card_id), None)
+            card = self._hand_by_id.get(card_id)
             if card is None:
                 raise ValueError(f"Card {card_id} not found in hand")
             if not card.can_be_discarded():
@@ -108,7 +131,9 @@ class Player(BaseModel):
 
         # Remove from hand and add to discard pile
         for card in cards_to_discard:
+            self._hand_by_id.pop(card.id, None)
             self.hand.remove(card)
+            self._hand_mask &= ~card.bit
             self.discard_pile.append(card)
 
         return cards_to_discard
@@ -119,15 +144,15 @@ class Player(BaseModel):
 
     def has_card(self, card_id: str) -> bool:
         """Check if player has a specific card in hand."""
-        return any(c.id == card_id for c in self.hand)
+        return card_id in self._hand_by_id
 
     def has_suit(self, suit) -> bool:
         """Check if player has any cards of a specific suit."""
-        return any(c.suit == suit for c in self.hand)
+        return bool(self._hand_mask & SUIT_MASKS[suit])
 
     def has_tarokk(self) -> bool:
         """Check if player has any tarokk cards."""
-        return any(c.is_tarokk() for c in self.hand)
+        return bool(self._hand_mask & TAROKK_MASK)
 
     def has_honour(self) -> bool:
         """
@@ -135,11 +160,11 @@ class Player(BaseModel):
         Honours are: skíz, XXI, or pagát.
         Required to place a bid.
         """
-        return any(c.is_honour() for c in self.hand)
+        return bool(self._hand_mask & HONOUR_MASK)
 
     def count_tarokks(self) -> int:
         """Count the number of tarokk cards in hand."""
-        return sum(1 for c in self.hand if c.is_tarokk())
+        return (self._hand_mask & TAROKK_MASK).bit_count()
 
     def get_total_points(self) -> int:
         """
@@ -153,6 +178,8 @@ class Player(BaseModel):
     def reset_for_new_hand(self) -> None:
         """Reset player state for a new hand."""
         self.hand.clear()
+        self._hand_by_id.clear()
+        self._hand_mask = 0
         self.tricks_won.clear()
         self.discard_pile.clear()
         self.is_declarer = False
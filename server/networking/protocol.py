@@ -230,3 +230,45 @@ def create_error_message(code: str, message: str, **details) -> Message:
         message=message,
         details=details or None
     )
+
+
+# Event name (wire value) of every message type
+EVENT_NAMES: Dict[MessageType, str] = {m: m.value for m in MessageType}
+
+_ERROR_TYPE = EVENT_NAMES[MessageType.ERROR]
+
+
+def message_payload(msg_type: MessageType, data: Dict[str, Any]) -> dict:
+    """
+    Build the wire form of a message without creating a Message.
+
+    Produces the same dictionary as Message.create(msg_type, **data).to_dict().
+
+    Args:
+        msg_type: Message type
+        data: Message data
+
+    Returns:
+        Message dictionary
+    """
+    return {"type": EVENT_NAMES[msg_type], "data": data}
+
+
+def error_payload(code: str, message: str) -> dict:
+    """
+    Build the wire form of an error message without creating a Message.
+
+    Produces the same dictionary as create_error_message(code, message).to_dict()
+    for the common case of an error without details.
+
+    Args:
+        code: Error code
+        message: Error message
+
+    Returns:
+        Error message dictionary
+    """
+    return {
+        "type": _ERROR_TYPE,
+        "data": {"code": code, "message": message, "details": None},
+    }
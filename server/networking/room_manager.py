@@ -1,6 +1,6 @@
 """Room management for multiplayer games."""
 
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 from uuid import uuid4
 import structlog
 
@@ -10,6 +10,30 @@ from models.player import Player
 logger = structlog.get_logger()
 
 
+class RoomMetrics:
+    """
+    Per-room action counters.
+
+    Counters are incremented on the hot event path and drained periodically
+    by a background reporter, so per-action logging is not needed.
+    """
+
+    __slots__ = ("counts",)
+
+    def __init__(self):
+        self.counts: Dict[str, int] = {}
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        """Increment a named counter."""
+        self.counts[name] = self.counts.get(name, 0) + amount
+
+    def flush(self) -> Dict[str, int]:
+        """Return the accumulated counters and reset them."""
+        counts = self.counts
+        self.counts = {}
+        return counts
+
+
 class Room:
     """
     Represents a game room for 4 players.
@@ -20,11 +44,15 @@ class Room:
     - Game state
     """
 
+    __slots__ = ("room_id", "game_state", "player_sessions", "chat_messages", "metrics", "last_game_state")
+
     def __init__(self, room_id: Optional[str] = None):
         self.room_id = room_id or str(uuid4())
         self.game_state = GameState()
         self.player_sessions: Dict[str, str] = {}  # player_id -> session_id (socket ID)
         self.chat_messages: List[dict] = []  # Chat history (max 100 messages)
+        self.metrics = RoomMetrics()
+        self.last_game_state: Dict[str, dict] = {}  # session_id -> last game_state payload sent
 
     def add_player(self, player_name: str, session_id: str) -> Player:
         """
@@ -226,6 +254,18 @@ class RoomManager:
     def __init__(self):
         self.rooms: Dict[str, Room] = {}
         self.session_to_room: Dict[str, str] = {}  # session_id -> room_id
+        self._session_index: Dict[str, Tuple[Room, Player]] = {}  # session_id -> (room, player)
+
+    def _bind_session(self, session_id: str, room: Room, player: Player) -> None:
+        """Map a session to its room and player."""
+        self.session_to_room[session_id] = room.room_id
+        self._session_index[session_id] = (room, player)
+
+    def _unbind_old_session(self, room: Room, player: Player, session_id: str) -> None:
+        """Drop the index entry of the session a reconnecting player is replacing."""
+        old_session = room.player_sessions.get(player.id)
+        if old_session and old_session != session_id:
+            self._session_index.pop(old_session, None)
 
     def create_room(self, session_id: str, player_name: str) -> Room:
         """
@@ -241,7 +281,7 @@ class RoomManager:
         room = Room()
         player = room.add_player(player_name, session_id)
         self.rooms[room.room_id] = room
-        self.session_to_room[session_id] = room.room_id
+        self._bind_session(session_id, room, player)
 
         return room
 
@@ -275,8 +315,9 @@ class RoomManager:
                            player_id=player_id,
                            player_name=existing_player.name)
                 # This is a reconnection by ID - update session ID
+                self._unbind_old_session(room, existing_player, session_id)
                 player = room.reconnect_player_by_id(player_id, session_id)
-                self.session_to_room[session_id] = room_id
+                self._bind_session(session_id, room, player)
                 return room
             else:
                 logger.debug("no_player_found_with_id", player_id=player_id)
@@ -287,8 +328,9 @@ class RoomManager:
         if existing_player:
             logger.debug("found_player_by_name_reconnecting", player_name=player_name)
             # This is a reconnection by name - update session ID
+            self._unbind_old_session(room, existing_player, session_id)
             player = room.reconnect_player(player_name, session_id)
-            self.session_to_room[session_id] = room_id
+            self._bind_session(session_id, room, player)
             return room
 
         # New player joining
@@ -296,7 +338,7 @@ class RoomManager:
             raise ValueError("Room is full")
 
         player = room.add_player(player_name, session_id)
-        self.session_to_room[session_id] = room_id
+        self._bind_session(session_id, room, player)
 
         return room
 
@@ -304,6 +346,18 @@ class RoomManager:
         """Get room by ID."""
         return self.rooms.get(room_id)
 
+    def resolve(self, session_id: str) -> Optional[Tuple[Room, Player]]:
+        """
+        Get the room and player for a session with a single lookup.
+
+        Args:
+            session_id: WebSocket session ID
+
+        Returns:
+            (room, player) tuple, or None if the session has no player
+        """
+        return self._session_index.get(session_id)
+
     def get_room_by_session(self, session_id: str) -> Optional[Room]:
         """Get room for a session."""
         room_id = self.session_to_room.get(session_id)
@@ -345,6 +399,7 @@ class RoomManager:
         # Clean up session mapping
         if session_id in self.session_to_room:
             del self.session_to_room[session_id]
+        self._session_index.pop(session_id, None)
 
         # Remove empty rooms
         if len(room.game_state.players) == 0:
@@ -1,30 +1,72 @@
 """WebSocket server for Hungarian Tarokk."""
 
 import asyncio
+import functools
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs
+
 import socketio
-from typing import Dict, Any, Optional
 import structlog
 
+try:
+    import msgpack
+except ImportError:  # Optional: game_state is sent as JSON to everyone
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:  # Optional: Socket.IO falls back to the stdlib json module
+    orjson = None
+
+from config import settings
+from game_logic.bidding import BiddingManager
+from game_logic.final_scoring import calculate_final_score
+from models.announcement import Announcement, AnnouncementType
+from models.bid import BidType
+from models.card import TAROKK_MASK
+from models.game_state import GamePhase
 from networking.protocol import (
-    MessageType, Message, create_error_message,
-    JoinRoomMessage, PlaceBidMessage, DiscardCardsMessage,
-    CallPartnerMessage, MakeAnnouncementMessage, PlayCardMessage
+    EVENT_NAMES,
+    CallPartnerMessage,
+    DiscardCardsMessage,
+    JoinRoomMessage,
+    MakeAnnouncementMessage,
+    MessageType,
+    PlaceBidMessage,
+    PlayCardMessage,
+    error_payload,
+    message_payload,
 )
 from networking.room_manager import RoomManager
-from models.bid import BidType
-from models.game_state import GamePhase
-from models.announcement import Announcement, AnnouncementType
-from game_logic.bidding import BiddingManager
-from validation.rules import get_legal_cards, validate_discard, can_announce
+from validation.rules import can_announce, get_valid_announcements, validate_discard
 
 logger = structlog.get_logger()
 
+
+class OrjsonCodec:
+    """Drop-in replacement for the json module used by Socket.IO packets."""
+
+    @staticmethod
+    def dumps(obj, **kwargs) -> str:
+        # Socket.IO asks for compact separators, which is orjson's only output.
+        # Non-str keys (e.g. positions in player_scores) become strings like stdlib json.
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    @staticmethod
+    def loads(data, **kwargs):
+        return orjson.loads(data)
+
+
 # Create Socket.IO server
 sio = socketio.AsyncServer(
     async_mode='asgi',
     cors_allowed_origins='*',  # Configure appropriately for production
-    logger=True,
-    engineio_logger=True
+    logger=settings.sio_debug,
+    engineio_logger=settings.sio_debug,
+    json=OrjsonCodec if orjson is not None else None,
+    http_compression=False,  # Small frames; don't trade latency for bytes on polling
+    ping_interval=settings.ping_interval,
+    ping_timeout=settings.ping_timeout
 )
 
 # Room manager instance
@@ -33,30 +75,113 @@ room_manager = RoomManager()
 # Persistence manager instance (will be initialized in init_persistence)
 persistence_manager: Optional[Any] = None
 
+# Sessions that asked for msgpack-encoded game_state payloads
+binary_sessions: set = set()
+
+# Sessions that accept several events combined into one "updates" event
+batch_sessions: set = set()
+
+# A prepared outgoing message: (event name, payload, room or session id)
+Emit = Tuple[str, Any, str]
+
+# Error text for actions received outside their phase
+_PHASE_ERRORS = {
+    GamePhase.BIDDING: "Not in bidding phase",
+    GamePhase.DISCARDING: "Not in discarding phase",
+    GamePhase.PARTNER_CALL: "Not in partner call phase",
+    GamePhase.ANNOUNCEMENTS: "Not in announcement phase",
+    GamePhase.PLAYING: "Not in playing phase",
+}
+
+
+def _unresolved_error(sid: str) -> str:
+    """Error text for a session that has no player."""
+    return "Player not found" if room_manager.get_room_by_session(sid) else "Not in a room"
+
+
+def game_action(required_phase: GamePhase, error_code: str, check_turn: bool = True):
+    """
+    Decorator for in-game action handlers.
+
+    Resolves the room and player for the session, checks the game phase and
+    (optionally) that it is the player's turn, then calls the handler with
+    (room, player, game_state, data). A failed check or an exception from
+    the handler is logged and sent back to the client as an error message
+    with the given code.
+
+    Args:
+        required_phase: Phase the game must be in for this action
+        error_code: Error code sent to the client on failure
+        check_turn: Whether the player must be the one to move
+    """
+    phase_error = _PHASE_ERRORS.get(required_phase, f"Not in {required_phase.value} phase")
+
+    def decorator(handler):
+        error_event = f"{handler.__name__}_error"
+
+        async def reject(sid: str, message: str):
+            logger.error(error_event, sid=sid, error=message)
+            await sio.emit("error", error_payload(error_code, message), room=sid)
+
+        @functools.wraps(handler)
+        async def wrapper(sid: str, data: dict):
+            # Routine rejections are plain returns; only the handler itself can raise
+            ctx = room_manager.resolve(sid)
+            if not ctx:
+                return await reject(sid, _unresolved_error(sid))
+            room, player = ctx
+
+            game_state = room.game_state
+
+            if game_state.phase != required_phase:
+                return await reject(sid, phase_error)
+
+            if check_turn and game_state.current_turn != player.position:
+                return await reject(sid, "Not your turn")
+
+            try:
+                await handler(room, player, game_state, data)
+            except Exception as e:
+                return await reject(sid, str(e))
+            room.metrics.incr(handler.__name__)
+
+        return wrapper
+
+    return decorator
+
 
 @sio.event
 async def connect(sid: str, environ: dict):
     """Handle client connection."""
-    logger.info("=== CLIENT CONNECTING ===")
     logger.info("client_connected", sid=sid)
-    logger.info("environ_keys", keys=list(environ.keys()))
-    logger.info("http_method", method=environ.get('REQUEST_METHOD', 'unknown'))
-    logger.info("path_info", path=environ.get('PATH_INFO', 'unknown'))
-    logger.info("query_string", query=environ.get('QUERY_STRING', 'unknown'))
-    logger.info("client_address", address=environ.get('REMOTE_ADDR', 'unknown'))
-    logger.info("user_agent", ua=environ.get('HTTP_USER_AGENT', 'unknown'))
+    if settings.log_connect_details:
+        logger.debug("client_connect_details",
+                     sid=sid,
+                     method=environ.get('REQUEST_METHOD', 'unknown'),
+                     path=environ.get('PATH_INFO', 'unknown'),
+                     query=environ.get('QUERY_STRING', 'unknown'),
+                     address=environ.get('REMOTE_ADDR', 'unknown'),
+                     ua=environ.get('HTTP_USER_AGENT', 'unknown'))
+
+    # Clients opt in to binary game_state via ?msgpack=1 or an X-Msgpack-Supported header
+    if msgpack is not None and _client_option(environ, 'msgpack'):
+        binary_sessions.add(sid)
+
+    # Clients opt in to batched updates via ?batch=1 or an X-Batch-Supported header
+    if _client_option(environ, 'batch'):
+        batch_sessions.add(sid)
 
     # Don't emit "connect" - it's a reserved event name!
     # The Socket.IO client automatically receives the connect event
     # when the connection is established
-    logger.info("client_connected_successfully", sid=sid)
 
 
 @sio.event
 async def disconnect(sid: str):
     """Handle client disconnection."""
-    logger.info("=== CLIENT DISCONNECTING ===")
     logger.info("client_disconnected", sid=sid)
+    binary_sessions.discard(sid)
+    batch_sessions.discard(sid)
 
     # Remove player from room
     room = room_manager.leave_room(sid)
@@ -81,7 +206,7 @@ async def list_rooms(sid: str, data: dict):
 
     except Exception as e:
         logger.error("list_rooms_error", sid=sid, error=str(e))
-        await sio.emit("error", create_error_message("LIST_ROOMS_ERROR", str(e)).to_dict(), room=sid)
+        await sio.emit("error", error_payload("LIST_ROOMS_ERROR", str(e)), room=sid)
 
 
 @sio.event
@@ -101,7 +226,7 @@ async def create_room(sid: str, data: dict):
 
     except Exception as e:
         logger.error("create_room_error", sid=sid, error=str(e))
-        await sio.emit("error", create_error_message("CREATE_ROOM_ERROR", str(e)).to_dict(), room=sid)
+        await sio.emit("error", error_payload("CREATE_ROOM_ERROR", str(e)), room=sid)
 
 
 @sio.event
@@ -149,6 +274,8 @@ async def join_room(sid: str, data: dict):
 
         # If game is in progress, also send current game state
         if room.game_state.phase != GamePhase.WAITING:
+            # Always resend to the joining session, even if nothing changed
+            room.last_game_state.pop(sid, None)
             await broadcast_game_state(room.room_id)
 
         # Auto-save room
@@ -156,7 +283,7 @@ async def join_room(sid: str, data: dict):
 
     except Exception as e:
         logger.error("join_room_error", sid=sid, error=str(e))
-        await sio.emit("error", create_error_message("JOIN_ROOM_ERROR", str(e)).to_dict(), room=sid)
+        await sio.emit("error", error_payload("JOIN_ROOM_ERROR", str(e)), room=sid)
 
 
 @sio.event
@@ -165,13 +292,10 @@ async def ready(sid: str, data: dict):
     try:
         logger.info("ready_request", sid=sid)
 
-        room = room_manager.get_room_by_session(sid)
-        if not room:
-            raise ValueError("Not in a room")
-
-        player = room.get_player_by_session(sid)
-        if not player:
-            raise ValueError("Player not found")
+        ctx = room_manager.resolve(sid)
+        if not ctx:
+            raise ValueError(_unresolved_error(sid))
+        room, player = ctx
 
         room.set_player_ready(player.id, True)
 
@@ -187,7 +311,7 @@ async def ready(sid: str, data: dict):
 
     except Exception as e:
         logger.error("ready_error", sid=sid, error=str(e))
-        await sio.emit("error", create_error_message("READY_ERROR", str(e)).to_dict(), room=sid)
+        await sio.emit("error", error_payload("READY_ERROR", str(e)), room=sid)
 
 
 @sio.event
@@ -214,565 +338,382 @@ async def leave_room(sid: str, data: dict):
 
     except Exception as e:
         logger.error("leave_room_error", sid=sid, error=str(e))
-        await sio.emit("error", create_error_message("LEAVE_ROOM_ERROR", str(e)).to_dict(), room=sid)
+        await sio.emit("error", error_payload("LEAVE_ROOM_ERROR", str(e)), room=sid)
 
 
 @sio.event
-async def place_bid(sid: str, data: dict):
+@game_action(GamePhase.BIDDING, "BID_ERROR")
+async def place_bid(room, player, game_state, data: dict):
     """Handle place bid action."""
-    try:
-        room = room_manager.get_room_by_session(sid)
-        if not room:
-            raise ValueError("Not in a room")
-
-        player = room.get_player_by_session(sid)
-        if not player:
-            raise ValueError("Player not found")
-
-        game_state = room.game_state
-
-        if game_state.phase != GamePhase.BIDDING:
-            raise ValueError("Not in bidding phase")
-
-        if game_state.current_turn != player.position:
-            raise ValueError("Not your turn")
+    bid_type_str = data.get("bid_type")
+    bid_type = BidType(bid_type_str)
 
-        bid_type_str = data.get("bid_type")
-        bid_type = BidType(bid_type_str)
+    # Validate bid
+    can_bid, error = BiddingManager.can_player_bid(player, bid_type, game_state.bid_history)
+    if not can_bid:
+        raise ValueError(error)
 
-        # Validate bid
-        can_bid, error = BiddingManager.can_player_bid(player, bid_type, game_state.bid_history)
-        if not can_bid:
-            raise ValueError(error)
+    # Place bid
+    bid = game_state.place_bid(player.position, bid_type)
 
-        # Place bid
-        bid = game_state.place_bid(player.position, bid_type)
-
-        # Notify all players
-        await broadcast_to_room(room.room_id, MessageType.BID_PLACED, {
-            "player_position": player.position,
-            "bid_type": bid_type_str
-        })
-
-        # Check if bidding is complete
-        if game_state.is_bidding_complete():
-            game_state.end_bidding()
+    # Notify all players
+    bid_placed = room_emit(room.room_id, MessageType.BID_PLACED, {
+        "player_position": player.position,
+        "bid_type": bid_type_str
+    })
 
-            if game_state.winning_bid:
-                # Move to talon distribution
-                await handle_talon_distribution(room)
-            else:
-                # All passed - throw in hand and deal new
-                logger.info("all_players_passed", room_id=room.room_id)
+    # Check if bidding is complete
+    if game_state.is_bidding_complete():
+        await send_emits([bid_placed])
+        game_state.end_bidding()
 
-                await broadcast_to_room(room.room_id, MessageType.GAME_STATE, {
-                    "message": "All players passed. Dealing new hand..."
-                })
+        if game_state.winning_bid:
+            # Move to talon distribution
+            await handle_talon_distribution(room)
+        else:
+            # All passed - throw in hand and deal new
+            logger.info("all_players_passed", room_id=room.room_id)
 
-                # Wait a moment for UI to show message
-                await asyncio.sleep(2)
+            await broadcast_to_room(room.room_id, MessageType.GAME_STATE, {
+                "message": "All players passed. Dealing new hand..."
+            })
 
-                # Deal new cards and start bidding again
-                game_state.start_dealing()
-                game_state.start_bidding()
+            # Wait a moment for UI to show message
+            await asyncio.sleep(2)
 
-                # Broadcast new game state
-                await broadcast_game_state(room.room_id)
+            # Deal new cards and start bidding again
+            game_state.start_dealing()
+            game_state.start_bidding()
 
-                # Notify first bidder
-                await send_your_turn(room, game_state.current_turn)
+            # Broadcast new game state
+            await broadcast_game_state(room.room_id)
 
-                logger.info("new_hand_dealt", room_id=room.room_id)
-        else:
-            # Notify next player
+            # Notify first bidder
             await send_your_turn(room, game_state.current_turn)
 
+            logger.info("new_hand_dealt", room_id=room.room_id)
+
         # Broadcast game state
         await broadcast_game_state(room.room_id)
+    else:
+        # Notify next player and broadcast game state together
+        await send_emits(
+            [bid_placed]
+            + your_turn_emits(room, game_state.current_turn)
+            + game_state_emits(room)
+        )
 
-        # Auto-save after bid
-        await auto_save_room(room)
-
-    except Exception as e:
-        logger.error("place_bid_error", sid=sid, error=str(e))
-        await sio.emit("error", create_error_message("BID_ERROR", str(e)).to_dict(), room=sid)
+    # Auto-save after bid
+    await auto_save_room(room)
 
 
 @sio.event
-async def discard_cards(sid: str, data: dict):
+@game_action(GamePhase.DISCARDING, "DISCARD_ERROR")
+async def discard_cards(room, player, game_state, data: dict):
     """Handle discard cards action."""
-    try:
-        room = room_manager.get_room_by_session(sid)
-        if not room:
-            raise ValueError("Not in a room")
-
-        player = room.get_player_by_session(sid)
-        if not player:
-            raise ValueError("Player not found")
-
-        game_state = room.game_state
-
-        if game_state.phase != GamePhase.DISCARDING:
-            raise ValueError("Not in discarding phase")
-
-        if game_state.current_turn != player.position:
-            raise ValueError("Not your turn")
+    card_ids = data.get("card_ids", [])
 
-        card_ids = data.get("card_ids", [])
+    # Calculate how many cards to discard
+    target_hand_size = 9
+    num_to_discard = player.get_hand_size() - target_hand_size
 
-        # Calculate how many cards to discard
-        target_hand_size = 9
-        num_to_discard = player.get_hand_size() - target_hand_size
+    if len(card_ids) != num_to_discard:
+        raise ValueError(f"Must discard exactly {num_to_discard} cards")
 
-        if len(card_ids) != num_to_discard:
-            raise ValueError(f"Must discard exactly {num_to_discard} cards")
+    # Each id maps to one card; a repeated id must not count twice
+    if len(set(card_ids)) != len(card_ids):
+        raise ValueError("Cannot discard the same card twice")
 
-        # Get cards to discard
-        cards_to_discard = [c for c in player.hand if c.id in card_ids]
+    # Get cards to discard
+    cards_to_discard = [card for card in map(player.get_card, card_ids) if card is not None]
 
-        # Validate discard
-        is_valid, error = validate_discard(cards_to_discard)
-        if not is_valid:
-            raise ValueError(error)
+    # Validate discard
+    is_valid, error = validate_discard(cards_to_discard)
+    if not is_valid:
+        raise ValueError(error)
 
-        # Discard cards
-        discarded = player.discard_cards(card_ids)
-        tarokks_discarded = sum(1 for c in discarded if c.is_tarokk())
+    # Discard cards
+    discarded = player.discard_cards(card_ids)
+    discard_mask = 0
+    for card in discarded:
+        discard_mask |= card.bit
+    tarokks_discarded = (discard_mask & TAROKK_MASK).bit_count()
 
-        # Mark player as having discarded
-        game_state.players_who_discarded.append(player.position)
+    # Mark player as having discarded
+    game_state.players_who_discarded.append(player.position)
 
-        # Notify all players
-        await broadcast_to_room(room.room_id, MessageType.PLAYER_DISCARDED, {
-            "player_position": player.position,
-            "num_cards": len(discarded),
-            "tarokks_discarded": tarokks_discarded
-        })
-
-        # Check if all players have discarded
-        if game_state.can_end_discard_phase():
-            # Move to partner call
-            await handle_partner_call_phase(room)
-        else:
-            # Move to next player
-            game_state.current_turn = game_state.next_position(game_state.current_turn)
-            await send_your_turn(room, game_state.current_turn)
+    # Notify all players
+    player_discarded = room_emit(room.room_id, MessageType.PLAYER_DISCARDED, {
+        "player_position": player.position,
+        "num_cards": len(discarded),
+        "tarokks_discarded": tarokks_discarded
+    })
 
+    # Check if all players have discarded
+    if game_state.can_end_discard_phase():
+        # Move to partner call
+        await send_emits([player_discarded])
+        await handle_partner_call_phase(room)
         await broadcast_game_state(room.room_id)
+    else:
+        # Move to next player
+        game_state.current_turn = game_state.next_position(game_state.current_turn)
+        await send_emits(
+            [player_discarded]
+            + your_turn_emits(room, game_state.current_turn)
+            + game_state_emits(room)
+        )
 
-        # Auto-save after discard
-        await auto_save_room(room)
-
-    except Exception as e:
-        logger.error("discard_cards_error", sid=sid, error=str(e))
-        await sio.emit("error", create_error_message("DISCARD_ERROR", str(e)).to_dict(), room=sid)
+    # Auto-save after discard
+    await auto_save_room(room)
 
 
 @sio.event
-async def call_partner(sid: str, data: dict):
+@game_action(GamePhase.PARTNER_CALL, "CALL_PARTNER_ERROR", check_turn=False)
+async def call_partner(room, player, game_state, data: dict):
     """Handle call partner action."""
-    try:
-        room = room_manager.get_room_by_session(sid)
-        if not room:
-            raise ValueError("Not in a room")
-
-        player = room.get_player_by_session(sid)
-        if not player:
-            raise ValueError("Player not found")
-
-        game_state = room.game_state
+    if player.position != game_state.declarer_position:
+        raise ValueError("Only declarer can call partner")
 
-        if game_state.phase != GamePhase.PARTNER_CALL:
-            raise ValueError("Not in partner call phase")
+    tarokk_rank = data.get("tarokk_rank")
+    if not tarokk_rank:
+        raise ValueError("Must specify tarokk rank")
 
-        if player.position != game_state.declarer_position:
-            raise ValueError("Only declarer can call partner")
+    # Call partner
+    game_state.call_partner(tarokk_rank)
 
-        tarokk_rank = data.get("tarokk_rank")
-        if not tarokk_rank:
-            raise ValueError("Must specify tarokk rank")
-
-        # Call partner
-        game_state.call_partner(tarokk_rank)
-
-        # Notify all players
-        await broadcast_to_room(room.room_id, MessageType.PARTNER_CALLED, {
-            "called_card": tarokk_rank
-        })
-
-        # Start announcement phase
-        await start_announcement_phase(room)
+    # Notify all players
+    await broadcast_to_room(room.room_id, MessageType.PARTNER_CALLED, {
+        "called_card": tarokk_rank
+    })
 
-    except Exception as e:
-        logger.error("call_partner_error", sid=sid, error=str(e))
-        await sio.emit("error", create_error_message("CALL_PARTNER_ERROR", str(e)).to_dict(), room=sid)
+    # Start announcement phase
+    await start_announcement_phase(room)
 
 
 @sio.event
-async def make_announcement(sid: str, data: dict):
+@game_action(GamePhase.ANNOUNCEMENTS, "ANNOUNCEMENT_ERROR")
+async def make_announcement(room, player, game_state, data: dict):
     """Handle make announcement action (single or multiple)."""
-    try:
-        room = room_manager.get_room_by_session(sid)
-        if not room:
-            raise ValueError("Not in a room")
-
-        player = room.get_player_by_session(sid)
-        if not player:
-            raise ValueError("Player not found")
-
-        game_state = room.game_state
-
-        if game_state.phase != GamePhase.ANNOUNCEMENTS:
-            raise ValueError("Not in announcement phase")
-
-        if game_state.current_turn != player.position:
-            raise ValueError("Not your turn")
-
-        # Support both single announcement and multiple announcements
-        announcement_types = data.get("announcement_types")  # Array of types
-        if announcement_types is None:
-            # Fallback to single announcement for backward compatibility
-            announcement_type_str = data.get("announcement_type")
-            if not announcement_type_str:
-                raise ValueError("Must specify announcement type(s)")
-            announcement_types = [announcement_type_str]
-
-        announced = data.get("announced", True)
-
-        logger.info("make_announcement_request", sid=sid,
-                   player_position=player.position,
-                   announcement_types=announcement_types,
-                   announced=announced,
-                   count=len(announcement_types))
-
-        # Process all announcements
-        for announcement_type_str in announcement_types:
-            announcement_type = AnnouncementType(announcement_type_str)
-
-            # Validate announcement
-            is_valid, error = can_announce(player.hand, announcement_type)
-            if not is_valid:
-                raise ValueError(f"{announcement_type_str}: {error}")
-
-            # Create and add announcement
-            announcement = Announcement(
-                player_position=player.position,
-                announcement_type=announcement_type,
-                announced=announced
-            )
-            game_state.make_announcement(announcement)
-
-            # Notify all players about this announcement
-            await broadcast_to_room(room.room_id, MessageType.ANNOUNCEMENT_MADE, {
-                "player_position": player.position,
-                "announcement_type": announcement_type_str,
-                "announced": announced
-            })
+    # Support both single announcement and multiple announcements
+    announcement_types = data.get("announcement_types")  # Array of types
+    if announcement_types is None:
+        # Fallback to single announcement for backward compatibility
+        announcement_type_str = data.get("announcement_type")
+        if not announcement_type_str:
+            raise ValueError("Must specify announcement type(s)")
+        announcement_types = [announcement_type_str]
 
-        logger.info("announcements_processed", player_position=player.position,
-                   count=len(announcement_types))
+    announced = data.get("announced", True)
 
-        # After all announcements are processed, check if phase is complete
-        if game_state.is_announcement_phase_complete():
-            await broadcast_to_room(room.room_id, MessageType.ANNOUNCEMENTS_COMPLETE, {})
-            # Start trick-taking
-            await start_trick_taking(room)
-        else:
-            # Notify next player (only after all announcements are processed)
-            await send_your_turn(room, game_state.current_turn)
+    # Validate everything first so a bad type doesn't leave a partial announcement
+    announcements = []
+    for announcement_type_str in announcement_types:
+        announcement_type = AnnouncementType(announcement_type_str)
 
-        await broadcast_game_state(room.room_id)
+        # Validate announcement
+        is_valid, error = can_announce(player.hand, announcement_type)
+        if not is_valid:
+            raise ValueError(f"{announcement_type_str}: {error}")
+
+        announcements.append(Announcement(
+            player_position=player.position,
+            announcement_type=announcement_type,
+            announced=announced
+        ))
+
+    # Apply announcements and collect the notifications for one combined broadcast
+    emits = []
+    for announcement in announcements:
+        game_state.make_announcement(announcement)
+        emits.append(room_emit(room.room_id, MessageType.ANNOUNCEMENT_MADE, {
+            "player_position": player.position,
+            "announcement_type": announcement.announcement_type.value,
+            "announced": announced
+        }))
 
-    except Exception as e:
-        logger.error("make_announcement_error", sid=sid, error=str(e))
-        await sio.emit("error", create_error_message("ANNOUNCEMENT_ERROR", str(e)).to_dict(), room=sid)
+    # After all announcements are processed, check if phase is complete
+    await finish_announcement_turn(room, emits)
 
 
 @sio.event
-async def pass_announcement(sid: str, data: dict):
+@game_action(GamePhase.ANNOUNCEMENTS, "PASS_ANNOUNCEMENT_ERROR")
+async def pass_announcement(room, player, game_state, data: dict):
     """Handle pass announcement action."""
-    try:
-        room = room_manager.get_room_by_session(sid)
-        if not room:
-            raise ValueError("Not in a room")
-
-        player = room.get_player_by_session(sid)
-        if not player:
-            raise ValueError("Player not found")
-
-        game_state = room.game_state
+    # Mark player as passed
+    game_state.player_pass_announcement(player.position)
 
-        if game_state.phase != GamePhase.ANNOUNCEMENTS:
-            raise ValueError("Not in announcement phase")
-
-        if game_state.current_turn != player.position:
-            raise ValueError("Not your turn")
-
-        # Mark player as passed
-        game_state.player_pass_announcement(player.position)
-
-        # Notify all players
-        await broadcast_to_room(room.room_id, MessageType.PASS_ANNOUNCEMENT, {
-            "player_position": player.position
-        })
-
-        # Check if announcement phase is complete
-        if game_state.is_announcement_phase_complete():
-            await broadcast_to_room(room.room_id, MessageType.ANNOUNCEMENTS_COMPLETE, {})
-            # Start trick-taking
-            await start_trick_taking(room)
-        else:
-            # Notify next player
-            await send_your_turn(room, game_state.current_turn)
-
-        await broadcast_game_state(room.room_id)
+    # Notify all players
+    passed = room_emit(room.room_id, MessageType.PASS_ANNOUNCEMENT, {
+        "player_position": player.position
+    })
 
-    except Exception as e:
-        logger.error("pass_announcement_error", sid=sid, error=str(e))
-        await sio.emit("error", create_error_message("PASS_ANNOUNCEMENT_ERROR", str(e)).to_dict(), room=sid)
+    # Check if announcement phase is complete
+    await finish_announcement_turn(room, [passed])
 
 
 @sio.event
-async def contra_announcement(sid: str, data: dict):
+@game_action(GamePhase.ANNOUNCEMENTS, "CONTRA_ERROR")
+async def contra_announcement(room, player, game_state, data: dict):
     """Handle contra on an announcement."""
-    try:
-        room = room_manager.get_room_by_session(sid)
-        if not room:
-            raise ValueError("Not in a room")
-
-        player = room.get_player_by_session(sid)
-        if not player:
-            raise ValueError("Player not found")
-
-        game_state = room.game_state
-
-        if game_state.phase != GamePhase.ANNOUNCEMENTS:
-            raise ValueError("Not in announcement phase")
-
-        if game_state.current_turn != player.position:
-            raise ValueError("Not your turn")
-
-        announcement_type_str = data.get("announcement_type")
-        if not announcement_type_str:
-            raise ValueError("Must specify announcement type")
-
-        # Find the announcement
-        announcement = next(
-            (a for a in game_state.announcements if a.announcement_type.value == announcement_type_str),
-            None
-        )
-        if not announcement:
-            raise ValueError(f"No announcement of type {announcement_type_str} found")
-
-        if announcement.contra:
-            raise ValueError("This announcement has already been contra'd")
-
-        # Check if player is on opposing team
-        is_declarer_team = player.position == game_state.declarer_position or player.position == game_state.partner_position
-        is_announcement_by_declarer_team = (
-            announcement.player_position == game_state.declarer_position or
-            announcement.player_position == game_state.partner_position
-        )
+    announcement_type_str = data.get("announcement_type")
+    if not announcement_type_str:
+        raise ValueError("Must specify announcement type")
+
+    # Find the announcement
+    announcement = next(
+        (a for a in game_state.announcements if a.announcement_type.value == announcement_type_str),
+        None
+    )
+    if not announcement:
+        raise ValueError(f"No announcement of type {announcement_type_str} found")
 
-        if is_declarer_team == is_announcement_by_declarer_team:
-            raise ValueError("Can only contra opponent announcements")
+    if announcement.contra:
+        raise ValueError("This announcement has already been contra'd")
 
-        # Apply contra
-        announcement.contra = True
-        announcement.contra_by = player.position
+    # Check if player is on opposing team
+    declarer_team = (game_state.declarer_position, game_state.partner_position)
+    is_declarer_team = player.position in declarer_team
+    is_announcement_by_declarer_team = announcement.player_position in declarer_team
 
-        # Add to announcement history
-        game_state.player_pass_announcement(player.position)  # Move turn forward
+    if is_declarer_team == is_announcement_by_declarer_team:
+        raise ValueError("Can only contra opponent announcements")
 
-        # Notify all players
-        await broadcast_to_room(room.room_id, MessageType.CONTRA_MADE, {
-            "player_position": player.position,
-            "announcement_type": announcement_type_str
-        })
+    # Apply contra
+    announcement.contra = True
+    announcement.contra_by = player.position
 
-        # Check if announcement phase is complete
-        if game_state.is_announcement_phase_complete():
-            await broadcast_to_room(room.room_id, MessageType.ANNOUNCEMENTS_COMPLETE, {})
-            await start_trick_taking(room)
-        else:
-            await send_your_turn(room, game_state.current_turn)
+    # Add to announcement history
+    game_state.player_pass_announcement(player.position)  # Move turn forward
 
-        await broadcast_game_state(room.room_id)
+    # Notify all players
+    made = room_emit(room.room_id, MessageType.CONTRA_MADE, {
+        "player_position": player.position,
+        "announcement_type": announcement_type_str
+    })
 
-    except Exception as e:
-        logger.error("contra_announcement_error", sid=sid, error=str(e))
-        await sio.emit("error", create_error_message("CONTRA_ERROR", str(e)).to_dict(), room=sid)
+    # Check if announcement phase is complete
+    await finish_announcement_turn(room, [made])
 
 
 @sio.event
-async def recontra_announcement(sid: str, data: dict):
+@game_action(GamePhase.ANNOUNCEMENTS, "RECONTRA_ERROR")
+async def recontra_announcement(room, player, game_state, data: dict):
     """Handle recontra on a contra'd announcement."""
-    try:
-        room = room_manager.get_room_by_session(sid)
-        if not room:
-            raise ValueError("Not in a room")
-
-        player = room.get_player_by_session(sid)
-        if not player:
-            raise ValueError("Player not found")
-
-        game_state = room.game_state
-
-        if game_state.phase != GamePhase.ANNOUNCEMENTS:
-            raise ValueError("Not in announcement phase")
-
-        if game_state.current_turn != player.position:
-            raise ValueError("Not your turn")
-
-        announcement_type_str = data.get("announcement_type")
-        if not announcement_type_str:
-            raise ValueError("Must specify announcement type")
-
-        # Find the announcement
-        announcement = next(
-            (a for a in game_state.announcements if a.announcement_type.value == announcement_type_str),
-            None
-        )
-        if not announcement:
-            raise ValueError(f"No announcement of type {announcement_type_str} found")
-
-        if not announcement.contra:
-            raise ValueError("Can only recontra a contra'd announcement")
-
-        if announcement.recontra:
-            raise ValueError("This announcement has already been recontra'd")
+    announcement_type_str = data.get("announcement_type")
+    if not announcement_type_str:
+        raise ValueError("Must specify announcement type")
+
+    # Find the announcement
+    announcement = next(
+        (a for a in game_state.announcements if a.announcement_type.value == announcement_type_str),
+        None
+    )
+    if not announcement:
+        raise ValueError(f"No announcement of type {announcement_type_str} found")
 
-        # Check if player is on the same team as the original announcer
-        is_declarer_team = player.position == game_state.declarer_position or player.position == game_state.partner_position
-        is_announcement_by_declarer_team = (
-            announcement.player_position == game_state.declarer_position or
-            announcement.player_position == game_state.partner_position
-        )
+    if not announcement.contra:
+        raise ValueError("Can only recontra a contra'd announcement")
 
-        if is_declarer_team != is_announcement_by_declarer_team:
-            raise ValueError("Can only recontra your own team's announcements")
+    if announcement.recontra:
+        raise ValueError("This announcement has already been recontra'd")
 
-        # Apply recontra
-        announcement.recontra = True
-        announcement.recontra_by = player.position
+    # Check if player is on the same team as the original announcer
+    declarer_team = (game_state.declarer_position, game_state.partner_position)
+    is_declarer_team = player.position in declarer_team
+    is_announcement_by_declarer_team = announcement.player_position in declarer_team
 
-        # Add to announcement history
-        game_state.player_pass_announcement(player.position)  # Move turn forward
+    if is_declarer_team != is_announcement_by_declarer_team:
+        raise ValueError("Can only recontra your own team's announcements")
 
-        # Notify all players
-        await broadcast_to_room(room.room_id, MessageType.RECONTRA_MADE, {
-            "player_position": player.position,
-            "announcement_type": announcement_type_str
-        })
+    # Apply recontra
+    announcement.recontra = True
+    announcement.recontra_by = player.position
 
-        # Check if announcement phase is complete
-        if game_state.is_announcement_phase_complete():
-            await broadcast_to_room(room.room_id, MessageType.ANNOUNCEMENTS_COMPLETE, {})
-            await start_trick_taking(room)
-        else:
-            await send_your_turn(room, game_state.current_turn)
+    # Add to announcement history
+    game_state.player_pass_announcement(player.position)  # Move turn forward
 
-        await broadcast_game_state(room.room_id)
+    # Notify all players
+    made = room_emit(room.room_id, MessageType.RECONTRA_MADE, {
+        "player_position": player.position,
+        "announcement_type": announcement_type_str
+    })
 
-    except Exception as e:
-        logger.error("recontra_announcement_error", sid=sid, error=str(e))
-        await sio.emit("error", create_error_message("RECONTRA_ERROR", str(e)).to_dict(), room=sid)
+    # Check if announcement phase is complete
+    await finish_announcement_turn(room, [made])
 
 
 @sio.event
-async def play_card(sid: str, data: dict):
+@game_action(GamePhase.PLAYING, "PLAY_CARD_ERROR")
+async def play_card(room, player, game_state, data: dict):
     """Handle play card action."""
-    try:
-        room = room_manager.get_room_by_session(sid)
-        if not room:
-            raise ValueError("Not in a room")
-
-        player = room.get_player_by_session(sid)
-        if not player:
-            raise ValueError("Player not found")
-
-        game_state = room.game_state
+    card_id = data.get("card_id")
+    if not card_id:
+        raise ValueError("Must specify card_id")
 
-        if game_state.phase != GamePhase.PLAYING:
-            raise ValueError("Not in playing phase")
+    # Validate card is legal
+    card = player.get_card(card_id)
+    if not card:
+        raise ValueError("Card not in hand")
 
-        if game_state.current_turn != player.position:
-            raise ValueError("Not your turn")
+    # Any card in hand may lead a trick
+    if game_state.current_trick and not game_state.is_legal_card(player.position, card):
+        raise ValueError("Illegal card play - must follow suit or play tarokk if void")
 
-        card_id = data.get("card_id")
-        if not card_id:
-            raise ValueError("Must specify card_id")
+    room_id = room.room_id
+    position = player.position
 
-        # Validate card is legal
-        card = next((c for c in player.hand if c.id == card_id), None)
-        if not card:
-            raise ValueError("Card not in hand")
-
-        # Get legal cards
-        is_first_card = len(game_state.current_trick) == 0
-        lead_suit = game_state.current_trick[0][1].suit if not is_first_card else None
-        legal_cards = get_legal_cards(player.hand, lead_suit, is_first_card)
-
-        if card not in legal_cards:
-            raise ValueError("Illegal card play - must follow suit or play tarokk if void")
-
-        # Play card
-        played_card = game_state.play_card_to_trick(player.position, card_id)
-
-        # Notify all players
-        await broadcast_to_room(room.room_id, MessageType.CARD_PLAYED, {
-            "player_position": player.position,
-            "card": played_card.to_dict()
-        })
-
-        # Check if partner was revealed
-        if game_state.partner_revealed and played_card.rank == game_state.called_card_rank:
-            await broadcast_to_room(room.room_id, MessageType.PARTNER_REVEALED, {
-                "partner_position": game_state.partner_position
-            })
-
-        # Check if trick is complete
-        if len(game_state.current_trick) == 0:  # Trick was completed and cleared
-            # Trick complete - winner determined in game_state.complete_trick()
-            winner = game_state.previous_trick_winner
-            winner_player = game_state.players[winner]
-            await broadcast_to_room(room.room_id, MessageType.TRICK_COMPLETE, {
-                "winner": winner,
-                "winner_name": winner_player.name,
-                "trick_number": game_state.trick_number - 1
-            })
-
-            # Check if game is over
-            if game_state.phase == GamePhase.SCORING:
-                await handle_game_over(room)
-            else:
-                # Next trick
-                await send_your_turn(room, game_state.current_turn)
-        else:
-            # Notify next player
-            await send_your_turn(room, game_state.current_turn)
-
-        await broadcast_game_state(room.room_id)
+    # Play card
+    played_card = game_state.play_card_to_trick(position, card_id)
 
-        # Auto-save after play card
-        await auto_save_room(room)
+    # Notify all players
+    emits = [room_emit(room_id, MessageType.CARD_PLAYED, {
+        "player_position": position,
+        "card": played_card.to_dict()
+    })]
+
+    # Check if partner was revealed
+    if game_state.partner_revealed and played_card.rank == game_state.called_card_rank:
+        emits.append(room_emit(room_id, MessageType.PARTNER_REVEALED, {
+            "partner_position": game_state.partner_position
+        }))
+
+    # Check if trick is complete
+    if len(game_state.current_trick) == 0:  # Trick was completed and cleared
+        # Trick complete - winner determined in game_state.complete_trick()
+        winner = game_state.previous_trick_winner
+        winner_player = game_state.players[winner]
+        emits.append(room_emit(room_id, MessageType.TRICK_COMPLETE, {
+            "winner": winner,
+            "winner_name": winner_player.name,
+            "trick_number": game_state.trick_number - 1
+        }))
+
+    # Check if game is over
+    if game_state.phase == GamePhase.SCORING:
+        await send_emits(emits)
+        await handle_game_over(room)
+        await broadcast_game_state(room_id)
+    else:
+        # Notify next player and broadcast game state together
+        await send_emits(
+            emits
+            + your_turn_emits(room, game_state.current_turn)
+            + game_state_emits(room)
+        )
 
-    except Exception as e:
-        logger.error("play_card_error", sid=sid, error=str(e))
-        await sio.emit("error", create_error_message("PLAY_CARD_ERROR", str(e)).to_dict(), room=sid)
+    # Auto-save after play card
+    await auto_save_room(room)
 
 
 @sio.event
 async def send_chat_message(sid: str, data: dict):
     """Handle chat message from player."""
     try:
-        room = room_manager.get_room_by_session(sid)
-        if not room:
-            raise ValueError("Not in a room")
-
-        player = room.get_player_by_session(sid)
-        if not player:
-            raise ValueError("Player not found")
+        ctx = room_manager.resolve(sid)
+        if not ctx:
+            raise ValueError(_unresolved_error(sid))
+        room, player = ctx
 
         message = data.get("message", "")
         if not message or not message.strip():
@@ -808,11 +749,19 @@ async def send_chat_message(sid: str, data: dict):
 
     except Exception as e:
         logger.error("send_chat_message_error", sid=sid, error=str(e))
-        await sio.emit("error", create_error_message("CHAT_ERROR", str(e)).to_dict(), room=sid)
+        await sio.emit("error", error_payload("CHAT_ERROR", str(e)), room=sid)
 
 
 # Helper functions
 
+def _client_option(environ: dict, name: str) -> bool:
+    """Check whether a connecting client enabled an optional protocol feature."""
+    if environ.get(f'HTTP_X_{name.upper()}_SUPPORTED', '').lower() in ('1', 'true'):
+        return True
+    query = parse_qs(environ.get('QUERY_STRING', ''))
+    return query.get(name, [''])[0].lower() in ('1', 'true')
+
+
 async def auto_save_room(room):
     """Auto-save room state to database."""
     if persistence_manager:
@@ -826,67 +775,135 @@ async def broadcast_room_state(room_id: str):
         await sio.emit("room_state", room_info, room=room_id)
 
 
+async def send_emits(emits: List[Emit]):
+    """
+    Send several prepared emits concurrently.
+
+    All emits are started in one gather instead of awaiting each in turn.
+    Socket.IO queues packets in the order the emits start, so every client
+    still receives its messages in list order.
+
+    Sessions in batch_sessions instead get everything addressed to them as
+    one "updates" event: a list of [event, data] pairs in the same order.
+    """
+    if not batch_sessions:
+        await asyncio.gather(*(sio.emit(event, data, room=target) for event, data, target in emits))
+        return
+
+    coros = []
+    batched: Dict[str, list] = {}
+    for event, data, target in emits:
+        skip = []
+        unbatched = False
+        for sid, _ in sio.manager.get_participants('/', target):
+            if sid in batch_sessions:
+                batched.setdefault(sid, []).append([event, data])
+                skip.append(sid)
+            else:
+                unbatched = True
+        if unbatched:
+            coros.append(sio.emit(event, data, room=target, skip_sid=skip))
+
+    for sid, updates in batched.items():
+        if len(updates) == 1:
+            event, data = updates[0]
+            coros.append(sio.emit(event, data, room=sid))
+        else:
+            coros.append(sio.emit("updates", updates, room=sid))
+
+    await asyncio.gather(*coros)
+
+
+def room_emit(room_id: str, msg_type: MessageType, data: dict) -> Emit:
+    """Build a message for all players in room."""
+    return EVENT_NAMES[msg_type], message_payload(msg_type, data), room_id
+
+
+def game_state_emits(room: Any) -> List[Emit]:
+    """
+    Build the personalized game state for each player in room.
+
+    The shared part is built once per call. A player whose view hasn't
+    changed since the last game_state they were sent is skipped.
+    """
+    emits = []
+    game_state = room.game_state
+    sessions = room.player_sessions
+    last_sent = room.last_game_state
+    sent = {}
+    public = game_state.to_public_dict()
+    for player in game_state.players:
+        session_id = sessions.get(player.id)
+        if session_id:
+            game_data = {**public, **game_state.to_private_overlay(player.id, public)}
+            sent[session_id] = game_data
+            if last_sent.get(session_id) == game_data:
+                continue
+            if session_id in binary_sessions:
+                # Sent as a binary attachment; the client decodes it with msgpack
+                game_data = msgpack.packb(game_data)
+            emits.append(("game_state", game_data, session_id))
+    room.last_game_state = sent
+    return emits
+
+
 async def broadcast_game_state(room_id: str):
     """Broadcast game state to all players in room."""
     room = room_manager.get_room(room_id)
     if not room:
         return
 
-    # Send personalized game state to each player
-    for player in room.game_state.players:
-        session_id = room.player_sessions.get(player.id)
-        if session_id:
-            game_data = room.game_state.to_dict(player_id=player.id)
-            await sio.emit("game_state", game_data, room=session_id)
+    # Send personalized game state to each player concurrently
+    await send_emits(game_state_emits(room))
 
 
 async def broadcast_to_room(room_id: str, msg_type: MessageType, data: dict):
     """Broadcast a message to all players in room."""
-    message = Message.create(msg_type, **data)
-    await sio.emit(msg_type.value, message.to_dict(), room=room_id)
+    event, payload, _ = room_emit(room_id, msg_type, data)
+    await sio.emit(event, payload, room=room_id)
 
 
 async def send_your_turn(room: Any, player_position: int):
     """Notify a player it's their turn."""
-    player = room.game_state.get_player(player_position)
+    await send_emits(your_turn_emits(room, player_position))
+
+
+def your_turn_emits(room: Any, player_position: int) -> List[Emit]:
+    """Build the your_turn notification for a player (empty if not connected)."""
+    game_state = room.game_state
+    player = game_state.get_player(player_position)
     if not player:
-        return
+        return []
 
     session_id = room.player_sessions.get(player.id)
     if not session_id:
-        return
+        return []
 
-    game_state = room.game_state
+    phase = game_state.phase
     your_turn_data = {
         "valid_actions": []
     }
 
-    if game_state.phase == GamePhase.BIDDING:
+    if phase == GamePhase.BIDDING:
         your_turn_data["valid_actions"] = ["place_bid"]
-        valid_bids = BiddingManager.get_valid_bid_types(player, game_state.bid_history)
-        your_turn_data["valid_bids"] = [b.value for b in valid_bids]
+        # BidType and AnnouncementType are str enums, so members serialize as their values
+        your_turn_data["valid_bids"] = BiddingManager.get_valid_bid_types(player, game_state.bid_history)
 
-    elif game_state.phase == GamePhase.DISCARDING:
+    elif phase == GamePhase.DISCARDING:
         your_turn_data["valid_actions"] = ["discard_cards"]
 
-    elif game_state.phase == GamePhase.PARTNER_CALL:
+    elif phase == GamePhase.PARTNER_CALL:
         your_turn_data["valid_actions"] = ["call_partner"]
 
-    elif game_state.phase == GamePhase.ANNOUNCEMENTS:
-        from validation.rules import get_valid_announcements
+    elif phase == GamePhase.ANNOUNCEMENTS:
         your_turn_data["valid_actions"] = ["make_announcement", "pass_announcement"]
-        valid_announcements = get_valid_announcements(player.hand)
-        your_turn_data["valid_announcements"] = [a.value for a in valid_announcements]
+        your_turn_data["valid_announcements"] = get_valid_announcements(player.hand)
 
-    elif game_state.phase == GamePhase.PLAYING:
+    elif phase == GamePhase.PLAYING:
         your_turn_data["valid_actions"] = ["play_card"]
-        # Get legal cards
-        is_first_card = len(game_state.current_trick) == 0
-        lead_suit = game_state.current_trick[0][1].suit if not is_first_card else None
-        legal_cards = get_legal_cards(player.hand, lead_suit, is_first_card)
-        your_turn_data["valid_cards"] = [c.id for c in legal_cards]
+        your_turn_data["valid_cards"] = [c.id for c in game_state.legal_cards(player.position)]
 
-    await sio.emit("your_turn", your_turn_data, room=session_id)
+    return [("your_turn", your_turn_data, session_id)]
 
 
 async def start_game(room):
@@ -901,12 +918,12 @@ async def start_game(room):
     # Start bidding
     game_state.start_bidding()
 
-    # Notify all players
-    await broadcast_to_room(room.room_id, MessageType.GAME_STARTED, {})
-    await broadcast_game_state(room.room_id)
-
-    # Notify first bidder
-    await send_your_turn(room, game_state.current_turn)
+    # Notify all players and the first bidder
+    await send_emits(
+        [room_emit(room.room_id, MessageType.GAME_STARTED, {})]
+        + game_state_emits(room)
+        + your_turn_emits(room, game_state.current_turn)
+    )
 
 
 async def handle_talon_distribution(room):
@@ -917,19 +934,19 @@ async def handle_talon_distribution(room):
     distribution = game_state.distribute_talon()
 
     # Notify each player
+    emits = []
     for player in game_state.players:
         session_id = room.player_sessions.get(player.id)
         if session_id:
             you_received = len(distribution.get(player.position, []))
-            await sio.emit("talon_distributed", {
+            emits.append(("talon_distributed", {
                 "you_received": you_received,
                 "your_hand_size": player.get_hand_size()
-            }, room=session_id)
+            }, session_id))
 
     # Start discard phase
     game_state.start_discard_phase()
-    await broadcast_game_state(room.room_id)
-    await send_your_turn(room, game_state.current_turn)
+    await send_emits(emits + game_state_emits(room) + your_turn_emits(room, game_state.current_turn))
 
 
 async def handle_partner_call_phase(room):
@@ -937,10 +954,8 @@ async def handle_partner_call_phase(room):
     game_state = room.game_state
     game_state.phase = GamePhase.PARTNER_CALL
 
-    await broadcast_game_state(room.room_id)
-
     # Notify declarer to call partner
-    await send_your_turn(room, game_state.declarer_position)
+    await send_emits(game_state_emits(room) + your_turn_emits(room, game_state.declarer_position))
 
 
 async def start_announcement_phase(room):
@@ -948,9 +963,8 @@ async def start_announcement_phase(room):
     game_state = room.game_state
     game_state.start_announcement_phase()
 
-    await broadcast_game_state(room.room_id)
     # Notify first player (dealer's right)
-    await send_your_turn(room, game_state.current_turn)
+    await send_emits(game_state_emits(room) + your_turn_emits(room, game_state.current_turn))
 
 
 async def start_trick_taking(room):
@@ -958,19 +972,39 @@ async def start_trick_taking(room):
     game_state = room.game_state
     game_state.start_playing()
 
-    await broadcast_to_room(room.room_id, MessageType.TRICK_STARTED, {
-        "trick_number": 1,
-        "leader": game_state.trick_leader
-    })
+    await send_emits(
+        [room_emit(room.room_id, MessageType.TRICK_STARTED, {
+            "trick_number": 1,
+            "leader": game_state.trick_leader
+        })]
+        + game_state_emits(room)
+        + your_turn_emits(room, game_state.current_turn)
+    )
 
-    await broadcast_game_state(room.room_id)
-    await send_your_turn(room, game_state.current_turn)
+
+async def finish_announcement_turn(room: Any, emits: List[Emit]):
+    """
+    Send the result of an announcement-phase action and advance the phase.
+
+    Starts trick-taking once the phase is complete, otherwise prompts the
+    next player.
+    """
+    game_state = room.game_state
+    if game_state.is_announcement_phase_complete():
+        emits = emits + [room_emit(room.room_id, MessageType.ANNOUNCEMENTS_COMPLETE, {})]
+        await send_emits(emits)
+        await start_trick_taking(room)
+        await broadcast_game_state(room.room_id)
+    else:
+        await send_emits(
+            emits
+            + your_turn_emits(room, game_state.current_turn)
+            + game_state_emits(room)
+        )
 
 
 async def handle_game_over(room):
     """Handle game over with complete scoring."""
-    from game_logic.final_scoring import calculate_final_score
-
     game_state = room.game_state
 
     # Reveal partner at game end (if not already revealed)
@@ -978,8 +1012,10 @@ async def handle_game_over(room):
         game_state.partner_revealed = True
         game_state.players[game_state.partner_position].partner_revealed = True
 
-    # Calculate complete final scoring
-    scoring_result = calculate_final_score(
+    # Calculate complete final scoring off the event loop so other rooms keep
+    # being served; actions are rejected meanwhile since the phase is SCORING
+    scoring_result = await asyncio.to_thread(
+        calculate_final_score,
         players=game_state.players,
         declarer_position=game_state.declarer_position,
         partner_position=game_state.partner_position,
@@ -1016,6 +1052,28 @@ async def handle_game_over(room):
     await auto_save_room(room)
 
 
+async def report_metrics(interval: float = 1.0):
+    """
+    Periodically log aggregated action counters for all rooms.
+
+    Replaces per-action info logging on the hot event path with one
+    summary line per interval.
+
+    Args:
+        interval: Seconds between flushes
+    """
+    while True:
+        await asyncio.sleep(interval)
+
+        totals: Dict[str, int] = {}
+        for room in room_manager.rooms.values():
+            for name, count in room.metrics.flush().items():
+                totals[name] = totals.get(name, 0) + count
+
+        if totals:
+            logger.info("action_metrics", rooms=len(room_manager.rooms), **totals)
+
+
 async def init_persistence(db_path: str = "data/tarokk_game.db"):
     """
     Initialize persistence system and load persisted rooms.
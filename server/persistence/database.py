@@ -2,36 +2,259 @@
 
 import sqlite3
 import json
-from typing import Optional, List, Dict, Any
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import groupby
+from typing import Optional, List, Dict, Any, Iterator
 from pathlib import Path
 import structlog
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+
+try:
+    import orjson
+except ImportError:  # Optional: game state blobs are encoded with the stdlib json module
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # Optional: game state blobs are stored uncompressed
+    zstandard = None
 
 logger = structlog.get_logger()
 
+# Hot-path write statements. Kept as constants so every call passes the identical
+# string and hits the connection's compiled-statement cache.
+_SQL_SAVE_ROOM = """
+    INSERT INTO rooms (room_id, last_activity)
+    VALUES (?, CURRENT_TIMESTAMP)
+    ON CONFLICT(room_id) DO UPDATE SET
+        last_activity = CURRENT_TIMESTAMP
+"""
+
+_SQL_SAVE_PLAYER_COLUMNS = """
+    INSERT INTO players (player_id, room_id, name, position, is_connected, is_ready, session_id)
+    VALUES {values}
+    ON CONFLICT(player_id) DO UPDATE SET
+        name = excluded.name,
+        position = excluded.position,
+        is_connected = excluded.is_connected,
+        is_ready = excluded.is_ready,
+        session_id = excluded.session_id
+"""
+
+_SQL_SAVE_PLAYER = _SQL_SAVE_PLAYER_COLUMNS.format(values="(?, ?, ?, ?, ?, ?, ?)")
+
+
+@lru_cache(maxsize=8)
+def _sql_save_players(count: int) -> str:
+    """Multi-row variant of _SQL_SAVE_PLAYER for `count` players (one string per count)."""
+    return _SQL_SAVE_PLAYER_COLUMNS.format(values=", ".join(["(?, ?, ?, ?, ?, ?, ?)"] * count))
+
+
+_SQL_SAVE_GAME_STATE = """
+    INSERT INTO game_states (
+        room_id, phase, current_turn, dealer_position,
+        declarer_position, partner_position, partner_revealed,
+        called_card_rank, trick_number, trick_leader,
+        previous_trick_winner, game_data, updated_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ON CONFLICT(room_id) DO UPDATE SET
+        phase = excluded.phase,
+        current_turn = excluded.current_turn,
+        dealer_position = excluded.dealer_position,
+        declarer_position = excluded.declarer_position,
+        partner_position = excluded.partner_position,
+        partner_revealed = excluded.partner_revealed,
+        called_card_rank = excluded.called_card_rank,
+        trick_number = excluded.trick_number,
+        trick_leader = excluded.trick_leader,
+        previous_trick_winner = excluded.previous_trick_winner,
+        game_data = excluded.game_data,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+_SQL_SAVE_GAME_STATE_LIST = """
+    INSERT INTO game_state_lists (room_id, key, json_value)
+    VALUES (?, ?, ?)
+    ON CONFLICT(room_id, key) DO UPDATE SET
+        json_value = excluded.json_value
+"""
+
+# Drops every per-player section of a room (see PLAYER_KEY_PREFIX)
+_SQL_DELETE_PLAYER_SECTIONS = """
+    DELETE FROM game_state_lists
+    WHERE room_id = ? AND (key = 'players' OR key LIKE 'players/%')
+"""
+
+_SQL_SAVE_CHAT_MESSAGE = """
+    INSERT INTO chat_messages (id, room_id, player_name, message, timestamp)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(id) DO NOTHING
+"""
+
+# Bump whenever _create_schema changes so existing databases get migrated
+SCHEMA_VERSION = 4
+
+# Game state sections stored as separate rows of game_state_lists so a save only
+# rewrites the ones that changed; everything else stays in game_states.game_data
+LIST_KEYS = (
+    'players', 'bid_history', 'talon', 'current_trick', 'announcements',
+    'announcement_history', 'trick_history', 'players_who_discarded',
+)
+
+# Each player (with hand, tricks_won and discard_pile) gets its own section,
+# keyed 'players/<index>', so playing a card rewrites only that player's row
+PLAYER_KEY_PREFIX = 'players/'
+
+
+
+# Every zstd frame starts with these bytes; JSON never does, so legacy
+# uncompressed blobs are told apart without a separate column
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+# Smaller blobs fit a page anyway and barely shrink
+_COMPRESS_MIN_BYTES = 512
+
+
+def _dumps(obj: Any):
+    """Encode a game state blob (bytes with orjson, str otherwise)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj)
+
+
+def _loads(data):
+    """Decode a game state blob written by either codec."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _group_by_room(rows) -> Dict[str, List[sqlite3.Row]]:
+    """Group rows ordered by room_id into room_id -> rows."""
+    return {room_id: list(group) for room_id, group in groupby(rows, key=lambda r: r['room_id'])}
+
+
+def _player_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        'id': row['player_id'],
+        'name': row['name'],
+        'position': row['position'],
+        'is_connected': bool(row['is_connected']),
+        'is_ready': bool(row['is_ready']),
+        'session_id': row['session_id']
+    }
+
+
+def _chat_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        'id': row['id'],
+        'player_name': row['player_name'],
+        'message': row['message'],
+        'timestamp': row['timestamp']
+    }
+
 
 class GameDatabase:
     """SQLite database for persisting game state."""
 
-    def __init__(self, db_path: str = "data/tarokk_game.db"):
+    def __init__(self, db_path: str = "data/tarokk_game.db", read_only: bool = False):
         """
         Initialize the database connection.
 
         Args:
             db_path: Path to the SQLite database file
+            read_only: Open a query-only connection for the load paths. The
+                schema must already exist (created by a writable connection).
         """
         self.db_path = db_path
         # Create data directory if it doesn't exist
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        # Autocommit mode: the module never opens implicit transactions, so
+        # single statements commit on their own and multi-statement writes
+        # go through transaction()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=256,
+                                    isolation_level=None)
         self.conn.row_factory = sqlite3.Row  # Access columns by name
-        self._init_schema()
-        logger.info("database_initialized", path=db_path)
+        self._configure_pragmas()
+        # Reused by the hot-path save_* methods instead of a new cursor per call
+        self._cursor = self.conn.cursor()
+        # (room_id, key) -> last encoded value written for that list section
+        self._list_cache: Dict[tuple, Any] = {}
+        # zstd contexts are not thread-safe; each connection (thread) has its own
+        self._zctx = zstandard.ZstdCompressor(level=3) if zstandard is not None else None
+        self._zdctx = zstandard.ZstdDecompressor() if zstandard is not None else None
+        if read_only:
+            self.conn.execute("PRAGMA query_only=1")
+        else:
+            self._init_schema()
+        logger.info("database_initialized", path=db_path, read_only=read_only)
+
+    def _configure_pragmas(self):
+        """
+        Tune the connection for a write-heavy, fsync-bound workload.
+
+        WAL lets readers run alongside the writer and, with synchronous=NORMAL,
+        only fsyncs on checkpoint instead of on every commit.
+        """
+        if self.db_path == ":memory:":
+            return
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+        self.conn.execute("PRAGMA mmap_size=67108864")  # Read pages via a 64 MB memory map
+        self.conn.execute("PRAGMA busy_timeout=5000")
+
+    def wal_checkpoint(self) -> None:
+        """Fold the WAL back into the main database file without blocking writers."""
+        if self.db_path == ":memory:":
+            return
+        self.conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+
+    def vacuum(self) -> None:
+        """
+        Reclaim pages freed by deleted rooms and truncate the WAL file.
+
+        Rewrites the whole database, so call it only after large deletions.
+        """
+        if self.db_path == ":memory:":
+            return
+        self.conn.execute("VACUUM")
+        self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        logger.info("database_vacuumed", path=self.db_path)
+
+    def backup(self, dest_path: str) -> None:
+        """
+        Write a consistent, compacted snapshot of the database to dest_path.
+
+        Uses VACUUM INTO, which reads a single snapshot and lets other
+        connections keep reading while the copy is written.
+
+        Args:
+            dest_path: Path of the backup file (must not exist yet)
+        """
+        self.conn.execute("VACUUM INTO ?", (dest_path,))
+        logger.info("database_backed_up", path=dest_path)
 
     def _init_schema(self):
-        """Create database schema if it doesn't exist."""
-        cursor = self.conn.cursor()
+        """
+        Create or migrate the database schema.
+
+        Runs as one transaction and stamps PRAGMA user_version, so a warm
+        start with an up-to-date schema skips the DDL entirely.
+        """
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION:
+            return
+
+        with self.transaction() as conn:
+            self._create_schema(conn.cursor())
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        logger.info("database_schema_created", version=SCHEMA_VERSION)
+
+    def _create_schema(self, cursor: sqlite3.Cursor):
+        """Create tables and indices and migrate older layouts."""
 
         # Rooms table
         cursor.execute("""
@@ -57,7 +280,7 @@ class GameDatabase:
             )
         """)
 
-        # Game states table (stores JSON blob of entire game state)
+        # Game states table (scalar fields; list sections live in game_state_lists)
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS game_states (
                 room_id TEXT PRIMARY KEY,
@@ -69,12 +292,31 @@ class GameDatabase:
                 partner_revealed INTEGER DEFAULT 0,
                 called_card_rank TEXT,
                 trick_number INTEGER DEFAULT 0,
-                game_data JSON NOT NULL,
+                trick_leader INTEGER,
+                previous_trick_winner INTEGER,
+                game_data BLOB NOT NULL,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (room_id) REFERENCES rooms(room_id) ON DELETE CASCADE
             )
         """)
 
+        # Migrate databases created before trick_leader/previous_trick_winner columns
+        columns = {row['name'] for row in cursor.execute("PRAGMA table_info(game_states)")}
+        for column in ('trick_leader', 'previous_trick_winner'):
+            if column not in columns:
+                cursor.execute(f"ALTER TABLE game_states ADD COLUMN {column} INTEGER")
+
+        # Large game state lists, one row per section (see LIST_KEYS)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS game_state_lists (
+                room_id TEXT NOT NULL,
+                key TEXT NOT NULL,
+                json_value BLOB NOT NULL,
+                PRIMARY KEY (room_id, key),
+                FOREIGN KEY (room_id) REFERENCES rooms(room_id) ON DELETE CASCADE
+            )
+        """)
+
         # Chat messages table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS chat_messages (
@@ -93,50 +335,95 @@ class GameDatabase:
             ON players(room_id)
         """)
 
+        # Partial index over just the soft-deleted rooms cleanup_old_rooms purges
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_rooms_cleanup
+            ON rooms(is_active, last_activity)
+            WHERE is_active = 0
+        """)
+
+        # Partial covering index for the active-room filter used by
+        # iter_rooms and its room_id subqueries
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_rooms_active
+            ON rooms(last_activity, room_id, created_at)
+            WHERE is_active = 1
+        """)
+
+        # Covers every column load_chat_messages reads, so chat loads never
+        # touch the table itself (replaces the older (room_id, timestamp) index)
+        cursor.execute("DROP INDEX IF EXISTS idx_chat_room")
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_chat_room
-            ON chat_messages(room_id, timestamp)
+            CREATE INDEX idx_chat_room
+            ON chat_messages(room_id, timestamp, id, player_name, message)
         """)
 
-        self.conn.commit()
-        logger.info("database_schema_created")
+    @contextmanager
+    def transaction(self):
+        """
+        Run the enclosed statements in a single write transaction.
+
+        Takes the write lock up front (BEGIN IMMEDIATE), commits on success
+        and rolls back if the block raises.
+        """
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.rollback()
+            # Rolled-back sections must be rewritten by the next save
+            self._list_cache.clear()
+            raise
+        else:
+            self.conn.commit()
 
     def save_room(self, room_id: str) -> None:
         """
         Save or update a room.
 
+        Does not commit; run inside transaction().
+
         Args:
             room_id: Room ID to save
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO rooms (room_id, last_activity)
-            VALUES (?, CURRENT_TIMESTAMP)
-            ON CONFLICT(room_id) DO UPDATE SET
-                last_activity = CURRENT_TIMESTAMP
-        """, (room_id,))
-        self.conn.commit()
+        self._cursor.execute(_SQL_SAVE_ROOM, (room_id,))
 
     def save_player(self, player: Dict[str, Any], room_id: str, session_id: Optional[str] = None) -> None:
         """
         Save or update a player.
 
+        Does not commit; run inside transaction().
+
         Args:
             player: Player data dictionary
             room_id: Room ID the player belongs to
             session_id: Optional session ID for the player
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO players (player_id, room_id, name, position, is_connected, is_ready, session_id)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(player_id) DO UPDATE SET
-                name = excluded.name,
-                position = excluded.position,
-                is_connected = excluded.is_connected,
-                is_ready = excluded.is_ready,
-                session_id = excluded.session_id
-        """, (
+        self._cursor.execute(_SQL_SAVE_PLAYER, self._player_row(player, room_id, session_id))
+
+    def save_players(self, players: List[Dict[str, Any]], room_id: str) -> None:
+        """
+        Save or update all players of a room with a single multi-row upsert.
+
+        Does not commit; run inside transaction().
+
+        Args:
+            players: Player data dictionaries, each with an optional 'session_id'
+            room_id: Room ID the players belong to
+        """
+        if not players:
+            return
+        params = [
+            value
+            for player in players
+            for value in self._player_row(player, room_id, player.get('session_id'))
+        ]
+        self._cursor.execute(_sql_save_players(len(players)), params)
+
+    @staticmethod
+    def _player_row(player: Dict[str, Any], room_id: str, session_id: Optional[str]) -> tuple:
+        """Build the parameter tuple for _SQL_SAVE_PLAYER."""
+        return (
             player['id'],
             room_id,
             player['name'],
@@ -144,82 +431,98 @@ class GameDatabase:
             player.get('is_connected', False),
             player.get('is_ready', False),
             session_id
-        ))
-        self.conn.commit()
+        )
 
     def save_game_state(self, room_id: str, game_state_dict: Dict[str, Any]) -> None:
         """
         Save complete game state.
 
+        Scalar fields are upserted into game_states on every call; the list
+        sections in LIST_KEYS (with one section per player) are only
+        rewritten when their content changed since the last save through
+        this connection.
+
+        Does not commit; run inside transaction().
+
         Args:
             room_id: Room ID
             game_state_dict: Game state as dictionary (from to_dict())
         """
-        cursor = self.conn.cursor()
-
-        # Extract key fields for indexing
-        phase = game_state_dict.get('phase', 'waiting')
-        current_turn = game_state_dict.get('current_turn', 0)
-        dealer_position = game_state_dict.get('dealer_position', 0)
-        declarer_position = game_state_dict.get('declarer_position')
-        partner_position = game_state_dict.get('partner_position')
-        partner_revealed = game_state_dict.get('partner_revealed', False)
-        called_card_rank = game_state_dict.get('called_card_rank')
-        trick_number = game_state_dict.get('trick_number', 0)
+        scalars = {key: value for key, value in game_state_dict.items() if key not in LIST_KEYS}
 
-        cursor.execute("""
-            INSERT INTO game_states (
-                room_id, phase, current_turn, dealer_position,
-                declarer_position, partner_position, partner_revealed,
-                called_card_rank, trick_number, game_data, updated_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(room_id) DO UPDATE SET
-                phase = excluded.phase,
-                current_turn = excluded.current_turn,
-                dealer_position = excluded.dealer_position,
-                declarer_position = excluded.declarer_position,
-                partner_position = excluded.partner_position,
-                partner_revealed = excluded.partner_revealed,
-                called_card_rank = excluded.called_card_rank,
-                trick_number = excluded.trick_number,
-                game_data = excluded.game_data,
-                updated_at = CURRENT_TIMESTAMP
-        """, (
+        self._cursor.execute(_SQL_SAVE_GAME_STATE, (
             room_id,
-            phase,
-            current_turn,
-            dealer_position,
-            declarer_position,
-            partner_position,
-            partner_revealed,
-            called_card_rank,
-            trick_number,
-            json.dumps(game_state_dict)
+            scalars.get('phase', 'waiting'),
+            scalars.get('current_turn', 0),
+            scalars.get('dealer_position', 0),
+            scalars.get('declarer_position'),
+            scalars.get('partner_position'),
+            scalars.get('partner_revealed', False),
+            scalars.get('called_card_rank'),
+            scalars.get('trick_number', 0),
+            scalars.get('trick_leader'),
+            scalars.get('previous_trick_winner'),
+            self._pack(_dumps(scalars))
         ))
-        self.conn.commit()
+
+        sections = [(key, game_state_dict[key]) for key in LIST_KEYS
+                    if key != 'players' and key in game_state_dict]
+        players = game_state_dict.get('players')
+        if players is not None:
+            if self._list_cache.get((room_id, 'players')) != len(players):
+                # Player count changed (or first save): drop stale sections
+                self._cursor.execute(_SQL_DELETE_PLAYER_SECTIONS, (room_id,))
+                for cache_key in [k for k in self._list_cache
+                                  if k[0] == room_id and k[1].startswith(PLAYER_KEY_PREFIX)]:
+                    del self._list_cache[cache_key]
+                self._list_cache[(room_id, 'players')] = len(players)
+            sections.extend((f"{PLAYER_KEY_PREFIX}{i}", player) for i, player in enumerate(players))
+
+        dirty = []
+        for key, value in sections:
+            json_value = _dumps(value)
+            if self._list_cache.get((room_id, key)) != json_value:
+                self._list_cache[(room_id, key)] = json_value
+                dirty.append((room_id, key, self._pack(json_value)))
+
+        if dirty:
+            self._cursor.executemany(_SQL_SAVE_GAME_STATE_LIST, dirty)
 
     def save_chat_message(self, room_id: str, chat_message: Dict[str, Any]) -> None:
         """
         Save a chat message.
 
+        Does not commit; run inside transaction().
+
         Args:
             room_id: Room ID
             chat_message: Chat message dictionary
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO chat_messages (id, room_id, player_name, message, timestamp)
-            VALUES (?, ?, ?, ?, ?)
-            ON CONFLICT(id) DO NOTHING
-        """, (
+        self._cursor.execute(_SQL_SAVE_CHAT_MESSAGE, self._chat_row(room_id, chat_message))
+
+    def save_chat_messages(self, messages: List[tuple]) -> None:
+        """
+        Save a batch of chat messages with one prepared statement.
+
+        Does not commit; run inside transaction().
+
+        Args:
+            messages: (room_id, chat_message) pairs
+        """
+        self._cursor.executemany(_SQL_SAVE_CHAT_MESSAGE, [
+            self._chat_row(room_id, chat_message) for room_id, chat_message in messages
+        ])
+
+    @staticmethod
+    def _chat_row(room_id: str, chat_message: Dict[str, Any]) -> tuple:
+        """Build the parameter tuple for _SQL_SAVE_CHAT_MESSAGE."""
+        return (
             chat_message['id'],
             room_id,
             chat_message['player_name'],
             chat_message['message'],
             chat_message['timestamp']
-        ))
-        self.conn.commit()
+        )
 
     def load_all_rooms(self) -> List[Dict[str, Any]]:
         """
@@ -228,28 +531,80 @@ class GameDatabase:
         Returns:
             List of room data dictionaries
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT r.room_id, r.created_at, r.last_activity
-            FROM rooms r
-            WHERE r.is_active = 1
-            ORDER BY r.last_activity DESC
-        """)
+        rooms = list(self.iter_rooms())
+        logger.info("loaded_rooms_from_database", count=len(rooms))
+        return rooms
+
+    def iter_rooms(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the data of each active room, most recently active first.
+
+        Players, game states and chat are fetched with one query per table
+        for all rooms at once, inside a single read snapshot, so every
+        room's raw rows are in memory before the first yield. Only the
+        per-room work is lazy: a room's dictionary (including decoding its
+        game state blobs) is built when the caller asks for it, and its
+        rows are released as it is handed out.
 
-        rooms = []
-        for row in cursor.fetchall():
-            room_data = {
-                'room_id': row['room_id'],
+        Yields:
+            Room data dictionaries
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("BEGIN")
+        try:
+            room_rows = cursor.execute("""
+                SELECT r.room_id, r.created_at, r.last_activity
+                FROM rooms r
+                WHERE r.is_active = 1
+                ORDER BY r.last_activity DESC
+            """).fetchall()
+
+            players = _group_by_room(cursor.execute("""
+                SELECT room_id, player_id, name, position, is_connected, is_ready, session_id
+                FROM players
+                WHERE room_id IN (SELECT room_id FROM rooms WHERE is_active = 1)
+                ORDER BY room_id, position
+            """))
+
+            game_data = {row['room_id']: row['game_data'] for row in cursor.execute("""
+                SELECT room_id, game_data
+                FROM game_states
+                WHERE room_id IN (SELECT room_id FROM rooms WHERE is_active = 1)
+            """)}
+
+            game_lists = _group_by_room(cursor.execute("""
+                SELECT room_id, key, json_value
+                FROM game_state_lists
+                WHERE room_id IN (SELECT room_id FROM rooms WHERE is_active = 1)
+                ORDER BY room_id
+            """))
+
+            chat = _group_by_room(cursor.execute("""
+                SELECT room_id, id, player_name, message, timestamp
+                FROM (
+                    SELECT *, ROW_NUMBER() OVER (PARTITION BY room_id ORDER BY timestamp ASC) AS n
+                    FROM chat_messages
+                    WHERE room_id IN (SELECT room_id FROM rooms WHERE is_active = 1)
+                )
+                WHERE n <= 100
+                ORDER BY room_id, timestamp ASC
+            """))
+        finally:
+            self.conn.commit()
+
+        for row in room_rows:
+            room_id = row['room_id']
+            # Pop the grouped rows so they are released as each room is handed out
+            state_data = game_data.pop(room_id, None)
+            yield {
+                'room_id': room_id,
                 'created_at': row['created_at'],
                 'last_activity': row['last_activity'],
-                'players': self.load_players(row['room_id']),
-                'game_state': self.load_game_state(row['room_id']),
-                'chat_messages': self.load_chat_messages(row['room_id'])
+                'players': [_player_from_row(r) for r in players.pop(room_id, [])],
+                'game_state': (self._game_state_from_rows(state_data, game_lists.pop(room_id, []))
+                               if state_data is not None else None),
+                'chat_messages': [_chat_from_row(r) for r in chat.pop(room_id, [])]
             }
-            rooms.append(room_data)
-
-        logger.info("loaded_rooms_from_database", count=len(rooms))
-        return rooms
 
     def load_players(self, room_id: str) -> List[Dict[str, Any]]:
         """
@@ -269,18 +624,7 @@ class GameDatabase:
             ORDER BY position
         """, (room_id,))
 
-        players = []
-        for row in cursor.fetchall():
-            players.append({
-                'id': row['player_id'],
-                'name': row['name'],
-                'position': row['position'],
-                'is_connected': bool(row['is_connected']),
-                'is_ready': bool(row['is_ready']),
-                'session_id': row['session_id']
-            })
-
-        return players
+        return [_player_from_row(row) for row in cursor.fetchall()]
 
     def load_game_state(self, room_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -300,9 +644,15 @@ class GameDatabase:
         """, (room_id,))
 
         row = cursor.fetchone()
-        if row:
-            return json.loads(row['game_data'])
-        return None
+        if not row:
+            return None
+
+        cursor.execute("""
+            SELECT key, json_value
+            FROM game_state_lists
+            WHERE room_id = ?
+        """, (room_id,))
+        return self._game_state_from_rows(row['game_data'], cursor.fetchall())
 
     def load_chat_messages(self, room_id: str, limit: int = 100) -> List[Dict[str, Any]]:
         """
@@ -324,16 +674,38 @@ class GameDatabase:
             LIMIT ?
         """, (room_id, limit))
 
-        messages = []
-        for row in cursor.fetchall():
-            messages.append({
-                'id': row['id'],
-                'player_name': row['player_name'],
-                'message': row['message'],
-                'timestamp': row['timestamp']
-            })
-
-        return messages
+        return [_chat_from_row(row) for row in cursor.fetchall()]
+
+    def _pack(self, data):
+        """Compress an encoded blob with zstd when available and worthwhile."""
+        if self._zctx is None or len(data) < _COMPRESS_MIN_BYTES:
+            return data
+        if isinstance(data, str):
+            data = data.encode()
+        return self._zctx.compress(data)
+
+    def _unpack(self, data) -> Any:
+        """Decode a blob written by _pack, compressed or not."""
+        if isinstance(data, bytes) and data[:4] == _ZSTD_MAGIC:
+            if self._zdctx is None:
+                raise RuntimeError("zstandard is required to read compressed game state")
+            data = self._zdctx.decompress(data)
+        return _loads(data)
+
+    def _game_state_from_rows(self, game_data, list_rows: List[sqlite3.Row]) -> Dict[str, Any]:
+        """Merge the scalar game_data blob with its game_state_lists sections."""
+        # Older rows carry the lists inline in game_data; section rows take precedence
+        game_state_dict = self._unpack(game_data)
+        players = {}
+        for row in list_rows:
+            key = row['key']
+            if key.startswith(PLAYER_KEY_PREFIX):
+                players[int(key[len(PLAYER_KEY_PREFIX):])] = self._unpack(row['json_value'])
+            else:
+                game_state_dict[key] = self._unpack(row['json_value'])
+        if players:
+            game_state_dict['players'] = [players[i] for i in sorted(players)]
+        return game_state_dict
 
     def delete_room(self, room_id: str) -> None:
         """
@@ -342,13 +714,11 @@ class GameDatabase:
         Args:
             room_id: Room ID to delete
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
+        self.conn.execute("""
             UPDATE rooms
             SET is_active = 0
             WHERE room_id = ?
         """, (room_id,))
-        self.conn.commit()
         logger.info("room_marked_inactive", room_id=room_id)
 
     def hard_delete_room(self, room_id: str) -> None:
@@ -358,9 +728,8 @@ class GameDatabase:
         Args:
             room_id: Room ID to delete
         """
-        cursor = self.conn.cursor()
-        cursor.execute("DELETE FROM rooms WHERE room_id = ?", (room_id,))
-        self.conn.commit()
+        self.conn.execute("DELETE FROM rooms WHERE room_id = ?", (room_id,))
+        self._list_cache.clear()
         logger.info("room_deleted", room_id=room_id)
 
     def cleanup_old_rooms(self, days: int = 7) -> int:
@@ -373,15 +742,19 @@ class GameDatabase:
         Returns:
             Number of rooms deleted
         """
+        # Same format as CURRENT_TIMESTAMP so the comparison can use idx_rooms_cleanup
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).strftime('%Y-%m-%d %H:%M:%S')
         cursor = self.conn.cursor()
         cursor.execute("""
             DELETE FROM rooms
             WHERE is_active = 0
-            AND last_activity < datetime('now', '-' || ? || ' days')
-        """, (days,))
+            AND last_activity < ?
+        """, (cutoff,))
 
         deleted_count = cursor.rowcount
-        self.conn.commit()
+        if deleted_count > 0:
+            self._list_cache.clear()
+        self.wal_checkpoint()
 
         if deleted_count > 0:
             logger.info("cleaned_up_old_rooms", count=deleted_count, days=days)
@@ -390,12 +763,10 @@ class GameDatabase:
 
     def mark_all_players_disconnected(self) -> None:
         """Mark all players as disconnected (call on server startup)."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
+        self.conn.execute("""
             UPDATE players
             SET is_connected = 0, session_id = NULL
         """)
-        self.conn.commit()
         logger.info("marked_all_players_disconnected")
 
     def update_player_session(self, player_id: str, session_id: str, is_connected: bool = True) -> None:
@@ -407,13 +778,11 @@ class GameDatabase:
             session_id: New session ID
             is_connected: Connection status
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
+        self.conn.execute("""
             UPDATE players
             SET session_id = ?, is_connected = ?
             WHERE player_id = ?
         """, (session_id, is_connected, player_id))
-        self.conn.commit()
 
     def get_room_by_player_id(self, player_id: str) -> Optional[str]:
         """
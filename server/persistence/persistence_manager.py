@@ -1,11 +1,14 @@
 """Persistence manager for coordinating room and game state persistence."""
 
 import asyncio
-from typing import Optional, Dict, Any
+import time
+import traceback
+from typing import Optional, Dict, Any, List
 import structlog
 from datetime import datetime
 
 from persistence.database import GameDatabase
+from persistence.storage_worker import StorageWorker
 from networking.room_manager import Room, RoomManager
 from models.game_state import GameState, GamePhase
 from models.player import Player
@@ -26,68 +29,141 @@ class PersistenceManager:
     - Coordinated saves across room, players, game state, and chat
     """
 
-    def __init__(self, db_path: str = "data/tarokk_game.db"):
+    def __init__(self, db_path: str = "data/tarokk_game.db", save_interval: float = 0.25):
         """
         Initialize persistence manager.
 
         Args:
             db_path: Path to SQLite database
+            save_interval: Minimum seconds between two writes of the same room;
+                saves inside the window are coalesced into one
         """
-        self.db = GameDatabase(db_path)
+        # All writes go through the worker thread (which also creates the schema);
+        # self.db is a query-only connection for the load paths
+        self.worker = StorageWorker(db_path)
+        self.db = GameDatabase(db_path, read_only=True)
+        self.save_interval = save_interval
         self._save_queue: Dict[str, float] = {}  # room_id -> last_save_time
-        self._save_lock = asyncio.Lock()
+        self._pending: Dict[str, Room] = {}  # room_id -> room waiting for the next flush
+        self._flush_task: Optional[asyncio.Task] = None
+        self._chat_buffer: List[tuple] = []  # (room_id, chat_message) waiting for the next chat flush
+        self._chat_flush: Optional[asyncio.TimerHandle] = None
+        # room_id -> (players, game_state_dict) last written; touched only by the worker thread
+        self._last_written: Dict[str, tuple] = {}
         logger.info("persistence_manager_initialized")
 
     async def save_room_complete(self, room: Room) -> None:
         """
         Save complete room state including players, game state, and chat.
 
+        A room saved less than save_interval ago is only marked pending;
+        the latest state is written when the window closes.
+
         Args:
             room: Room object to save
         """
+        now = time.monotonic()
+        if now - self._save_queue.get(room.room_id, 0.0) < self.save_interval:
+            self._pending[room.room_id] = room
+            if self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush_pending())
+            return
+
+        self._queue_room(room, now)
+
+    async def _flush_pending(self) -> None:
+        """Write the rooms coalesced during the current save window."""
+        await asyncio.sleep(self.save_interval)
+        self._flush_task = None
+        self._flush_rooms()
+
+    async def flush(self) -> None:
+        """Write every pending room and chat message now and wait until the worker has committed it."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self._flush_rooms()
+        self._flush_chats()
+        await asyncio.wrap_future(self.worker.submit(lambda db: None, batch=False))
+
+    def _flush_rooms(self) -> None:
+        """Queue the latest state of every pending room; the worker commits them together."""
+        pending, self._pending = self._pending, {}
+        now = time.monotonic()
+        for room in pending.values():
+            self._queue_room(room, now)
+
+    def _queue_room(self, room: Room, now: float) -> None:
+        """Snapshot a room on the event loop and hand it to the storage worker."""
         try:
-            async with self._save_lock:
-                # Save room metadata
-                self.db.save_room(room.room_id)
-
-                # Save all players
-                for player in room.game_state.players:
-                    player_dict = {
-                        'id': player.id,
-                        'name': player.name,
-                        'position': player.position,
-                        'is_connected': player.is_connected,
-                        'is_ready': player.is_ready,
-                    }
-                    session_id = room.player_sessions.get(player.id)
-                    self.db.save_player(player_dict, room.room_id, session_id)
-
-                # Save game state
-                game_state_dict = room.game_state.to_dict(include_all_hands=True)
-                self.db.save_game_state(room.room_id, game_state_dict)
-
-                # Note: Chat messages are saved individually in real-time
-                # to avoid data loss, so we don't need to save them here
-
-                logger.debug("room_saved", room_id=room.room_id,
-                           phase=room.game_state.phase.value,
-                           players=len(room.game_state.players))
+            players = [
+                {
+                    'id': player.id,
+                    'name': player.name,
+                    'position': player.position,
+                    'is_connected': player.is_connected,
+                    'is_ready': player.is_ready,
+                    'session_id': room.player_sessions.get(player.id),
+                }
+                for player in room.game_state.players
+            ]
+            game_state_dict = room.game_state.to_dict(include_all_hands=True)
+
+            self.worker.submit(self._write_room, room.room_id, players, game_state_dict,
+                               on_rollback=lambda room_id=room.room_id: self._last_written.pop(room_id, None))
+            self._save_queue[room.room_id] = now
+
+            # Note: Chat messages are saved individually in real-time
+            # to avoid data loss, so we don't need to save them here
 
         except Exception as e:
             logger.error("save_room_error", room_id=room.room_id, error=str(e))
 
+    def _write_room(self, db: GameDatabase, room_id: str, players: List[Dict[str, Any]],
+                    game_state_dict: Dict[str, Any]) -> None:
+        """
+        Write one room snapshot (runs on the storage worker thread).
+
+        Snapshots equal to the last one written for the room are skipped.
+        The snapshot is remembered as soon as it is written, so a later job
+        in the same transaction compares against it; if the transaction is
+        rolled back, on_rollback forgets it and the retry writes again.
+        """
+        snapshot = (players, game_state_dict)
+        if self._last_written.get(room_id) == snapshot:
+            return
+        self._last_written[room_id] = snapshot
+        db.save_room(room_id)
+        db.save_players(players, room_id)
+        db.save_game_state(room_id, game_state_dict)
+
     def save_chat_message(self, room_id: str, chat_message: Dict[str, Any]) -> None:
         """
-        Save a single chat message immediately.
+        Buffer a chat message for writing.
+
+        Messages arriving within 50 ms of each other are written together
+        with one executemany in a single transaction.
 
         Args:
             room_id: Room ID
             chat_message: Chat message dictionary
         """
+        self._chat_buffer.append((room_id, chat_message))
+        if self._chat_flush is None:
+            self._chat_flush = asyncio.get_running_loop().call_later(0.05, self._flush_chats)
+
+    def _flush_chats(self) -> None:
+        """Hand every buffered chat message to the storage worker as one job."""
+        if self._chat_flush is not None:
+            self._chat_flush.cancel()
+            self._chat_flush = None
+        if not self._chat_buffer:
+            return
+        messages, self._chat_buffer = self._chat_buffer, []
         try:
-            self.db.save_chat_message(room_id, chat_message)
+            self.worker.submit(GameDatabase.save_chat_messages, messages)
         except Exception as e:
-            logger.error("save_chat_message_error", room_id=room_id, error=str(e))
+            logger.error("save_chat_message_error", count=len(messages), error=str(e))
 
     async def load_all_rooms(self, room_manager: RoomManager) -> int:
         """
@@ -103,47 +179,19 @@ class PersistenceManager:
             logger.info("persistence_load_starting")
 
             # Mark all players as disconnected on startup
-            self.db.mark_all_players_disconnected()
+            await asyncio.wrap_future(
+                self.worker.submit(GameDatabase.mark_all_players_disconnected, batch=False))
             logger.info("marked_all_players_disconnected")
 
-            # Load room data from database
-            rooms_data = self.db.load_all_rooms()
-            logger.info("database_rooms_found", count=len(rooms_data))
-
+            # Each room is decoded and installed as iter_rooms hands it out
+            rooms_in_database = 0
             loaded_count = 0
-            for room_data in rooms_data:
+            for room_data in self.db.iter_rooms():
+                rooms_in_database += 1
                 try:
-                    room_id = room_data.get('room_id', 'unknown')
-                    logger.info("loading_room",
-                               room_id=room_id,
-                               players_count=len(room_data.get('players', [])),
-                               has_game_state=room_data.get('game_state') is not None,
-                               chat_messages=len(room_data.get('chat_messages', [])))
-
                     # Reconstruct Room object
                     room = self._reconstruct_room(room_data)
-
-                    # Log reconstructed room details
-                    player_details = [
-                        {
-                            'name': p.name,
-                            'position': p.position,
-                            'hand_size': len(p.hand),
-                            'tricks_won': len(p.tricks_won),
-                            'discards': len(p.discard_pile)
-                        }
-                        for p in room.game_state.players
-                    ]
-
-                    logger.info("room_reconstructed",
-                              room_id=room.room_id,
-                              phase=room.game_state.phase.value,
-                              trick_number=room.game_state.trick_number,
-                              current_turn=room.game_state.current_turn,
-                              players=player_details,
-                              talon_size=len(room.game_state.talon),
-                              current_trick_size=len(room.game_state.current_trick),
-                              bid_history_size=len(room.game_state.bid_history))
+                    game_state = room.game_state
 
                     # Add to room manager
                     room_manager.rooms[room.room_id] = room
@@ -151,10 +199,15 @@ class PersistenceManager:
                     # Note: session_to_room mappings will be rebuilt as players reconnect
 
                     loaded_count += 1
+                    # One summary line per room instead of per-player/per-step logging
                     logger.info("room_loaded_successfully",
                               room_id=room.room_id,
-                              players=len(room.game_state.players),
-                              phase=room.game_state.phase.value)
+                              players=len(game_state.players),
+                              phase=game_state.phase.value,
+                              trick_number=game_state.trick_number,
+                              current_turn=game_state.current_turn,
+                              talon_size=len(game_state.talon),
+                              chat_messages=len(room.chat_messages))
 
                 except Exception as e:
                     logger.error("load_room_error",
@@ -162,21 +215,19 @@ class PersistenceManager:
                                error=str(e),
                                error_type=type(e).__name__,
                                traceback=True)
-                    import traceback
                     logger.error("load_room_traceback",
                                traceback=traceback.format_exc())
                     continue
 
             logger.info("persistence_load_complete",
                        rooms_loaded=loaded_count,
-                       rooms_in_database=len(rooms_data))
+                       rooms_in_database=rooms_in_database)
             return loaded_count
 
         except Exception as e:
             logger.error("load_all_rooms_error",
                         error=str(e),
                         error_type=type(e).__name__)
-            import traceback
             logger.error("load_all_rooms_traceback",
                         traceback=traceback.format_exc())
             return 0
@@ -192,7 +243,6 @@ class PersistenceManager:
             Reconstructed Room object
         """
         room_id = room_data['room_id']
-        logger.debug("reconstructing_room", room_id=room_id)
 
         # Create room
         room = Room(room_id=room_id)
@@ -200,37 +250,23 @@ class PersistenceManager:
         # Reconstruct game state (includes players with all their cards)
         game_state_dict = room_data.get('game_state')
         if game_state_dict:
-            logger.debug("reconstructing_game_state",
-                        room_id=room_id,
-                        phase=game_state_dict.get('phase'),
-                        players_in_json=len(game_state_dict.get('players', [])))
             room.game_state = self._reconstruct_game_state(game_state_dict)
-            logger.debug("game_state_reconstructed",
-                        room_id=room_id,
-                        players_loaded=len(room.game_state.players))
         else:
             # No game state saved, create fresh one
             logger.warning("no_game_state_in_database", room_id=room_id)
             room.game_state = GameState()
 
         # Update player connection status from players table (all disconnected after restart)
+        players_by_id = {player.id: player for player in room.game_state.players}
         for player_data in room_data.get('players', []):
-            player = room.game_state.get_player_by_id(player_data['id'])
+            player = players_by_id.get(player_data['id'])
             if player:
                 # Update connection status (should be False after restart)
                 player.is_connected = False
                 player.is_ready = player_data.get('is_ready', False)
-                logger.debug("player_connection_updated",
-                           room_id=room_id,
-                           player_id=player_data['id'],
-                           player_name=player.name,
-                           is_ready=player.is_ready)
 
         # Restore chat history
         room.chat_messages = room_data.get('chat_messages', [])
-        logger.debug("chat_history_restored",
-                    room_id=room_id,
-                    message_count=len(room.chat_messages))
 
         return room
 
@@ -244,10 +280,6 @@ class PersistenceManager:
         Returns:
             Reconstructed GameState object
         """
-        logger.debug("reconstructing_game_state_start",
-                    game_id=game_state_dict.get('game_id'),
-                    phase=game_state_dict.get('phase'))
-
         game_state = GameState()
 
         # Basic fields
@@ -263,24 +295,18 @@ class PersistenceManager:
         game_state.trick_leader = game_state_dict.get('trick_leader')
         game_state.previous_trick_winner = game_state_dict.get('previous_trick_winner')
 
-        logger.debug("game_state_basic_fields_set",
-                    phase=game_state.phase.value,
-                    trick_number=game_state.trick_number,
-                    current_turn=game_state.current_turn,
-                    declarer=game_state.declarer_position,
-                    partner=game_state.partner_position)
-
         # Lists
         game_state.players_who_discarded = game_state_dict.get('players_who_discarded', [])
 
+        # Bind hot names locally; card lists are rebuilt with map() over Card.from_dict
+        from_dict = Card.from_dict
+        reconstruct_announcement = self._reconstruct_announcement
+
         # Reconstruct bid history
-        game_state.bid_history = []
-        for bid_dict in game_state_dict.get('bid_history', []):
-            bid = Bid(
-                player_position=bid_dict['player_position'],
-                bid_type=BidType(bid_dict['bid_type'])
-            )
-            game_state.bid_history.append(bid)
+        game_state.bid_history = [
+            Bid(player_position=bid_dict['player_position'], bid_type=BidType(bid_dict['bid_type']))
+            for bid_dict in game_state_dict.get('bid_history', [])
+        ]
 
         # Set winning bid if exists
         winning_bid_dict = game_state_dict.get('winning_bid')
@@ -291,80 +317,38 @@ class PersistenceManager:
             )
 
         # Reconstruct talon
-        game_state.talon = [
-            self._reconstruct_card(card_dict)
-            for card_dict in game_state_dict.get('talon', [])
-        ]
+        game_state.talon = list(map(from_dict, game_state_dict.get('talon', [])))
 
         # Reconstruct current trick
-        game_state.current_trick = []
-        for trick_card in game_state_dict.get('current_trick', []):
-            player_pos = trick_card['player_position']
-            card = self._reconstruct_card(trick_card['card'])
-            game_state.current_trick.append((player_pos, card))
-
-        # Reconstruct announcements
-        game_state.announcements = []
-        for ann_dict in game_state_dict.get('announcements', []):
-            announcement = Announcement(
-                player_position=ann_dict['player_position'],
-                announcement_type=AnnouncementType(ann_dict['announcement_type']),
-                announced=ann_dict['announced']
-            )
-            announcement.contra = ann_dict.get('contra', False)
-            announcement.recontra = ann_dict.get('recontra', False)
-            announcement.contra_by = ann_dict.get('contra_by')
-            announcement.recontra_by = ann_dict.get('recontra_by')
-            game_state.announcements.append(announcement)
-
-        # Reconstruct announcement history
-        game_state.announcement_history = []
-        for ann_hist in game_state_dict.get('announcement_history', []):
-            if ann_hist is None:
-                game_state.announcement_history.append(None)
-            else:
-                announcement = Announcement(
-                    player_position=ann_hist['player_position'],
-                    announcement_type=AnnouncementType(ann_hist['announcement_type']),
-                    announced=ann_hist['announced']
-                )
-                announcement.contra = ann_hist.get('contra', False)
-                announcement.recontra = ann_hist.get('recontra', False)
-                announcement.contra_by = ann_hist.get('contra_by')
-                announcement.recontra_by = ann_hist.get('recontra_by')
-                game_state.announcement_history.append(announcement)
+        game_state.current_trick = [
+            (trick_card['player_position'], from_dict(trick_card['card']))
+            for trick_card in game_state_dict.get('current_trick', [])
+        ]
+
+        # Reconstruct announcements and their history (None marks a pass)
+        game_state.announcements = [
+            reconstruct_announcement(ann_dict)
+            for ann_dict in game_state_dict.get('announcements', [])
+        ]
+        game_state.announcement_history = [
+            reconstruct_announcement(ann_hist) if ann_hist is not None else None
+            for ann_hist in game_state_dict.get('announcement_history', [])
+        ]
 
         # Reconstruct trick history
         game_state.trick_history = game_state_dict.get('trick_history', [])
-        logger.debug("trick_history_loaded", tricks=len(game_state.trick_history))
 
         # Reconstruct players with their cards
-        logger.debug("reconstructing_players",
-                    player_count=len(game_state_dict.get('players', [])))
-
         game_state.players = []
-        for idx, player_dict in enumerate(game_state_dict.get('players', [])):
-            logger.debug("reconstructing_player",
-                        player_index=idx,
-                        player_id=player_dict.get('id'),
-                        player_name=player_dict.get('name'),
-                        position=player_dict.get('position'),
-                        hand_cards_in_dict=len(player_dict.get('hand', [])),
-                        tricks_cards_in_dict=len(player_dict.get('tricks_won', [])),
-                        discard_cards_in_dict=len(player_dict.get('discard_pile', [])))
-
+        for player_dict in game_state_dict.get('players', []):
             # Reconstruct hand
-            hand = [self._reconstruct_card(card_dict) for card_dict in player_dict.get('hand', [])]
-            logger.debug("player_hand_reconstructed",
-                        player_name=player_dict['name'],
-                        hand_size=len(hand),
-                        first_card=hand[0].rank if hand else None)
+            hand = list(map(from_dict, player_dict.get('hand', [])))
 
             # Reconstruct tricks_won
-            tricks_won = [self._reconstruct_card(card_dict) for card_dict in player_dict.get('tricks_won', [])]
+            tricks_won = list(map(from_dict, player_dict.get('tricks_won', [])))
 
             # Reconstruct discard_pile
-            discard_pile = [self._reconstruct_card(card_dict) for card_dict in player_dict.get('discard_pile', [])]
+            discard_pile = list(map(from_dict, player_dict.get('discard_pile', [])))
 
             # Create player
             player = Player(
@@ -382,62 +366,28 @@ class PersistenceManager:
             player.id = player_dict['id']
             game_state.players.append(player)
 
-            logger.debug("player_reconstructed",
-                        player_id=player.id,
-                        player_name=player.name,
-                        position=player.position,
-                        hand_size=len(player.hand),
-                        tricks_won_size=len(player.tricks_won),
-                        discard_pile_size=len(player.discard_pile),
-                        is_declarer=player.is_declarer,
-                        is_partner=player.is_partner)
-
-        logger.debug("all_players_reconstructed", total_players=len(game_state.players))
-
         return game_state
 
-    def _reconstruct_player(self, player_data: Dict[str, Any], game_state: GameState) -> Player:
+    @staticmethod
+    def _reconstruct_announcement(ann_dict: Dict[str, Any]) -> Announcement:
         """
-        Reconstruct a Player object from persisted data.
+        Reconstruct an Announcement from dictionary.
 
         Args:
-            player_data: Player data dictionary
-            game_state: GameState to link player to
+            ann_dict: Announcement dictionary
 
         Returns:
-            Reconstructed Player object
+            Reconstructed Announcement object
         """
-        # Try to find player in game state (already reconstructed from game_state_dict)
-        existing_player = game_state.get_player_by_id(player_data['id'])
-
-        if existing_player:
-            # Update connection status from player_data
-            existing_player.is_connected = player_data.get('is_connected', False)
-            existing_player.is_ready = player_data.get('is_ready', False)
-            return existing_player
-        else:
-            # Create new player (shouldn't happen normally)
-            player = Player(
-                name=player_data['name'],
-                position=player_data['position']
-            )
-            player.id = player_data['id']
-            player.is_connected = player_data.get('is_connected', False)
-            player.is_ready = player_data.get('is_ready', False)
-            return player
-
-    def _reconstruct_card(self, card_dict: Dict[str, Any]) -> Card:
-        """
-        Reconstruct a Card object from dictionary.
-
-        Args:
-            card_dict: Card dictionary
-
-        Returns:
-            Reconstructed Card object
-        """
-        from models.card import Card
-        return Card.from_dict(card_dict)
+        return Announcement(
+            player_position=ann_dict['player_position'],
+            announcement_type=AnnouncementType(ann_dict['announcement_type']),
+            announced=ann_dict['announced'],
+            contra=ann_dict.get('contra', False),
+            recontra=ann_dict.get('recontra', False),
+            contra_by=ann_dict.get('contra_by'),
+            recontra_by=ann_dict.get('recontra_by')
+        )
 
     async def delete_room(self, room_id: str) -> None:
         """
@@ -447,12 +397,23 @@ class PersistenceManager:
             room_id: Room ID to delete
         """
         try:
-            async with self._save_lock:
-                self.db.delete_room(room_id)
-                logger.info("room_deleted_from_persistence", room_id=room_id)
+            # Write buffered chat and the room's coalesced last state first
+            # so the delete lands after them
+            self._flush_chats()
+            room = self._pending.pop(room_id, None)
+            if room is not None:
+                self._queue_room(room, time.monotonic())
+            await asyncio.wrap_future(
+                self.worker.submit(self._delete_room, room_id, batch=False))
+            logger.info("room_deleted_from_persistence", room_id=room_id)
         except Exception as e:
             logger.error("delete_room_error", room_id=room_id, error=str(e))
 
+    def _delete_room(self, db: GameDatabase, room_id: str) -> None:
+        """Soft-delete a room (runs on the storage worker thread)."""
+        self._last_written.pop(room_id, None)
+        db.delete_room(room_id)
+
     async def cleanup_old_rooms(self, days: int = 7) -> None:
         """
         Clean up old inactive rooms.
@@ -461,12 +422,34 @@ class PersistenceManager:
             days: Delete rooms inactive for this many days
         """
         try:
-            count = self.db.cleanup_old_rooms(days)
+            count = await asyncio.wrap_future(
+                self.worker.submit(GameDatabase.cleanup_old_rooms, days, batch=False))
             if count > 0:
                 logger.info("cleaned_up_old_rooms", count=count)
+                await self.vacuum()
         except Exception as e:
             logger.error("cleanup_error", error=str(e))
 
+    async def vacuum(self) -> None:
+        """Compact the database file on the writer thread."""
+        await asyncio.wrap_future(self.worker.submit(GameDatabase.vacuum, batch=False))
+
+    async def backup(self, dest_path: str) -> None:
+        """
+        Snapshot the database to dest_path without stopping the server.
+
+        Args:
+            dest_path: Path of the backup file (must not exist yet)
+        """
+        await self.flush()
+        await asyncio.wrap_future(self.worker.submit(GameDatabase.backup, dest_path, batch=False))
+
     def close(self):
-        """Close database connection."""
+        """Flush pending and queued writes and close database connections."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self._flush_rooms()
+        self._flush_chats()
+        self.worker.close()
         self.db.close()
@@ -0,0 +1,149 @@
+"""Single background thread that performs all SQLite writes."""
+
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+
+import structlog
+
+from persistence.database import GameDatabase
+
+logger = structlog.get_logger()
+
+
+class _Job(NamedTuple):
+    fn: Callable[..., Any]
+    args: Tuple[Any, ...]
+    future: Future
+    batch: bool
+    on_rollback: Optional[Callable[[], None]]
+
+
+class StorageWorker:
+    """
+    Serializes database writes onto one thread with its own connection.
+
+    Callers enqueue `fn(db, *args)` jobs and return immediately, so fsyncs
+    never run on the asyncio event loop. Queued batchable jobs are drained
+    together and committed in a single transaction.
+    """
+
+    def __init__(self, db_path: str, max_batch: int = 64):
+        """
+        Start the writer thread and wait until its connection is open.
+
+        Args:
+            db_path: Path to the SQLite database file
+            max_batch: Maximum number of jobs committed in one transaction
+        """
+        self.max_batch = max_batch
+        self._queue: queue.SimpleQueue[Optional[_Job]] = queue.SimpleQueue()
+        self._ready = threading.Event()
+        self._startup_error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, args=(db_path,),
+                                        name="storage-worker", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._startup_error is not None:
+            raise self._startup_error
+
+    def submit(self, fn: Callable[..., Any], *args: Any, batch: bool = True,
+               on_rollback: Optional[Callable[[], None]] = None) -> Future:
+        """
+        Queue a write job.
+
+        Args:
+            fn: Callable invoked as fn(db, *args) on the writer thread
+            *args: Extra arguments for fn
+            batch: Run inside a shared transaction with other queued jobs.
+                Pass False for jobs that commit on their own.
+            on_rollback: Called on the writer thread whenever the transaction
+                running this job is rolled back, before the job is retried
+                on its own or failed. Jobs that cache what they wrote use it
+                to forget the discarded write.
+
+        Returns:
+            Future resolved with fn's return value
+        """
+        future: Future = Future()
+        self._queue.put(_Job(fn, args, future, batch, on_rollback))
+        return future
+
+    def close(self) -> None:
+        """Finish all queued jobs, then close the writer connection."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+    def _run(self, db_path: str) -> None:
+        try:
+            db = GameDatabase(db_path)
+        except BaseException as e:
+            self._startup_error = e
+            self._ready.set()
+            return
+        self._ready.set()
+
+        try:
+            stopping = False
+            while not stopping:
+                job = self._queue.get()
+                if job is None:
+                    break
+                jobs = [job]
+                while len(jobs) < self.max_batch:
+                    try:
+                        job = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if job is None:
+                        stopping = True
+                        break
+                    jobs.append(job)
+                self._execute(db, jobs)
+        finally:
+            db.close()
+
+    def _execute(self, db: GameDatabase, jobs: List[_Job]) -> None:
+        """Run jobs in order, grouping consecutive batchable jobs into one transaction."""
+        pending: List[_Job] = []
+        for job in jobs:
+            if job.batch:
+                pending.append(job)
+                continue
+            if pending:
+                self._run_transaction(db, pending)
+                pending = []
+            self._run_job(db, job)
+        if pending:
+            self._run_transaction(db, pending)
+
+    def _run_transaction(self, db: GameDatabase, jobs: List[_Job]) -> None:
+        try:
+            with db.transaction():
+                results = [job.fn(db, *job.args) for job in jobs]
+        except Exception as e:
+            for job in jobs:
+                if job.on_rollback is not None:
+                    job.on_rollback()
+            if len(jobs) > 1:
+                # Retry one by one so a single bad job doesn't drop the batch
+                for job in jobs:
+                    self._run_transaction(db, [job])
+                return
+            logger.error("storage_job_error", job=jobs[0].fn.__name__, error=str(e))
+            jobs[0].future.set_exception(e)
+            return
+
+        for job, result in zip(jobs, results, strict=True):
+            job.future.set_result(result)
+
+    def _run_job(self, db: GameDatabase, job: _Job) -> None:
+        try:
+            result = job.fn(db, *job.args)
+        except Exception as e:
+            logger.error("storage_job_error", job=job.fn.__name__, error=str(e))
+            job.future.set_exception(e)
+            return
+        job.future.set_result(result)
@@ -0,0 +1,26 @@
+"""Shared fixtures and helpers for the persistence tests."""
+
+import threading
+
+import pytest
+
+
+def fail_job(db):
+    """Storage job that always fails, rolling back its transaction."""
+    raise RuntimeError("boom")
+
+
+def run_in_one_batch(worker, submit_jobs):
+    """Hold the worker while submit_jobs() queues, so its jobs are drained together."""
+    release = threading.Event()
+    worker.submit(lambda db: release.wait(), batch=False)
+    futures = submit_jobs()
+    release.set()
+    worker.submit(lambda db: None, batch=False).result(timeout=5)
+    return futures
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Path of a fresh database file."""
+    return str(tmp_path / "game.db")
@@ -0,0 +1,237 @@
+"""Tests for the SQLite game database layout."""
+
+import copy
+import json
+import sqlite3
+
+import pytest
+
+from persistence.database import LIST_KEYS, SCHEMA_VERSION, GameDatabase
+
+
+def make_game_state(num_players: int = 4) -> dict:
+    """Game state dictionary shaped like GameState.to_dict(include_all_hands=True)."""
+    return {
+        'phase': 'playing',
+        'current_turn': 2,
+        'dealer_position': 0,
+        'declarer_position': 1,
+        'partner_position': 3,
+        'partner_revealed': False,
+        'called_card_rank': 'XX',
+        'trick_number': 3,
+        'trick_leader': 1,
+        'previous_trick_winner': 1,
+        'players': [
+            {
+                'id': f'p{i}',
+                'name': f'Player {i}',
+                'position': i,
+                'hand': [{'suit': 'tarokk', 'rank': str(i + 1), 'points': 1}],
+                'tricks_won': [],
+                'discard_pile': [],
+            }
+            for i in range(num_players)
+        ],
+        'bid_history': [{'player_position': 1, 'bid_type': 'three'}],
+        'talon': [],
+        'current_trick': [{'player_position': 1, 'card': {'suit': 'hearts', 'rank': 'K'}}],
+        'announcements': [],
+        'announcement_history': [],
+        'trick_history': [],
+        'players_who_discarded': [0, 1, 2, 3],
+    }
+
+
+def save(db: GameDatabase, room_id: str, game_state: dict) -> None:
+    """Save a room and its game state the way the storage worker does."""
+    with db.transaction():
+        db.save_room(room_id)
+        db.save_game_state(room_id, game_state)
+
+
+def section_keys(db: GameDatabase, room_id: str) -> set:
+    rows = db.conn.execute("SELECT key FROM game_state_lists WHERE room_id = ?", (room_id,))
+    return {row['key'] for row in rows}
+
+
+@pytest.fixture
+def db(db_path):
+    """Writable database on a fresh file."""
+    db = GameDatabase(db_path)
+    yield db
+    db.close()
+
+
+def reopen_and_load(db_path: str, room_id: str) -> dict:
+    """Load a room's game state through a brand new connection."""
+    reader = GameDatabase(db_path, read_only=True)
+    try:
+        return reader.load_game_state(room_id)
+    finally:
+        reader.close()
+
+
+def test_game_state_round_trip(db, db_path):
+    """A saved game state loads back unchanged after reopening the database."""
+    game_state = make_game_state()
+    save(db, "room-1", game_state)
+
+    assert reopen_and_load(db_path, "room-1") == game_state
+    expected = {key for key in LIST_KEYS if key != 'players'} | {f'players/{i}' for i in range(4)}
+    assert section_keys(db, "room-1") == expected
+
+
+def test_unchanged_sections_are_not_rewritten(db):
+    """Saving the same state again only rewrites the scalar row."""
+    game_state = make_game_state()
+    save(db, "room-1", game_state)
+
+    changes = db.conn.total_changes
+    save(db, "room-1", game_state)
+
+    # rooms and game_states upserts only
+    assert db.conn.total_changes - changes == 2
+
+
+def test_changed_section_is_rewritten_after_unchanged_save(db, db_path):
+    """A section changed after an "unchanged" save is written and loads back."""
+    game_state = make_game_state()
+    save(db, "room-1", game_state)
+    save(db, "room-1", game_state)
+
+    changed = copy.deepcopy(game_state)
+    changed['players'][2]['hand'] = []
+    changed['current_trick'].append({'player_position': 2, 'card': {'suit': 'hearts', 'rank': 'Q'}})
+    changes = db.conn.total_changes
+    save(db, "room-1", changed)
+
+    # rooms, game_states, current_trick and players/2
+    assert db.conn.total_changes - changes == 4
+    assert reopen_and_load(db_path, "room-1") == changed
+
+
+def test_rolled_back_sections_are_rewritten(db, db_path):
+    """Sections written by a rolled-back transaction are written again by the next save."""
+    game_state = make_game_state()
+    save(db, "room-1", game_state)
+
+    changed = copy.deepcopy(game_state)
+    changed['talon'] = [{'suit': 'tarokk', 'rank': 'XXI', 'points': 5}]
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.save_game_state("room-1", changed)
+            raise RuntimeError("rollback")
+    assert reopen_and_load(db_path, "room-1") == game_state
+
+    save(db, "room-1", changed)
+    assert reopen_and_load(db_path, "room-1") == changed
+
+
+def test_player_count_change_drops_stale_sections(db, db_path):
+    """Removing a player deletes that player's section."""
+    save(db, "room-1", make_game_state(3))
+    save(db, "room-1", make_game_state(2))
+
+    assert {'players/0', 'players/1'} <= section_keys(db, "room-1")
+    assert 'players/2' not in section_keys(db, "room-1")
+    assert reopen_and_load(db_path, "room-1") == make_game_state(2)
+
+
+def test_iter_rooms_round_trip(db, db_path):
+    """iter_rooms returns the players, game state and chat saved for each room."""
+    game_state = make_game_state()
+    players = [
+        {'id': f'p{i}', 'name': f'Player {i}', 'position': i,
+         'is_connected': True, 'is_ready': True, 'session_id': f'sid-{i}'}
+        for i in range(4)
+    ]
+    chat = {'id': 'm1', 'player_name': 'Player 0', 'message': 'hello', 'timestamp': 1}
+    with db.transaction():
+        db.save_room("room-1")
+        db.save_players(players, "room-1")
+        db.save_game_state("room-1", game_state)
+        db.save_chat_messages([("room-1", chat)])
+
+    reader = GameDatabase(db_path, read_only=True)
+    try:
+        rooms = list(reader.iter_rooms())
+    finally:
+        reader.close()
+
+    assert len(rooms) == 1
+    assert rooms[0]['room_id'] == "room-1"
+    assert rooms[0]['players'] == players
+    assert rooms[0]['game_state'] == game_state
+    assert rooms[0]['chat_messages'] == [chat]
+
+
+def test_migrates_version_0_database(db_path):
+    """A database from before user_version stamping is migrated and keeps its rooms."""
+    legacy_state = make_game_state()
+    conn = sqlite3.connect(db_path)
+    conn.executescript("""
+        CREATE TABLE rooms (
+            room_id TEXT PRIMARY KEY,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            last_activity TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            is_active INTEGER DEFAULT 1
+        );
+        CREATE TABLE players (
+            player_id TEXT PRIMARY KEY,
+            room_id TEXT NOT NULL,
+            name TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            is_connected INTEGER DEFAULT 0,
+            is_ready INTEGER DEFAULT 0,
+            session_id TEXT
+        );
+        CREATE TABLE game_states (
+            room_id TEXT PRIMARY KEY,
+            phase TEXT NOT NULL,
+            current_turn INTEGER NOT NULL,
+            dealer_position INTEGER NOT NULL,
+            declarer_position INTEGER,
+            partner_position INTEGER,
+            partner_revealed INTEGER DEFAULT 0,
+            called_card_rank TEXT,
+            trick_number INTEGER DEFAULT 0,
+            game_data JSON NOT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        CREATE TABLE chat_messages (
+            id TEXT PRIMARY KEY,
+            room_id TEXT NOT NULL,
+            player_name TEXT NOT NULL,
+            message TEXT NOT NULL,
+            timestamp INTEGER NOT NULL
+        );
+        CREATE INDEX idx_players_room ON players(room_id);
+        CREATE INDEX idx_chat_room ON chat_messages(room_id, timestamp);
+        INSERT INTO rooms (room_id) VALUES ('room-1');
+    """)
+    # Legacy rows carry the whole state, lists included, inline in game_data
+    conn.execute(
+        "INSERT INTO game_states (room_id, phase, current_turn, dealer_position, game_data) "
+        "VALUES ('room-1', 'playing', 2, 0, ?)",
+        (json.dumps(legacy_state),)
+    )
+    conn.commit()
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == 0
+    conn.close()
+
+    db = GameDatabase(db_path)
+    try:
+        assert db.conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        columns = {row['name'] for row in db.conn.execute("PRAGMA table_info(game_states)")}
+        assert {'trick_leader', 'previous_trick_winner'} <= columns
+        assert db.load_game_state("room-1") == legacy_state
+
+        # New saves go to the sectioned layout and take precedence over the inline lists
+        changed = copy.deepcopy(legacy_state)
+        changed['talon'] = [{'suit': 'tarokk', 'rank': 'XXI', 'points': 5}]
+        save(db, "room-1", changed)
+    finally:
+        db.close()
+
+    assert reopen_and_load(db_path, "room-1") == changed
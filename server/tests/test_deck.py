@@ -2,7 +2,7 @@
 
 import pytest
 from server.models.deck import Deck
-from server.models.card import Suit
+from server.models.card import Suit, TAROKK_MASK
 
 
 def test_deck_creation():
@@ -98,3 +98,14 @@ def test_deck_reset():
 
     assert deck.remaining_cards() == 42
     assert deck.validate_deck() is True
+
+
+def test_deck_card_bits():
+    """Test every card has a distinct bit and tarokks fall inside TAROKK_MASK."""
+    deck = Deck()
+    bits = [card.bit for card in deck.cards]
+
+    assert len(set(bits)) == 42
+    assert all(bit.bit_count() == 1 for bit in bits)
+    for card in deck.cards:
+        assert bool(card.bit & TAROKK_MASK) == card.is_tarokk()
@@ -0,0 +1,43 @@
+"""Tests for the persistence manager's room writes."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from networking.room_manager import RoomManager
+from persistence.persistence_manager import PersistenceManager
+
+from .conftest import fail_job, run_in_one_batch
+
+
+@pytest.fixture
+def manager(db_path):
+    """Persistence manager on a fresh database file."""
+    manager = PersistenceManager(db_path)
+    yield manager
+    manager.close()
+
+
+def test_room_write_survives_rolled_back_batch(manager):
+    """A room save batched with a failing job is written by the retry."""
+    room = RoomManager().create_room("sid-1", "Alice")
+
+    failing = run_in_one_batch(manager.worker, lambda: (
+        manager._queue_room(room, 0.0),
+        manager.worker.submit(fail_job),
+    )[1])
+
+    with pytest.raises(RuntimeError):
+        failing.result(timeout=5)
+    rooms = list(manager.db.iter_rooms())
+    assert [r['room_id'] for r in rooms] == [room.room_id]
+    assert [p['name'] for p in rooms[0]['players']] == ["Alice"]
+
+
+def test_unchanged_room_snapshot_is_skipped(manager):
+    """Writing the same room snapshot twice touches the database once."""
+    db = Mock()
+    manager._write_room(db, "room-1", [], {'phase': 'waiting'})
+    manager._write_room(db, "room-1", [], {'phase': 'waiting'})
+
+    assert db.save_room.call_count == 1
@@ -0,0 +1,107 @@
+"""Tests for room membership and session lookup."""
+
+import pytest
+
+from models.game_state import GamePhase
+from networking.room_manager import RoomManager
+
+
+@pytest.fixture
+def manager():
+    return RoomManager()
+
+
+def test_resolve_created_and_joined_sessions(manager):
+    """Every session that creates or joins a room resolves to its room and player."""
+    room = manager.create_room("sid-a", "Alice")
+    manager.join_room(room.room_id, "sid-b", "Bob")
+
+    for sid, name in (("sid-a", "Alice"), ("sid-b", "Bob")):
+        resolved_room, player = manager.resolve(sid)
+        assert resolved_room is room
+        assert player.name == name
+        assert room.player_sessions[player.id] == sid
+
+
+def test_resolve_unknown_session(manager):
+    assert manager.resolve("nobody") is None
+
+
+def test_rejoin_by_id_with_new_session(manager):
+    """Rejoining with a new sid moves the player to it and retires the old sid."""
+    room = manager.create_room("sid-a", "Alice")
+    _, player = manager.resolve("sid-a")
+    player.is_connected = False
+
+    manager.join_room(room.room_id, "sid-a2", "Alice", player_id=player.id)
+
+    assert manager.resolve("sid-a2") == (room, player)
+    assert manager.resolve("sid-a") is None
+    assert player.is_connected
+    assert len(room.game_state.players) == 1
+
+
+def test_rejoin_by_name_with_new_session(manager):
+    """Rejoining by name alone also retires the old sid."""
+    room = manager.create_room("sid-a", "Alice")
+    _, player = manager.resolve("sid-a")
+
+    manager.join_room(room.room_id, "sid-a2", "Alice")
+
+    assert manager.resolve("sid-a2") == (room, player)
+    assert manager.resolve("sid-a") is None
+
+
+def test_stale_session_leaving_keeps_new_session(manager):
+    """The old socket disconnecting after a rejoin does not unbind the player."""
+    room = manager.create_room("sid-a", "Alice")
+    manager.join_room(room.room_id, "sid-b", "Bob")
+    _, player = manager.resolve("sid-a")
+    manager.join_room(room.room_id, "sid-a2", "Alice", player_id=player.id)
+
+    assert manager.leave_room("sid-a") is room
+
+    assert manager.resolve("sid-a2") == (room, player)
+    assert player in room.game_state.players
+    assert room.player_sessions[player.id] == "sid-a2"
+
+
+def test_leave_room_before_game_removes_player(manager):
+    """Leaving a waiting room removes the player, unbinds the sid and renumbers seats."""
+    room = manager.create_room("sid-a", "Alice")
+    manager.join_room(room.room_id, "sid-b", "Bob")
+
+    assert manager.leave_room("sid-a") is room
+
+    assert manager.resolve("sid-a") is None
+    assert manager.get_room_by_session("sid-a") is None
+    _, bob = manager.resolve("sid-b")
+    assert room.game_state.players == [bob]
+    assert bob.position == 0
+
+
+def test_leave_room_during_game_keeps_seat(manager):
+    """Leaving a started game only disconnects the player so they can rejoin."""
+    room = manager.create_room("sid-a", "Alice")
+    manager.join_room(room.room_id, "sid-b", "Bob")
+    _, alice = manager.resolve("sid-a")
+    room.game_state.phase = GamePhase.BIDDING
+
+    manager.leave_room("sid-a")
+
+    assert manager.resolve("sid-a") is None
+    assert alice in room.game_state.players
+    assert not alice.is_connected
+    assert alice.id not in room.player_sessions
+
+    manager.join_room(room.room_id, "sid-a2", "Alice", player_id=alice.id)
+    assert manager.resolve("sid-a2") == (room, alice)
+
+
+def test_last_player_leaving_deletes_room(manager):
+    room = manager.create_room("sid-a", "Alice")
+
+    assert manager.leave_room("sid-a") is None
+
+    assert manager.get_room(room.room_id) is None
+    assert manager.resolve("sid-a") is None
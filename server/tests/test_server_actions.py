@@ -0,0 +1,45 @@
+"""Tests for the server's in-game action handlers."""
+
+import asyncio
+
+import pytest
+
+from models.card import Card, CardType, Suit
+from models.game_state import GamePhase
+from networking import server
+from networking.room_manager import RoomManager
+
+
+@pytest.fixture
+def room():
+    """Room in the discarding phase with Alice holding 11 cards."""
+    room = RoomManager().create_room("sid-a", "Alice")
+    room.game_state.phase = GamePhase.DISCARDING
+    room.game_state.players[0].add_cards_to_hand([
+        Card(suit=Suit.HEARTS, rank=rank, points=1, card_type=CardType.SUIT)
+        for rank in ("10", "J", "C")
+    ] + [
+        Card(suit=Suit.SPADES, rank=rank, points=1, card_type=CardType.SUIT)
+        for rank in ("10", "J", "C", "Q")
+    ] + [
+        Card(suit=Suit.CLUBS, rank=rank, points=1, card_type=CardType.SUIT)
+        for rank in ("10", "J", "C", "Q")
+    ])
+    return room
+
+
+def discard(room, card_ids):
+    """Run the discard_cards handler for Alice without the Socket.IO wrapper."""
+    player = room.game_state.players[0]
+    asyncio.run(server.discard_cards.__wrapped__(room, player, room.game_state, {"card_ids": card_ids}))
+
+
+def test_discard_rejects_repeated_card_id(room):
+    """One card listed twice does not count as two discards."""
+    card_id = room.game_state.players[0].hand[0].id
+
+    with pytest.raises(ValueError, match="same card twice"):
+        discard(room, [card_id, card_id])
+
+    assert room.game_state.players[0].get_hand_size() == 11
+    assert room.game_state.players_who_discarded == []
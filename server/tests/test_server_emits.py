@@ -0,0 +1,158 @@
+"""Tests for the server's outgoing game_state and batched emits."""
+
+import asyncio
+
+import pytest
+
+from models.card import Card, CardType, Suit
+from networking import server
+from networking.room_manager import RoomManager
+
+
+@pytest.fixture
+def room():
+    """Waiting room with Alice on sid-a and Bob on sid-b."""
+    manager = RoomManager()
+    room = manager.create_room("sid-a", "Alice")
+    manager.join_room(room.room_id, "sid-b", "Bob")
+    return room
+
+
+@pytest.fixture(autouse=True)
+def json_sessions(monkeypatch):
+    """Every session gets plain (not msgpack) game_state payloads."""
+    monkeypatch.setattr(server, "binary_sessions", set())
+
+
+def targets(emits):
+    return [target for _, _, target in emits]
+
+
+def test_game_state_sent_to_every_session_first(room):
+    emits = server.game_state_emits(room)
+
+    assert targets(emits) == ["sid-a", "sid-b"]
+    assert all(event == "game_state" for event, _, _ in emits)
+
+
+def test_identical_game_state_is_skipped(room):
+    server.game_state_emits(room)
+
+    assert server.game_state_emits(room) == []
+
+
+def test_public_change_is_sent_to_every_session(room):
+    server.game_state_emits(room)
+    room.game_state.current_turn = 1
+
+    emits = server.game_state_emits(room)
+
+    assert targets(emits) == ["sid-a", "sid-b"]
+    assert all(data["current_turn"] == 1 for _, data, _ in emits)
+
+
+def test_private_change_is_sent_only_to_its_owner(room):
+    """Swapping a card changes only its owner's view; the others see the same hand size."""
+    bob = room.game_state.players[1]
+    bob.add_cards_to_hand([Card(suit=Suit.HEARTS, rank="K", points=5, card_type=CardType.KING)])
+    server.game_state_emits(room)
+    bob.hand = [Card(suit=Suit.SPADES, rank="K", points=5, card_type=CardType.KING)]
+
+    emits = server.game_state_emits(room)
+
+    assert targets(emits) == ["sid-b"]
+    bob_view = emits[0][1]["players"][1]
+    assert [card["suit"] for card in bob_view["hand"]] == ["spades"]
+
+
+def test_forgotten_session_is_resent(room):
+    """Dropping a session's last payload (as join_room does) resends to it alone."""
+    server.game_state_emits(room)
+    room.last_game_state.pop("sid-a")
+
+    assert targets(server.game_state_emits(room)) == ["sid-a"]
+
+
+def test_new_session_gets_game_state(room):
+    """A player who rejoined on a new sid is sent the state even if it is unchanged."""
+    server.game_state_emits(room)
+    alice = room.game_state.players[0]
+    room.player_sessions[alice.id] = "sid-a2"
+
+    assert targets(server.game_state_emits(room)) == ["sid-a2"]
+
+
+class FakeSio:
+    """Records emits; rooms maps a room name to its session ids."""
+
+    def __init__(self, rooms):
+        self.emitted = []
+        self.manager = self
+        self.rooms = rooms
+
+    def get_participants(self, namespace, room):
+        for sid in self.rooms.get(room, [room]):
+            yield sid, f"eio-{sid}"
+
+    async def emit(self, event, data, room=None, skip_sid=None):
+        self.emitted.append((event, data, room, skip_sid))
+
+
+@pytest.fixture
+def sio(monkeypatch):
+    """Fake Socket.IO server with room-1 holding sid-a and sid-b."""
+    fake = FakeSio({"room-1": ["sid-a", "sid-b"]})
+    monkeypatch.setattr(server, "sio", fake)
+    return fake
+
+
+def send(emits):
+    asyncio.run(server.send_emits(emits))
+
+
+EMITS = [
+    ("game_state", {"for": "a"}, "sid-a"),
+    ("game_state", {"for": "b"}, "sid-b"),
+    ("bid_placed", {"bid": "three"}, "room-1"),
+]
+
+
+def test_unbatched_sessions_get_each_emit(sio, monkeypatch):
+    monkeypatch.setattr(server, "batch_sessions", set())
+
+    send(EMITS)
+
+    assert sio.emitted == [(event, data, target, None) for event, data, target in EMITS]
+
+
+def test_batch_session_gets_one_updates_event(sio, monkeypatch):
+    """A batch session's emits arrive as one ordered [event, data] list; the room emit skips it."""
+    monkeypatch.setattr(server, "batch_sessions", {"sid-a"})
+
+    send(EMITS)
+
+    assert sio.emitted == [
+        ("game_state", {"for": "b"}, "sid-b", []),
+        ("bid_placed", {"bid": "three"}, "room-1", ["sid-a"]),
+        ("updates", [["game_state", {"for": "a"}], ["bid_placed", {"bid": "three"}]], "sid-a", None),
+    ]
+
+
+def test_single_update_is_sent_as_plain_event(sio, monkeypatch):
+    monkeypatch.setattr(server, "batch_sessions", {"sid-a"})
+
+    send(EMITS[:1])
+
+    assert sio.emitted == [("game_state", {"for": "a"}, "sid-a", None)]
+
+
+def test_room_emit_dropped_when_every_participant_batches(sio, monkeypatch):
+    """No room-wide emit is sent when every participant gets it in its batch."""
+    monkeypatch.setattr(server, "batch_sessions", {"sid-a", "sid-b"})
+
+    send(EMITS)
+
+    assert sio.emitted == [
+        ("updates", [["game_state", {"for": "a"}], ["bid_placed", {"bid": "three"}]], "sid-a", None),
+        ("updates", [["game_state", {"for": "b"}], ["bid_placed", {"bid": "three"}]], "sid-b", None),
+    ]
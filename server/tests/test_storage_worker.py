@@ -0,0 +1,111 @@
+"""Tests for the storage worker's batched writes."""
+
+from contextlib import contextmanager
+
+import pytest
+
+from persistence.database import GameDatabase
+from persistence.storage_worker import StorageWorker
+
+from .conftest import fail_job, run_in_one_batch
+
+
+@pytest.fixture
+def worker(db_path):
+    """Storage worker on a fresh database file."""
+    worker = StorageWorker(db_path)
+    yield worker
+    worker.close()
+
+
+@pytest.fixture
+def transactions(worker, monkeypatch):
+    """List that gets one entry per transaction the worker opens."""
+    db = worker.submit(lambda db: db).result(timeout=5)
+    opened = []
+    transaction = db.transaction
+
+    @contextmanager
+    def counting_transaction():
+        opened.append(True)
+        with transaction() as conn:
+            yield conn
+
+    monkeypatch.setattr(db, 'transaction', counting_transaction)
+    return opened
+
+
+def stored_room_ids(db_path):
+    """Room IDs committed to the database, read through a separate connection."""
+    db = GameDatabase(db_path, read_only=True)
+    try:
+        return {row['room_id'] for row in db.conn.execute("SELECT room_id FROM rooms")}
+    finally:
+        db.close()
+
+
+def test_future_resolves_with_job_result(worker):
+    """A job's return value is passed back through its future."""
+    assert worker.submit(lambda db, x: x * 2, 21).result(timeout=5) == 42
+
+
+def test_queued_jobs_commit_in_one_transaction(worker, transactions, db_path):
+    """Batchable jobs queued together share a single transaction."""
+    futures = run_in_one_batch(worker, lambda: [
+        worker.submit(GameDatabase.save_room, room_id) for room_id in ("a", "b", "c")
+    ])
+
+    assert [f.result(timeout=5) for f in futures] == [None, None, None]
+    assert len(transactions) == 1
+    assert stored_room_ids(db_path) == {"a", "b", "c"}
+
+
+def test_unbatched_job_runs_outside_transaction(worker, transactions):
+    """batch=False jobs run on their own, in autocommit mode."""
+    in_transaction = worker.submit(lambda db: db.conn.in_transaction, batch=False).result(timeout=5)
+
+    assert in_transaction is False
+    assert transactions == []
+
+
+def test_failed_batch_is_retried_job_by_job(worker, transactions, db_path):
+    """One failing job rolls back the batch; the others are retried and committed."""
+    first, failing, last = run_in_one_batch(worker, lambda: [
+        worker.submit(GameDatabase.save_room, "a"),
+        worker.submit(fail_job),
+        worker.submit(GameDatabase.save_room, "b"),
+    ])
+
+    assert first.result(timeout=5) is None
+    assert last.result(timeout=5) is None
+    with pytest.raises(RuntimeError, match="boom"):
+        failing.result(timeout=5)
+    # The shared attempt, then one transaction per job
+    assert len(transactions) == 4
+    assert stored_room_ids(db_path) == {"a", "b"}
+
+
+def test_on_rollback_runs_before_retry(worker):
+    """on_rollback fires for every job of a rolled-back transaction before it is retried."""
+    events = []
+
+    def record(db, name):
+        events.append(name)
+
+    run_in_one_batch(worker, lambda: [
+        worker.submit(record, "write", on_rollback=lambda: events.append("rollback")),
+        worker.submit(fail_job),
+    ])
+
+    # Batch attempt, rollback, successful retry
+    assert events == ["write", "rollback", "write"]
+
+
+def test_close_runs_queued_jobs(db_path):
+    """close() finishes every job queued before it."""
+    worker = StorageWorker(db_path)
+    futures = [worker.submit(GameDatabase.save_room, room_id) for room_id in ("a", "b")]
+    worker.close()
+
+    assert all(f.done() and f.exception() is None for f in futures)
+    assert stored_room_ids(db_path) == {"a", "b"}
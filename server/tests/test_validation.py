@@ -8,7 +8,8 @@ from server.validation.rules import (
     validate_discard,
     has_honour,
     has_trull,
-    has_four_kings
+    has_four_kings,
+    can_annul_hand
 )
 
 
@@ -152,3 +153,16 @@ def test_has_four_kings():
     ]
 
     assert has_four_kings(hand) is True
+
+
+def test_can_annul_hand():
+    """Test annulment with singleton XXI, XXI + pagát, and a normal hand."""
+    xxi = create_card(Suit.TAROKK, TarokkRank.XXI.value, 5, CardType.HONOUR)
+    pagat = create_card(Suit.TAROKK, TarokkRank.PAGAT.value, 5, CardType.HONOUR)
+    king = create_card(Suit.HEARTS, "K", 5, CardType.KING)
+    tarokk = create_card(Suit.TAROKK, TarokkRank.X.value, 1, CardType.TAROKK)
+
+    assert can_annul_hand([xxi, king]) == (True, "Singleton XXI")
+    assert can_annul_hand([xxi, pagat, king]) == (True, "Only XXI and pagát")
+    assert can_annul_hand([king]) == (True, "No tarokks")
+    assert can_annul_hand([xxi, tarokk, king])[0] is False
@@ -2,6 +2,12 @@
 
 from typing import Iterator
 
+# Tarokk is always played by four; since x & 3 == x % 4 for any int x
+# (negative ones included), the four-player case uses the mask.
+
+# Seating order starting from each position at a four-player table
+_COUNTER_CLOCKWISE_ORDER = tuple(tuple((start + i) & 3 for i in range(4)) for start in range(4))
+
 
 def next_position(current: int, num_players: int = 4) -> int:
     """
@@ -16,6 +22,8 @@ def next_position(current: int, num_players: int = 4) -> int:
     Returns:
         Next position counter-clockwise
     """
+    if num_players == 4:
+        return (current + 1) & 3
     return (current + 1) % num_players
 
 
@@ -30,6 +38,8 @@ def prev_position(current: int, num_players: int = 4) -> int:
     Returns:
         Previous position (clockwise)
     """
+    if num_players == 4:
+        return (current - 1) & 3
     return (current - 1) % num_players
 
 
@@ -48,7 +58,9 @@ def dealer_right(dealer: int, num_players: int = 4) -> int:
     Returns:
         Position to dealer's right
     """
-    return next_position(dealer, num_players)
+    if num_players == 4:
+        return (dealer + 1) & 3
+    return (dealer + 1) % num_players
 
 
 def iter_counter_clockwise(start: int, num_players: int = 4) -> Iterator[int]:
@@ -59,11 +71,12 @@ def iter_counter_clockwise(start: int, num_players: int = 4) -> Iterator[int]:
         start: Starting position (0-3)
         num_players: Total number of players (default 4)
 
-    Yields:
-        Positions in counter-clockwise order
+    Returns:
+        Iterator over positions in counter-clockwise order
     """
-    for i in range(num_players):
-        yield (start + i) % num_players
+    if num_players == 4:
+        return iter(_COUNTER_CLOCKWISE_ORDER[start])
+    return ((start + i) % num_players for i in range(num_players))
 
 
 def distance_counter_clockwise(from_pos: int, to_pos: int, num_players: int = 4) -> int:
@@ -78,4 +91,6 @@ def distance_counter_clockwise(from_pos: int, to_pos: int, num_players: int = 4)
     Returns:
         Number of steps counter-clockwise from from_pos to to_pos
     """
+    if num_players == 4:
+        return (to_pos - from_pos) & 3
     return (to_pos - from_pos) % num_players
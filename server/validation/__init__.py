@@ -1,9 +1,17 @@
 """Validation package."""
 
-from .rules import validate_play, get_legal_cards, validate_discard
+from .rules import (
+    validate_play,
+    get_legal_cards,
+    validate_discard,
+    can_announce,
+    get_valid_announcements,
+)
 
 __all__ = [
     "validate_play",
     "get_legal_cards",
     "validate_discard",
+    "can_announce",
+    "get_valid_announcements",
 ]
@@ -1,11 +1,16 @@
 """Game rules validation for Hungarian Tarokk."""
 
+from functools import cache
 from typing import List, Tuple, Optional
-from models.card import Card, Suit
+from models.card import (
+    Card, Suit, TAROKK_MASK, HONOUR_MASK, KING_MASK, SUIT_MASKS, SKIZ_BIT, XXI_BIT, PAGAT_BIT,
+    hand_mask,
+)
 from models.announcement import AnnouncementType
 
 
-def get_legal_cards(hand: List[Card], lead_suit: Suit, is_first_card: bool = False) -> List[Card]:
+def get_legal_cards(hand: List[Card], lead_suit: Suit, is_first_card: bool = False,
+                    mask: Optional[int] = None) -> List[Card]:
     """
     Get list of legal cards a player can play.
 
@@ -20,6 +25,7 @@ def get_legal_cards(hand: List[Card], lead_suit: Suit, is_first_card: bool = Fal
         hand: Player's current hand
         lead_suit: The suit that was led (or None if leading)
         is_first_card: True if this is the first card of the trick
+        mask: Bitmask of hand, if the caller already has it (see hand_mask)
 
     Returns:
         List of legal cards that can be played
@@ -28,22 +34,17 @@ def get_legal_cards(hand: List[Card], lead_suit: Suit, is_first_card: bool = Fal
         # Leading: can play any card
         return hand
 
-    # Following: must follow suit
-    cards_of_lead_suit = [c for c in hand if c.suit == lead_suit]
+    if mask is None:
+        mask = hand_mask(hand)
 
-    if cards_of_lead_suit:
-        # Have cards of lead suit: must play one
-        return cards_of_lead_suit
+    # Following: must follow suit, else (void in lead suit) must play tarokk
+    legal = (mask & SUIT_MASKS[lead_suit]) or (mask & TAROKK_MASK)
 
-    # Void in lead suit: must play tarokk if able
-    tarokks = [c for c in hand if c.is_tarokk()]
-
-    if tarokks:
-        # Have tarokks: must play one
-        return tarokks
+    if not legal:
+        # Void in lead suit AND no tarokks: can play any card
+        return hand
 
-    # Void in lead suit AND no tarokks: can play any card
-    return hand
+    return [c for c in hand if c.bit & legal]
 
 
 def validate_play(card: Card, hand: List[Card], lead_suit: Suit, is_first_card: bool = False) -> Tuple[bool, str]:
@@ -63,20 +64,20 @@ def validate_play(card: Card, hand: List[Card], lead_suit: Suit, is_first_card:
     if card not in hand:
         return False, "Card not in hand"
 
-    legal_cards = get_legal_cards(hand, lead_suit, is_first_card)
-
-    if card not in legal_cards:
-        # Determine reason for illegality
-        if not is_first_card:
-            has_lead_suit = any(c.suit == lead_suit for c in hand)
-            if has_lead_suit:
-                return False, f"Must follow suit: {lead_suit.value}"
+    if is_first_card:
+        # Leading: any card is legal
+        return True, "OK"
 
-            has_tarokk = any(c.is_tarokk() for c in hand)
-            if has_tarokk and not card.is_tarokk():
-                return False, "Must play tarokk when void in lead suit"
+    # Decide on the masks directly; no legal-card list is built
+    mask = hand_mask(hand)
+    follow = mask & SUIT_MASKS[lead_suit]
+    if follow:
+        if card.bit & follow:
+            return True, "OK"
+        return False, f"Must follow suit: {lead_suit.value}"
 
-        return False, "Illegal card play"
+    if mask & TAROKK_MASK and not card.is_tarokk():
+        return False, "Must play tarokk when void in lead suit"
 
     return True, "OK"
 
@@ -117,7 +118,7 @@ def count_tarokks_in_discard(cards: List[Card]) -> int:
     Returns:
         Number of tarokk cards
     """
-    return sum(1 for c in cards if c.is_tarokk())
+    return (hand_mask(cards) & TAROKK_MASK).bit_count()
 
 
 def can_annul_hand(hand: List[Card]) -> Tuple[bool, str]:
@@ -137,26 +138,22 @@ def can_annul_hand(hand: List[Card]) -> Tuple[bool, str]:
     Returns:
         Tuple of (can_annul, reason)
     """
-    kings = [c for c in hand if c.is_king()]
-    if len(kings) == 4:
+    mask = hand_mask(hand)
+    if mask & KING_MASK == KING_MASK:
         return True, "All four Kings"
 
-    tarokks = [c for c in hand if c.is_tarokk()]
+    tarokks = mask & TAROKK_MASK
 
-    if len(tarokks) == 0:
+    if not tarokks:
         return True, "No tarokks"
 
-    if len(tarokks) == 1:
-        tarokk_rank = tarokks[0].rank
-        if tarokk_rank == "XXI":
-            return True, "Singleton XXI"
-        if tarokk_rank == "I":  # pagát
-            return True, "Singleton pagát"
+    if tarokks == XXI_BIT:
+        return True, "Singleton XXI"
+    if tarokks == PAGAT_BIT:
+        return True, "Singleton pagát"
 
-    if len(tarokks) == 2:
-        ranks = {t.rank for t in tarokks}
-        if ranks == {"XXI", "I"}:
-            return True, "Only XXI and pagát"
+    if tarokks == XXI_BIT | PAGAT_BIT:
+        return True, "Only XXI and pagát"
 
     return False, "Hand cannot be annulled"
 
@@ -174,7 +171,7 @@ def has_honour(hand: List[Card]) -> bool:
     Returns:
         True if hand has at least one honour
     """
-    return any(c.is_honour() for c in hand)
+    return bool(hand_mask(hand) & HONOUR_MASK)
 
 
 def has_trull(hand: List[Card]) -> bool:
@@ -189,8 +186,7 @@ def has_trull(hand: List[Card]) -> bool:
     Returns:
         True if hand has all three honours
     """
-    honour_ranks = {c.rank for c in hand if c.is_honour()}
-    return {"skiz", "XXI", "I"} <= honour_ranks
+    return hand_mask(hand) & HONOUR_MASK == HONOUR_MASK
 
 
 def has_four_kings(hand: List[Card]) -> bool:
@@ -203,7 +199,7 @@ def has_four_kings(hand: List[Card]) -> bool:
     Returns:
         True if hand has all four Kings
     """
-    return len([c for c in hand if c.is_king()]) == 4
+    return hand_mask(hand) & KING_MASK == KING_MASK
 
 
 def can_announce(hand: List[Card], announcement_type: AnnouncementType) -> Tuple[bool, str]:
@@ -220,40 +216,33 @@ def can_announce(hand: List[Card], announcement_type: AnnouncementType) -> Tuple
     Returns:
         Tuple of (can_announce, error_message)
     """
-    if announcement_type == AnnouncementType.TRULL:
-        # Trull is a declaration that you will collect all 3 honours
-        # You don't need to have them to announce
+    return _can_announce(hand_mask(hand), announcement_type)
+
+
+# Card each announcement requires in hand (0 for none) and the error when it's
+# missing. Trull, four kings, double game and volat are predictions: you
+# don't need the cards to announce them. Pagát ultimó needs the pagát to play
+# in the last trick; catching the XXI needs the skíz.
+_ANNOUNCE_REQUIREMENTS = {
+    AnnouncementType.TRULL: (0, ""),
+    AnnouncementType.FOUR_KINGS: (0, ""),
+    AnnouncementType.DOUBLE_GAME: (0, ""),
+    AnnouncementType.VOLAT: (0, ""),
+    AnnouncementType.PAGAT_ULTIMO: (PAGAT_BIT, "Must have pagát (I) to announce pagát ultimó"),
+    AnnouncementType.XXI_CATCH: (SKIZ_BIT, "Must have skíz to announce XXI catch"),
+}
+
+
+def _can_announce(mask: int, announcement_type: AnnouncementType) -> Tuple[bool, str]:
+    """can_announce on a hand bitmask."""
+    requirement = _ANNOUNCE_REQUIREMENTS.get(announcement_type)
+    if requirement is None:
+        return False, "Unknown announcement type"
+
+    required_bit, error = requirement
+    if mask & required_bit == required_bit:
         return True, "OK"
-
-    elif announcement_type == AnnouncementType.FOUR_KINGS:
-        # Four Kings is a declaration that you will collect all 4 Kings
-        # You don't need to have them to announce
-        return True, "OK"
-
-    elif announcement_type == AnnouncementType.DOUBLE_GAME:
-        # Double game is a prediction, not based on cards
-        return True, "OK"
-
-    elif announcement_type == AnnouncementType.VOLAT:
-        # Volat is a prediction, not based on cards
-        return True, "OK"
-
-    elif announcement_type == AnnouncementType.PAGAT_ULTIMO:
-        # Must have pagát (I) to announce pagát ultimó
-        # (You need it to play it in the last trick)
-        has_pagat = any(c.is_honour() and c.rank == "I" for c in hand)
-        if has_pagat:
-            return True, "OK"
-        return False, "Must have pagát (I) to announce pagát ultimó"
-
-    elif announcement_type == AnnouncementType.XXI_CATCH:
-        # Must have skíz to catch XXI
-        has_skiz = any(c.is_honour() and c.rank.lower() == "skiz" for c in hand)
-        if has_skiz:
-            return True, "OK"
-        return False, "Must have skíz to announce XXI catch"
-
-    return False, "Unknown announcement type"
+    return False, error
 
 
 def get_valid_announcements(hand: List[Card]) -> List[AnnouncementType]:
@@ -266,11 +255,18 @@ def get_valid_announcements(hand: List[Card]) -> List[AnnouncementType]:
     Returns:
         List of valid announcement types
     """
-    valid = []
+    return list(_valid_announcements(hand_mask(hand) & _ANNOUNCE_CARDS_MASK))
+
+
+# The only cards that affect can_announce; the rest of the hand never changes
+# the answer, so _valid_announcements sees at most four distinct keys
+_ANNOUNCE_CARDS_MASK = sum({required_bit for required_bit, _ in _ANNOUNCE_REQUIREMENTS.values()})
 
-    for announcement_type in AnnouncementType:
-        can_make, _ = can_announce(hand, announcement_type)
-        if can_make:
-            valid.append(announcement_type)
 
-    return valid
+@cache
+def _valid_announcements(mask: int) -> Tuple[AnnouncementType, ...]:
+    """Announcement types allowed for a hand bitmask (see get_valid_announcements)."""
+    return tuple(
+        announcement_type for announcement_type in AnnouncementType
+        if _can_announce(mask, announcement_type)[0]
+    )
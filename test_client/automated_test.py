@@ -6,13 +6,30 @@ Runs complete game simulations to verify server functionality.
 """
 
 import sys
-import time
-from typing import List
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, List
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from client import TarokkClient
 
 
+# How long to wait for the server to answer an action
+STATE_TIMEOUT = 5.0
+
+
+def state_signature(gs: dict) -> tuple:
+    """The parts of a game state that change whenever the game progresses."""
+    return (
+        gs.get("phase"),
+        gs.get("current_turn"),
+        gs.get("trick_number"),
+        len(gs.get("current_trick") or ()),
+        len(gs.get("bid_history") or ()),
+        len(gs.get("players_who_discarded") or ()),
+    )
+
+
 class AutomatedTest:
     """Automated test scenarios."""
 
@@ -29,6 +46,27 @@ class AutomatedTest:
         else:
             self.console.print(message)
 
+    def wait_for_progress(self, client: TarokkClient, signature: tuple, timeout: float = STATE_TIMEOUT) -> bool:
+        """Wait until the client's game state has moved past signature."""
+        # Notices such as "All players passed" also arrive as game_state; skip them
+        return client.wait_for(
+            "game_state", timeout,
+            predicate=lambda d: "phase" in d and state_signature(d) != signature
+        )
+
+    def emit_all(self, clients: List[TarokkClient], send: Callable, timeout: float = STATE_TIMEOUT) -> bool:
+        """
+        Send one request from each client without waiting in between.
+
+        send(client, callback) must emit the request with callback as its
+        acknowledgement callback. Returns once the server has acknowledged
+        every request (False on timeout).
+        """
+        acked = threading.Semaphore(0)
+        for client in clients:
+            send(client, lambda *args: acked.release())
+        return all(acked.acquire(timeout=timeout) for _ in clients)
+
     def assert_true(self, condition: bool, message: str):
         """Assert a condition is true."""
         if not condition:
@@ -43,30 +81,35 @@ class AutomatedTest:
 
         player_names = ["Alice", "Bob", "Charlie", "Diana"]
 
-        # Connect all players
-        for name in player_names:
-            client = TarokkClient(self.server_url, name)
-            if not client.connect():
-                self.log(f"Failed to connect {name}", "red")
-                return False
-            self.clients.append(client)
-            time.sleep(0.3)
+        # Connect all players at once; connect() returns after the handshake
+        # Only the first player logs its events; the others would repeat them
+        self.clients = [
+            TarokkClient(self.server_url, name, verbose=i == 0)
+            for i, name in enumerate(player_names)
+        ]
+        with ThreadPoolExecutor(max_workers=len(self.clients)) as executor:
+            connected = list(executor.map(TarokkClient.connect, self.clients))
+
+        for client, ok in zip(self.clients, connected):
+            if not ok:
+                self.log(f"Failed to connect {client.player_name}", "red")
+        if not all(connected):
+            return False
 
         self.log(f"✓ Connected {len(self.clients)} players", "green")
 
         # Create room
-        self.clients[0].join_room()
-        time.sleep(1)
+        wait([self.clients[0].join_room()], timeout=STATE_TIMEOUT)
 
         room_id = self.clients[0].room_id
         self.assert_true(room_id is not None, "Room created")
 
         # Others join
-        for client in self.clients[1:]:
-            client.join_room(room_id)
-            time.sleep(0.5)
+        wait([c.join_room(room_id) for c in self.clients[1:]], timeout=STATE_TIMEOUT)
 
-        time.sleep(1)
+        # Seats follow the order the joins reached the server; the tests
+        # index clients by position
+        self.clients.sort(key=lambda c: c.player_position if c.player_position is not None else len(self.clients))
 
         # Verify all in room
         self.assert_true(
@@ -75,11 +118,12 @@ class AutomatedTest:
         )
 
         # Mark ready
-        for client in self.clients:
-            client.ready()
-            time.sleep(0.3)
+        self.emit_all(self.clients, lambda c, cb: c.ready(callback=cb))
 
-        time.sleep(2)
+        # The deal follows game_started; wait until every hand has arrived
+        for client in self.clients:
+            client.wait_for("game_started")
+            client.wait_for("game_state", predicate=lambda d: d.get("phase") != "waiting")
 
         return True
 
@@ -91,7 +135,6 @@ class AutomatedTest:
             return False
 
         # Check game started
-        time.sleep(1)
         phase = self.clients[0].game_state.get("phase")
         self.assert_true(
             phase == "bidding",
@@ -115,17 +158,10 @@ class AutomatedTest:
         if not self.setup_game():
             return False
 
-        time.sleep(1)
-
         # Track which players have honours
         players_with_honours = []
         for i, client in enumerate(self.clients):
-            hand = client.get_hand()
-            has_honour = any(
-                card.get("card_type") == "honour"
-                for card in hand
-            )
-            if has_honour:
+            if client.has_honour:
                 players_with_honours.append(i)
                 self.log(f"Player {i} ({client.player_name}) has honour", "cyan")
 
@@ -140,23 +176,19 @@ class AutomatedTest:
             self.log(f"Bidding turn: Player {current_turn}", "cyan")
 
             client = self.clients[current_turn]
-            hand = client.get_hand()
-
-            # Check if player has honour
-            has_honour = any(card.get("card_type") == "honour" for card in hand)
+            signature = state_signature(gs)
 
             # Simple bidding strategy
-            if has_honour and round_num == 0:
+            if client.has_honour and round_num == 0:
                 client.place_bid("three")
                 self.log(f"Player {current_turn} bid 'three'", "green")
             else:
                 client.place_bid("pass")
                 self.log(f"Player {current_turn} passed", "yellow")
 
-            time.sleep(1.5)
+            self.wait_for_progress(self.clients[0], signature)
 
         # Check bidding completed
-        time.sleep(2)
         phase = self.clients[0].game_state.get("phase")
         self.assert_true(
             phase in ["talon_distribution", "discarding", "partner_call"],
@@ -172,8 +204,6 @@ class AutomatedTest:
         if not self.setup_game():
             return False
 
-        time.sleep(2)
-
         max_iterations = 100
         iteration = 0
 
@@ -182,6 +212,7 @@ class AutomatedTest:
 
             # Check game state
             gs = self.clients[0].game_state
+            signature = state_signature(gs)
             phase = gs.get("phase")
 
             self.log(f"\nIteration {iteration}: Phase = {phase}", "cyan")
@@ -191,13 +222,13 @@ class AutomatedTest:
                 break
 
             if phase == "scoring":
-                time.sleep(3)
+                self.wait_for_progress(self.clients[0], signature)
                 continue
 
             # Find current player
             current_turn = gs.get("current_turn")
             if current_turn is None:
-                time.sleep(1)
+                self.wait_for_progress(self.clients[0], signature)
                 continue
 
             client = self.clients[current_turn]
@@ -205,11 +236,12 @@ class AutomatedTest:
 
             self.log(f"Player {current_turn} ({client.player_name})'s turn", "yellow")
 
+            # Only wait for an update if this iteration sent something
+            acted = True
             try:
                 if phase == "bidding":
                     # Auto-bid
-                    has_honour = any(card.get("card_type") == "honour" for card in hand)
-                    if has_honour and iteration <= 4:
+                    if client.has_honour and iteration <= 4:
                         bid_options = ["three", "two", "one"]
                         client.place_bid(bid_options[min(iteration - 1, 2)])
                     else:
@@ -219,30 +251,37 @@ class AutomatedTest:
                     # Auto-discard
                     num_to_discard = len(hand) - 9
                     if num_to_discard > 0:
-                        discardable = [c for c in hand if c.get("card_type") not in ["king", "honour"]]
-                        discardable.sort(key=lambda x: x.get("points", 0))
-                        to_discard = discardable[:num_to_discard]
+                        to_discard = client.discardable[:num_to_discard]
                         card_ids = [c["id"] for c in to_discard]
                         client.discard_cards(card_ids)
                         self.log(f"Discarded {len(card_ids)} cards", "green")
+                    else:
+                        acted = False
 
                 elif phase == "partner_call":
                     # Auto-call partner
                     if gs.get("declarer_position") == current_turn:
                         client.call_partner("XX")
                         self.log("Called partner: XX", "magenta")
+                    else:
+                        acted = False
 
                 elif phase == "playing":
                     # Auto-play first card from hand (simplified)
                     if hand:
                         client.play_card(hand[0]["id"])
                         self.log(f"Played {hand[0]['rank']} of {hand[0]['suit']}", "green")
+                    else:
+                        acted = False
+
+                else:
+                    acted = False
 
-                time.sleep(1.5)
+                if acted:
+                    self.wait_for_progress(self.clients[0], signature)
 
             except Exception as e:
                 self.log(f"Error during turn: {e}", "red")
-                time.sleep(1)
 
         self.assert_true(
             iteration < max_iterations,
@@ -266,12 +305,12 @@ class AutomatedTest:
         client = TarokkClient(self.server_url, "TestPlayer")
         connected = client.connect()
         self.assert_true(connected, "Player connected")
-
-        time.sleep(1)
+        client.wait_for("connect")
 
         # Disconnect
+        seen = client.event_count("disconnect")
         client.disconnect()
-        time.sleep(1)
+        client.wait_for("disconnect", after=seen)
 
         self.assert_true(not client.connected, "Player disconnected")
 
@@ -318,7 +357,6 @@ class AutomatedTest:
                 results.append((test_name, False))
             finally:
                 self.cleanup()
-                time.sleep(2)
 
         # Print summary
         self.console.print("\n" + "="*60)
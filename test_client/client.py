@@ -1,14 +1,39 @@
 """Socket.IO client for testing Hungarian Tarokk server."""
 
 import socketio
-from typing import Callable, Dict, Any, Optional, List
+from functools import lru_cache
+from typing import Callable, ClassVar, Dict, Any, Optional, List, Tuple
 import threading
 import time
+from concurrent.futures import Future, wait
 from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
 
+try:
+    import orjson
+except ImportError:  # Optional: Socket.IO falls back to the stdlib json module
+    orjson = None
 
+try:
+    import msgpack
+except ImportError:  # Optional: the server then sends game_state as JSON
+    msgpack = None
+
+
+class OrjsonCodec:
+    """Drop-in replacement for the json module used by Socket.IO packets."""
+
+    @staticmethod
+    def dumps(obj, **kwargs) -> str:
+        # Socket.IO asks for compact separators, which is orjson's only output
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    @staticmethod
+    def loads(data, **kwargs):
+        return orjson.loads(data)
+
+
+@lru_cache(maxsize=128)
 def roman_to_int(roman: str) -> int:
     """Convert Roman numeral to integer."""
     roman_values = {
@@ -28,21 +53,30 @@ def roman_to_int(roman: str) -> int:
     return result
 
 
+# Sort keys of the 22 tarokk ranks, keyed by the upper-cased rank the server
+# sends (skíz is "skiz", pagát is "I")
+_TAROKK_RANKS = {
+    'SKIZ': 22,
+    **{
+        roman: i for i, roman in enumerate(
+            ['I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX', 'X', 'XI',
+             'XII', 'XIII', 'XIV', 'XV', 'XVI', 'XVII', 'XVIII', 'XIX', 'XX', 'XXI'],
+            start=1
+        )
+    },
+}
+
+
 def get_tarokk_sort_key(rank: str) -> int:
     """Get sort key for tarokk cards (higher is better, so XXII=22, I=1)."""
-    # Handle special names
-    if rank.lower() == 'skíz':
-        return 22
-    if rank.lower() == 'pagát':
-        return 1
-
-    # Handle Roman numerals
-    try:
+    key = _TAROKK_RANKS.get(rank.upper())
+    if key is None:
+        # Not a known rank; read it as a Roman numeral
         return roman_to_int(rank)
-    except:
-        return 0
+    return key
 
 
+@lru_cache(maxsize=128)
 def get_suit_rank_value(rank: str) -> int:
     """Get numeric value for suit card rank (higher is better)."""
     rank_values = {
@@ -55,6 +89,7 @@ def get_suit_rank_value(rank: str) -> int:
     return rank_values.get(rank, 0)
 
 
+@lru_cache(maxsize=128)
 def get_suit_order(suit: str) -> int:
     """Get sort order for suits."""
     suit_order = {
@@ -76,19 +111,46 @@ def sort_hand(hand: List[Dict]) -> List[Dict]:
     Returns:
         Sorted list of cards
     """
-    def card_sort_key(card):
-        suit = card.get('suit', '').lower()
-        rank = card.get('rank', '')
-
-        if suit == 'tarokk':
-            # Tarokk cards come first, sorted in descending order (XXII to I)
-            # Negate to reverse order (higher roman numeral first)
-            return (0, -get_tarokk_sort_key(rank))
-        else:
-            # Suit cards come second, grouped by suit, then by rank descending
-            return (1, get_suit_order(suit), -get_suit_rank_value(rank))
+    # sorted() already computes each card's key once, before comparing
+    return sorted(hand, key=_card_sort_key)
+
+
+# Sort key per (suit, rank) as sent by the server, filled in as cards are seen
+_CARD_SORT_KEY: Dict[Tuple[str, str], tuple] = {}
+
 
-    return sorted(hand, key=card_sort_key)
+def _card_sort_key(card: Dict) -> tuple:
+    """Sort key for a card dictionary (see sort_hand)."""
+    k = (card.get('suit', ''), card.get('rank', ''))
+    key = _CARD_SORT_KEY.get(k)
+    if key is None:
+        key = _compute_card_sort_key(*k)
+        _CARD_SORT_KEY[k] = key
+    return key
+
+
+def _compute_card_sort_key(suit: str, rank: str) -> tuple:
+    """Sort key for one card (see sort_hand)."""
+    suit = suit.lower()
+
+    if suit == 'tarokk':
+        # Tarokk cards come first, sorted in descending order (XXII to I)
+        # Negate to reverse order (higher roman numeral first)
+        return (0, -get_tarokk_sort_key(rank))
+    else:
+        # Suit cards come second, grouped by suit, then by rank descending
+        return (1, get_suit_order(suit), -get_suit_rank_value(rank))
+
+
+# Open the WebSocket straight away, like the web client; long-polling only as
+# a fallback. Saves the polling handshake and upgrade on every connection.
+TRANSPORTS = ["websocket", "polling"]
+
+# With msgpack installed, ask the server for game_state as msgpack binary
+CONNECT_HEADERS = {"X-Msgpack-Supported": "1"} if msgpack is not None else {}
+
+# Card types that may never be discarded
+_NON_DISCARDABLE = frozenset(("king", "honour"))
 
 
 class TarokkClient:
@@ -98,11 +160,15 @@ class TarokkClient:
     Can be used for testing and simulating players.
     """
 
-    def __init__(self, server_url: str = "http://localhost:8000", player_name: str = "Player"):
+    # One console for all clients; rich's setup is paid once, not per player
+    console: ClassVar[Console] = Console()
+
+    def __init__(self, server_url: str = "http://localhost:8000", player_name: str = "Player",
+                 verbose: bool = True):
         self.server_url = server_url
         self.player_name = player_name
-        self.sio = socketio.Client()
-        self.console = Console()
+        self.verbose = verbose
+        self.sio = socketio.Client(json=OrjsonCodec if orjson is not None else None)
 
         # Game state
         self.connected = False
@@ -110,13 +176,26 @@ class TarokkClient:
         self.player_position: Optional[int] = None
         self.game_state: Dict[str, Any] = {}
         self.room_state: Dict[str, Any] = {}
+        self._players_by_position: Dict[int, Dict[str, Any]] = {}
+
+        # Derived from our hand, refreshed only when the hand changes
+        self._hand: List[Dict[str, Any]] = []
+        self._sorted_hand: List[Dict[str, Any]] = []
+        self.has_honour = False
+        self.discardable: List[Dict[str, Any]] = []  # No kings or honours, lowest points first
+        self.hand_by_id: Dict[str, Dict[str, Any]] = {}
 
         # Reconnection state
         self.was_ready: bool = False
         self.saved_room_id: Optional[str] = None
 
-        # Event handlers
-        self.event_handlers: Dict[str, list[Callable]] = {}
+        # Event handlers, as (handler, once) pairs
+        self.event_handlers: Dict[str, list[Tuple[Callable, bool]]] = {}
+
+        # Events received so far, for wait_for()
+        self._event_counts: Dict[str, int] = {}
+        self._last_event_data: Dict[str, Any] = {}
+        self._event_condition = threading.Condition()
 
         # Setup default event handlers
         self._setup_handlers()
@@ -128,11 +207,13 @@ class TarokkClient:
         def connect(*args):
             self.connected = True
             self.log(f"[green]✓ Connected as {self.player_name}[/green]")
+            self._trigger_handlers("connect", None)
 
         @self.sio.event
         def disconnect(*args):
             self.connected = False
             self.log(f"[red]✗ Disconnected[/red]")
+            self._trigger_handlers("disconnect", None)
 
         @self.sio.event
         def room_state(data):
@@ -141,16 +222,26 @@ class TarokkClient:
             self.saved_room_id = self.room_id  # Save for reconnection
 
             # Find our position
-            for player in data.get("players", []):
-                if player.get("name") == self.player_name:
-                    self.player_position = player.get("position")
-                    self.was_ready = player.get("is_ready", False)
+            by_name = {p.get("name"): p for p in data.get("players", [])}
+            me = by_name.get(self.player_name)
+            if me:
+                self.player_position = me.get("position")
+                self.was_ready = me.get("is_ready", False)
 
             self._trigger_handlers("room_state", data)
 
         @self.sio.event
         def game_state(data):
+            if isinstance(data, bytes):
+                data = msgpack.unpackb(data, strict_map_key=False)
+            if data == self.game_state:
+                # Same state as last time; nothing for handlers or waiters to do
+                return
             self.game_state = data
+            self._players_by_position = {p.get("position"): p for p in data.get("players", [])}
+            hand = self.get_hand()
+            if hand != self._hand:
+                self._on_hand_changed(hand)
             self._trigger_handlers("game_state", data)
 
         @self.sio.event
@@ -246,29 +337,52 @@ class TarokkClient:
             self.log(f"[bold red]❌ Error: {msg}[/bold red]")
             self._trigger_handlers("error", data)
 
-    def on(self, event: str, handler: Callable):
-        """Register a custom event handler."""
-        if event not in self.event_handlers:
-            self.event_handlers[event] = []
-        self.event_handlers[event].append(handler)
+    def _on_hand_changed(self, hand: List[Dict[str, Any]]):
+        """Recompute the hand-derived attributes."""
+        self._hand = hand
+        self._sorted_hand = sort_hand(hand)
+        self.has_honour = "honour" in {c.get("card_type") for c in hand}
+        self.discardable = sorted(
+            (c for c in hand if c.get("card_type") not in _NON_DISCARDABLE),
+            key=lambda c: c.get("points", 0)
+        )
+        self.hand_by_id = {c["id"]: c for c in hand}
+
+    def on(self, event: str, handler: Callable, once: bool = False):
+        """Register a custom event handler (removed after one call if once)."""
+        with self._event_condition:
+            self.event_handlers.setdefault(event, []).append((handler, once))
 
     def _trigger_handlers(self, event: str, data: Any):
         """Trigger all handlers for an event."""
-        if event in self.event_handlers:
-            for handler in self.event_handlers[event]:
-                try:
-                    handler(data)
-                except Exception as e:
-                    self.log(f"[red]Handler error: {e}[/red]")
+        with self._event_condition:
+            self._event_counts[event] = self._event_counts.get(event, 0) + 1
+            self._last_event_data[event] = data
+            self._event_condition.notify_all()
+
+            handlers = self.event_handlers.get(event)
+            if not handlers:
+                return
+            # Drop once-handlers before calling them, so they fire only once
+            if any(once for _, once in handlers):
+                self.event_handlers[event] = [(h, once) for h, once in handlers if not once]
+
+        for handler, _ in handlers:
+            try:
+                handler(data)
+            except Exception as e:
+                self.log(f"[red]Handler error: {e}[/red]")
 
     def log(self, message: str):
-        """Log a message with player name prefix."""
+        """Log a message with player name prefix (only when verbose)."""
+        if not self.verbose:
+            return
         self.console.print(f"[{self.player_name}] {message}")
 
     def connect(self):
         """Connect to the server."""
         try:
-            self.sio.connect(self.server_url)
+            self.sio.connect(self.server_url, headers=CONNECT_HEADERS, transports=TRANSPORTS)
             return True
         except Exception as e:
             self.log(f"[red]Connection failed: {e}[/red]")
@@ -285,7 +399,8 @@ class TarokkClient:
 
         Args:
             max_retries: Maximum number of reconnection attempts
-            retry_delay: Delay between retry attempts in seconds
+            retry_delay: Delay after the first failed attempt in seconds;
+                doubles after each further failure (at most 30s)
 
         Returns:
             True if reconnection successful, False otherwise
@@ -305,16 +420,15 @@ class TarokkClient:
 
             try:
                 # Reconnect to server
-                self.sio.connect(self.server_url)
-                time.sleep(1)  # Wait for connection to stabilize
+                connects = self.event_count("connect")
+                self.sio.connect(self.server_url, headers=CONNECT_HEADERS, transports=TRANSPORTS)
 
-                if self.connected:
+                if self.wait_for("connect", timeout=2.0, after=connects) and self.connected:
                     self.log("[green]✓ Reconnected to server[/green]")
 
                     # Rejoin the same room
                     self.log(f"[cyan]Rejoining room {self.saved_room_id}...[/cyan]")
-                    self.join_room(self.saved_room_id)
-                    time.sleep(1)  # Wait for room_state response
+                    wait([self.join_room(self.saved_room_id)], timeout=2.0)
 
                     if self.room_id == self.saved_room_id:
                         self.log(f"[green]✓ Successfully rejoined room {self.room_id}[/green]")
@@ -322,23 +436,25 @@ class TarokkClient:
                         # If we were ready before, mark as ready again
                         if self.was_ready:
                             self.log("[cyan]Marking as ready...[/cyan]")
-                            self.ready()
-                            time.sleep(0.5)
+                            acked = threading.Event()
+                            self.ready(callback=lambda *args: acked.set())
+                            acked.wait(timeout=2.0)
 
                         return True
                     else:
                         self.log("[yellow]⚠ Room ID mismatch, retrying...[/yellow]")
                         self.disconnect()
-                        time.sleep(retry_delay)
                 else:
                     self.log("[yellow]⚠ Connection failed, retrying...[/yellow]")
-                    time.sleep(retry_delay)
 
             except Exception as e:
                 self.log(f"[red]Reconnection attempt {attempt} failed: {e}[/red]")
-                if attempt < max_retries:
-                    self.log(f"[cyan]Waiting {retry_delay}s before retry...[/cyan]")
-                    time.sleep(retry_delay)
+
+            # Back off only after a failure, and longer each time
+            if attempt < max_retries:
+                delay = min(retry_delay * 2 ** (attempt - 1), 30.0)
+                self.log(f"[cyan]Waiting {delay}s before retry...[/cyan]")
+                time.sleep(delay)
 
         self.log("[red]✗ Failed to reconnect after all attempts[/red]")
         return False
@@ -375,17 +491,38 @@ class TarokkClient:
 
         return success
 
-    def join_room(self, room_id: Optional[str] = None):
-        """Join or create a room."""
+    def join_room(self, room_id: Optional[str] = None, callback: Optional[Callable] = None) -> Future:
+        """
+        Join or create a room.
+
+        Returns a Future that is resolved when the server acknowledges the
+        request: with the room_state that seated this player, or with a
+        RuntimeError if the server rejected the join. callback, if given,
+        is called once the server has handled the request.
+        """
+        future: Future = Future()
+        seen = self.event_count("room_state")
+
+        def ack(*args):
+            # The server sends room_state before acking, so it has already been handled
+            players = {p.get("name") for p in self.room_state.get("players", [])}
+            if (self.event_count("room_state") > seen and self.player_name in players
+                    and (room_id is None or self.room_id == room_id)):
+                future.set_result(self.room_state)
+            else:
+                future.set_exception(RuntimeError(f"Join of room {room_id} was rejected"))
+            if callback:
+                callback(*args)
+
         self.sio.emit("join_room", {
             "room_id": room_id,
             "player_name": self.player_name
-        })
-        time.sleep(0.5)  # Wait for room_state response
+        }, callback=ack)
+        return future
 
-    def ready(self):
-        """Mark player as ready."""
-        self.sio.emit("ready", {})
+    def ready(self, callback: Optional[Callable] = None):
+        """Mark player as ready (callback: see join_room)."""
+        self.sio.emit("ready", {}, callback=callback)
 
     def place_bid(self, bid_type: str):
         """Place a bid."""
@@ -416,10 +553,9 @@ class TarokkClient:
 
     def get_hand(self) -> list[Dict[str, Any]]:
         """Get current hand cards."""
-        # Hand is in players array, find our position
-        players = self.game_state.get("players", [])
-        if self.player_position is not None and self.player_position < len(players):
-            return players[self.player_position].get("hand", [])
+        me = self._players_by_position.get(self.player_position)
+        if me:
+            return me.get("hand", [])
         return []
 
     def get_valid_bids(self) -> list[str]:
@@ -433,34 +569,31 @@ class TarokkClient:
         return []
 
     def print_hand(self):
-        """Print current hand in a nice format."""
+        """Print current hand in a nice format (only when verbose)."""
+        if not self.verbose:
+            return
+
         hand = self.get_hand()
         if not hand:
             self.console.print("[yellow]No cards in hand[/yellow]")
             return
 
-        # Sort hand before displaying
-        sorted_hand = sort_hand(hand)
-
-        table = Table(title=f"{self.player_name}'s Hand")
-        table.add_column("#", style="cyan")
-        table.add_column("Card", style="magenta")
-        table.add_column("Points", style="green")
-        table.add_column("ID", style="dim")
-
-        for i, card in enumerate(sorted_hand):
-            card_str = f"{card.get('rank')} of {card.get('suit')}"
-            table.add_row(
-                str(i),
-                card_str,
-                str(card.get('points', 0)),
-                card.get('id', '')[:8]
-            )
+        # Sorted once per hand change, not per display
+        sorted_hand = self._sorted_hand if hand is self._hand else sort_hand(hand)
 
-        self.console.print(table)
+        # One pre-formatted block instead of a rich Table built row by row
+        rows = "\n".join(
+            f"[cyan]{i:2d}[/cyan] [magenta]{card.get('rank'):>5} of {card.get('suit'):<8}[/magenta] "
+            f"[green]{card.get('points', 0):>2}[/green] [dim]{card.get('id', '')[:8]}[/dim]"
+            for i, card in enumerate(sorted_hand)
+        )
+        self.console.print(f"[bold]{self.player_name}'s Hand[/bold]\n{rows}")
 
     def print_game_state(self):
-        """Print current game state."""
+        """Print current game state (only when verbose)."""
+        if not self.verbose:
+            return
+
         if not self.game_state:
             self.console.print("[yellow]No game state available[/yellow]")
             return
@@ -477,12 +610,39 @@ class TarokkClient:
         panel = Panel(panel_content, title="Game State", border_style="blue")
         self.console.print(panel)
 
-    def wait_for_event(self, event: str, timeout: float = 10.0) -> bool:
-        """Wait for a specific event to occur."""
-        event_occurred = threading.Event()
+    def event_count(self, event: str) -> int:
+        """Number of times an event has been received."""
+        with self._event_condition:
+            return self._event_counts.get(event, 0)
+
+    def wait_for(self, event: str, timeout: float = 10.0,
+                 predicate: Optional[Callable[[Any], bool]] = None,
+                 after: int = 0) -> bool:
+        """
+        Wait until an event has been received.
+
+        Returns as soon as the event has arrived more than `after` times and
+        its latest data satisfies predicate, so an event that came in before
+        the call is not missed. Pass after=event_count(event), taken before
+        sending a request, to wait for the response to that request.
 
-        def handler(data):
-            event_occurred.set()
+        Args:
+            event: Event name
+            timeout: Maximum time to wait in seconds
+            predicate: Optional check on the event data
+            after: Number of earlier occurrences to ignore
+
+        Returns:
+            True if the event arrived, False on timeout
+        """
+        def ready():
+            if self._event_counts.get(event, 0) <= after:
+                return False
+            return predicate is None or bool(predicate(self._last_event_data.get(event)))
+
+        with self._event_condition:
+            return self._event_condition.wait_for(ready, timeout)
 
-        self.on(event, handler)
-        return event_occurred.wait(timeout)
+    def wait_for_event(self, event: str, timeout: float = 10.0) -> bool:
+        """Wait for the next occurrence of an event."""
+        return self.wait_for(event, timeout, after=self.event_count(event))
@@ -7,96 +7,72 @@ Allows you to control 4 different players and test the game flow.
 
 import sys
 import time
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Tuple
 from rich.console import Console
 from rich.prompt import Prompt, Confirm
 from rich.table import Table
 from rich.panel import Panel
 from rich.layout import Layout
 from rich.live import Live
-from client import TarokkClient
+from client import TarokkClient, sort_hand
 
 
-def roman_to_int(roman: str) -> int:
-    """Convert Roman numeral to integer."""
-    roman_values = {
-        'I': 1, 'V': 5, 'X': 10, 'L': 50, 'C': 100
-    }
-    result = 0
-    prev_value = 0
+# How long to wait for the server to answer an action
+RESPONSE_TIMEOUT = 1.0
+
+# Columns of every card table: header and column options
+_CARD_COLUMNS = (
+    ("#", {"style": "cyan", "width": 4}),
+    ("Card", {"style": "white", "width": 25}),
+    ("Type", {"style": "yellow", "width": 10}),
+    ("Points", {"style": "green", "width": 8}),
+)
+
+# Display cells (card, type, points) per card, filled in as cards are seen
+_CARD_DISPLAY_CACHE: Dict[Tuple[str, str, str, int], Tuple[str, str, str]] = {}
+
+
+def _format_card(card: Dict) -> Tuple[str, str]:
+    """Card name and colour-coded type of a card."""
+    suit = card.get('suit', 'unknown')
+    rank = card.get('rank', '?')
+    card_type = card.get('card_type', 'suit')
+
+    if suit == 'tarokk':
+        card_display = f"Tarokk {rank}"
+    else:
+        card_display = f"{rank} of {suit}"
+
+    type_display = card_type.capitalize()
+    if card_type == 'honour':
+        type_display = f"[bold red]{type_display}[/bold red]"
+    elif card_type == 'king':
+        type_display = f"[bold blue]{type_display}[/bold blue]"
+
+    return card_display, type_display
+
+
+def _card_display(card: Dict) -> Tuple[str, str, str]:
+    """Card, type and points cells for a card."""
+    k = (card.get('suit', 'unknown'), card.get('rank', '?'), card.get('card_type', 'suit'), card.get('points', 0))
+    cells = _CARD_DISPLAY_CACHE.get(k)
+    if cells is None:
+        cells = _CARD_DISPLAY_CACHE[k] = (*_format_card(card), str(k[3]))
+    return cells
 
-    for char in reversed(roman.upper()):
-        value = roman_values.get(char, 0)
-        if value < prev_value:
-            result -= value
-        else:
-            result += value
-        prev_value = value
-
-    return result
-
-
-def get_tarokk_sort_key(rank: str) -> int:
-    """Get sort key for tarokk cards (higher is better, so XXII=22, I=1)."""
-    # Handle special names
-    if rank.lower() == 'skíz':
-        return 22
-    if rank.lower() == 'pagát':
-        return 1
-
-    # Handle Roman numerals
-    try:
-        return roman_to_int(rank)
-    except:
-        return 0
-
-
-def get_suit_rank_value(rank: str) -> int:
-    """Get numeric value for suit card rank (higher is better)."""
-    rank_values = {
-        'K': 5,  # King
-        'Q': 4,  # Queen
-        'C': 3,  # Cavalier
-        'J': 2,  # Jack
-        '10': 1
-    }
-    return rank_values.get(rank, 0)
-
-
-def get_suit_order(suit: str) -> int:
-    """Get sort order for suits."""
-    suit_order = {
-        'hearts': 1,
-        'diamonds': 2,
-        'spades': 3,
-        'clubs': 4
-    }
-    return suit_order.get(suit.lower(), 99)
-
-
-def sort_hand(hand: List[Dict]) -> List[Dict]:
-    """
-    Sort hand with tarokk cards first (descending), then suit cards by suit (descending within suit).
-
-    Args:
-        hand: List of card dictionaries
-
-    Returns:
-        Sorted list of cards
-    """
-    def card_sort_key(card):
-        suit = card.get('suit', '').lower()
-        rank = card.get('rank', '')
-
-        if suit == 'tarokk':
-            # Tarokk cards come first, sorted in descending order (XXII to I)
-            # Negate to reverse order (higher roman numeral first)
-            return (0, -get_tarokk_sort_key(rank))
-        else:
-            # Suit cards come second, grouped by suit, then by rank descending
-            return (1, get_suit_order(suit), -get_suit_rank_value(rank))
 
-    return sorted(hand, key=card_sort_key)
+def _render_card_table(title: Optional[str], cards: List[Dict]) -> Table:
+    """Build a numbered table of cards."""
+    table = Table(show_header=True, header_style="bold magenta", title=title)
+    for header, options in _CARD_COLUMNS:
+        table.add_column(header, **options)
+
+    rows = [(str(idx), *_card_display(card)) for idx, card in enumerate(cards)]
+    for row in rows:
+        table.add_row(*row)
+
+    return table
 
 
 class MultiPlayerTest:
@@ -117,45 +93,49 @@ class MultiPlayerTest:
         self.console.print("[bold cyan]Setting up 4 players...[/bold cyan]")
 
         player_names = ["Alice", "Bob", "Charlie", "Diana"]
+        clients = [TarokkClient(self.server_url, name) for name in player_names]
 
-        for i, name in enumerate(player_names):
-            client = TarokkClient(self.server_url, name)
+        # Store your_turn data by seat
+        def make_handler(client):
+            def handler(data):
+                self.your_turn_data[client.player_position] = data
+            return handler
 
-            # Store your_turn data
-            def make_handler(player_num):
-                def handler(data):
-                    self.your_turn_data[player_num] = data
-                return handler
+        for client in clients:
+            client.on("your_turn", make_handler(client))
 
-            client.on("your_turn", make_handler(i))
+        # Connect all players at once; connect() returns after the handshake
+        with ThreadPoolExecutor(max_workers=len(clients)) as executor:
+            connected = list(executor.map(TarokkClient.connect, clients))
 
-            if client.connect():
+        for i, (client, ok) in enumerate(zip(clients, connected)):
+            if ok:
                 self.clients[i] = client
-                self.console.print(f"[green]✓ {name} connected[/green]")
+                self.console.print(f"[green]✓ {client.player_name} connected[/green]")
             else:
-                self.console.print(f"[red]✗ {name} failed to connect[/red]")
-                return False
+                self.console.print(f"[red]✗ {client.player_name} failed to connect[/red]")
 
-        time.sleep(1)
-        return True
+        return all(connected)
 
     def create_room(self):
         """Create a room with first player and have others join."""
         self.console.print("\n[bold cyan]Creating game room...[/bold cyan]")
 
         # Player 0 creates room
-        self.clients[0].join_room()
-        time.sleep(1)
+        wait([self.clients[0].join_room()], timeout=2.0)
 
         self.room_id = self.clients[0].room_id
         self.console.print(f"[green]Room created: {self.room_id}[/green]")
 
-        # Other players join
-        for i in range(1, 4):
-            self.clients[i].join_room(self.room_id)
-            time.sleep(0.5)
+        # Other players join at once
+        wait([self.clients[i].join_room(self.room_id) for i in range(1, 4)], timeout=2.0)
+
+        # Seats follow the order the joins reached the server; everything
+        # else looks players up by seat
+        positions = [c.player_position for c in self.clients.values()]
+        if None not in positions:
+            self.clients = {c.player_position: c for c in self.clients.values()}
 
-        time.sleep(1)
         self.console.print("[green]✓ All players joined room[/green]")
 
     def mark_all_ready(self):
@@ -164,10 +144,9 @@ class MultiPlayerTest:
 
         for i in range(4):
             self.clients[i].ready()
-            time.sleep(0.3)
 
         self.console.print("[yellow]Waiting for game to start and cards to be dealt...[/yellow]")
-        time.sleep(3)
+        self._wait_for_hands(3.0)
 
         # Check if hands were dealt
         hands_dealt = sum(1 for i in range(4) if len(self.clients[i].get_hand()) > 0)
@@ -175,7 +154,20 @@ class MultiPlayerTest:
             self.console.print(f"[green]✓ Game started! {hands_dealt}/4 players have cards[/green]")
         else:
             self.console.print("[yellow]⚠ Game started but no hands received yet. Wait a moment...[/yellow]")
-            time.sleep(2)
+            self._wait_for_hands(2.0)
+
+    def _wait_for_hands(self, timeout: float):
+        """Wait until every player's game_state includes their dealt hand, or timeout."""
+        deadline = time.monotonic() + timeout
+        for client in self.clients.values():
+            client.wait_for(
+                "game_state", max(deadline - time.monotonic(), 0.0),
+                predicate=lambda d: any(p.get("hand") for p in d.get("players", []))
+            )
+
+    def _wait_for_update(self, client: TarokkClient, seen: int, timeout: float = RESPONSE_TIMEOUT):
+        """Wait (at most timeout) for a game_state newer than the client's first `seen` ones."""
+        client.wait_for("game_state", timeout, after=seen)
 
     def show_menu(self):
         """Show main menu."""
@@ -209,43 +201,7 @@ class MultiPlayerTest:
 
             if hand and len(hand) > 0:
                 # Sort hand before displaying
-                sorted_hand = sort_hand(hand)
-
-                # Display hand as a table
-                from rich.table import Table
-                table = Table(show_header=True, header_style="bold magenta")
-                table.add_column("#", style="cyan", width=4)
-                table.add_column("Card", style="white", width=25)
-                table.add_column("Type", style="yellow", width=10)
-                table.add_column("Points", style="green", width=8)
-
-                for idx, card in enumerate(sorted_hand):
-                    suit = card.get('suit', 'unknown')
-                    rank = card.get('rank', '?')
-                    card_type = card.get('card_type', 'suit')
-                    points = card.get('points', 0)
-
-                    # Format card display
-                    if suit == 'tarokk':
-                        card_display = f"Tarokk {rank}"
-                    else:
-                        card_display = f"{rank} of {suit}"
-
-                    # Color code by type
-                    type_display = card_type.capitalize()
-                    if card_type == 'honour':
-                        type_display = f"[bold red]{type_display}[/bold red]"
-                    elif card_type == 'king':
-                        type_display = f"[bold blue]{type_display}[/bold blue]"
-
-                    table.add_row(
-                        str(idx),
-                        card_display,
-                        type_display,
-                        str(points)
-                    )
-
-                self.console.print(table)
+                self.console.print(_render_card_table(None, sort_hand(hand)))
             else:
                 # Check if game has started
                 phase = client.game_state.get("phase", "unknown")
@@ -337,39 +293,7 @@ class MultiPlayerTest:
         self.console.print(f"[cyan]Total cards in talon: {len(talon)}[/cyan]\n")
 
         # Display talon as a table
-        table = Table(show_header=True, header_style="bold magenta", title="Talon Cards")
-        table.add_column("#", style="cyan", width=4)
-        table.add_column("Card", style="white", width=25)
-        table.add_column("Type", style="yellow", width=10)
-        table.add_column("Points", style="green", width=8)
-
-        for idx, card in enumerate(talon):
-            suit = card.get('suit', 'unknown')
-            rank = card.get('rank', '?')
-            card_type = card.get('card_type', 'suit')
-            points = card.get('points', 0)
-
-            # Format card display
-            if suit == 'tarokk':
-                card_display = f"Tarokk {rank}"
-            else:
-                card_display = f"{rank} of {suit}"
-
-            # Color code by type
-            type_display = card_type.capitalize()
-            if card_type == 'honour':
-                type_display = f"[bold red]{type_display}[/bold red]"
-            elif card_type == 'king':
-                type_display = f"[bold blue]{type_display}[/bold blue]"
-
-            table.add_row(
-                str(idx),
-                card_display,
-                type_display,
-                str(points)
-            )
-
-        self.console.print(table)
+        self.console.print(_render_card_table("Talon Cards", talon))
 
         # Show total points in talon
         total_points = sum(card.get('points', 0) for card in talon)
@@ -462,9 +386,10 @@ class MultiPlayerTest:
             choices=valid_bids
         )
 
+        seen = client.event_count("game_state")
         client.place_bid(bid)
         self.console.print(f"[green]✓ Placed bid: {bid}[/green]")
-        time.sleep(1)
+        self._wait_for_update(client, seen)
 
     def discard_cards_interactive(self):
         """Discard cards for current player."""
@@ -503,9 +428,10 @@ class MultiPlayerTest:
         # Get card IDs from sorted hand (indices match displayed order)
         card_ids = [sorted_hand[i]["id"] for i in indices if i < len(sorted_hand)]
 
+        seen = client.event_count("game_state")
         client.discard_cards(card_ids)
         self.console.print(f"[green]✓ Discarded {len(card_ids)} cards[/green]")
-        time.sleep(1)
+        self._wait_for_update(client, seen)
 
     def call_partner_interactive(self):
         """Call partner for current player."""
@@ -514,9 +440,10 @@ class MultiPlayerTest:
         self.console.print("\n[cyan]Common tarokks: XX, XIX, XVIII, XVII...[/cyan]")
         tarokk = Prompt.ask("Call which tarokk?", default="XX")
 
+        seen = client.event_count("game_state")
         client.call_partner(tarokk)
         self.console.print(f"[green]✓ Called partner: {tarokk}[/green]")
-        time.sleep(1)
+        self._wait_for_update(client, seen)
 
     def make_announcement_interactive(self):
         """Make an announcement for current player."""
@@ -547,17 +474,19 @@ class MultiPlayerTest:
         )
         announced = (announced_choice == "announced")
 
+        seen = client.event_count("game_state")
         client.make_announcement(announcement_type, announced)
         status = "announced" if announced else "silent"
         self.console.print(f"[green]✓ Made announcement: {announcement_type} ({status})[/green]")
-        time.sleep(1)
+        self._wait_for_update(client, seen)
 
     def pass_announcement_interactive(self):
         """Pass on announcements for current player."""
         client = self.clients[self.current_player]
+        seen = client.event_count("game_state")
         client.pass_announcement()
         self.console.print(f"[green]✓ Passed on announcements[/green]")
-        time.sleep(1)
+        self._wait_for_update(client, seen)
 
     def play_card_interactive(self):
         """Play a card for current player."""
@@ -576,7 +505,7 @@ class MultiPlayerTest:
 
         # Get valid cards if available
         turn_data = self.your_turn_data.get(self.current_player, {})
-        valid_card_ids = turn_data.get("valid_cards", [])
+        valid_card_ids = set(turn_data.get("valid_cards", []))
 
         if valid_card_ids:
             # Calculate valid indices from sorted hand
@@ -592,13 +521,15 @@ class MultiPlayerTest:
 
         # Get card ID from sorted hand (index matches displayed order)
         card_id = sorted_hand[card_num]["id"]
+        seen = client.event_count("game_state")
         client.play_card(card_id)
         self.console.print(f"[green]✓ Played card[/green]")
-        time.sleep(1)
+        self._wait_for_update(client, seen)
 
     def auto_play_turn(self):
         """Automatically play the current turn."""
         client = self.clients[self.current_player]
+        seen = client.event_count("game_state")
         gs = client.game_state
         phase = gs.get("phase")
 
@@ -619,10 +550,9 @@ class MultiPlayerTest:
             hand = client.get_hand()
             num_to_discard = len(hand) - 9
             if num_to_discard > 0:
-                # Discard lowest point cards that can be discarded
-                discardable = [c for c in hand if c.get("card_type") not in ["king", "honour"]]
-                discardable.sort(key=lambda x: x.get("points", 0))
-                to_discard = discardable[:num_to_discard]
+                # Discard lowest point cards that can be discarded; the client
+                # keeps these sorted whenever its hand changes
+                to_discard = client.discardable[:num_to_discard]
                 card_ids = [c["id"] for c in to_discard]
                 client.discard_cards(card_ids)
                 self.console.print(f"[green]Auto-discard: {len(card_ids)} cards[/green]")
@@ -644,17 +574,17 @@ class MultiPlayerTest:
                 self.console.print("[green]Auto-pass announcements[/green]")
 
         elif phase == "playing":
-            valid_cards = turn_data.get("valid_cards", [])
+            valid_cards = set(turn_data.get("valid_cards", []))
             hand = client.get_hand()
             if valid_cards and hand:
                 # Play first valid card
                 for card in hand:
                     if card["id"] in valid_cards:
                         client.play_card(card["id"])
-                        self.console.print(f"[green]Auto-play: {card['rank']} of {card['suit']}[/green]")
+                        self.console.print(f"[green]Auto-play: {_format_card(card)[0]}[/green]")
                         break
 
-        time.sleep(1)
+        self._wait_for_update(client, seen)
 
     def view_current_options(self):
         """View current player's available options."""
@@ -677,7 +607,7 @@ class MultiPlayerTest:
             self.console.print(f"[cyan]Valid announcements: {', '.join(turn_data['valid_announcements'])}[/cyan]")
 
         if "valid_cards" in turn_data:
-            valid_card_ids = turn_data['valid_cards']
+            valid_card_ids = set(turn_data['valid_cards'])
             hand = client.get_hand()
             sorted_hand = sort_hand(hand)
             valid_cards_info = [
@@ -708,12 +638,13 @@ class MultiPlayerTest:
             duration = 3.0
 
         # Simulate disconnect and reconnect
+        seen = client.event_count("game_state")
         success = client.simulate_disconnect_and_reconnect(disconnect_duration=duration)
 
         if success:
             self.console.print(f"[bold green]✓ {client.player_name} successfully recovered![/bold green]")
             # Give time for game state to sync
-            time.sleep(2)
+            self._wait_for_update(client, seen, timeout=2.0)
         else:
             self.console.print(f"[bold red]✗ {client.player_name} failed to recover[/bold red]")
 